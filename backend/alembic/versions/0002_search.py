@@ -0,0 +1,53 @@
+"""full-text search vectors for cards and messages"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0002_search"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+CARD_SEARCH_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+MESSAGE_SEARCH_EXPRESSION = "to_tsvector('simple', content)"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cards",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(CARD_SEARCH_EXPRESSION, persisted=True),
+        ),
+    )
+    op.create_index(
+        "idx_cards_search", "cards", ["search_vector"], unique=False, postgresql_using="gin"
+    )
+
+    op.add_column(
+        "messages",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(MESSAGE_SEARCH_EXPRESSION, persisted=True),
+        ),
+    )
+    op.create_index(
+        "idx_messages_search", "messages", ["search_vector"], unique=False, postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_messages_search", table_name="messages")
+    op.drop_column("messages", "search_vector")
+    op.drop_index("idx_cards_search", table_name="cards")
+    op.drop_column("cards", "search_vector")
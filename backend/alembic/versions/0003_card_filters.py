@@ -0,0 +1,52 @@
+"""indexes for server-side card filtering"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_card_filters"
+down_revision = "0002_search"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_cards_labels",
+        "cards",
+        ["labels"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"labels": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "idx_cards_assignees",
+        "cards",
+        ["assignees"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"assignees": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "idx_cards_project_due",
+        "cards",
+        ["project_id", "due_date"],
+        unique=False,
+        postgresql_where=sa.text("due_date IS NOT NULL"),
+    )
+    op.create_index(
+        "idx_cards_project_priority",
+        "cards",
+        ["project_id", "priority"],
+        unique=False,
+        postgresql_where=sa.text("priority IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_cards_project_priority", table_name="cards")
+    op.drop_index("idx_cards_project_due", table_name="cards")
+    op.drop_index("idx_cards_assignees", table_name="cards")
+    op.drop_index("idx_cards_labels", table_name="cards")
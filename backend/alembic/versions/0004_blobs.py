@@ -0,0 +1,69 @@
+"""content-addressed blob storage for uploads"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_blobs"
+down_revision = "0003_card_filters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "blobs",
+        sa.Column("digest", sa.String(length=64), primary_key=True),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("refcount", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+    )
+    op.add_column(
+        "files",
+        sa.Column(
+            "blob_digest",
+            sa.String(length=64),
+            sa.ForeignKey("blobs.digest", ondelete="RESTRICT"),
+            nullable=True,
+        ),
+    )
+    op.add_column("files", sa.Column("name", sa.String(length=255), nullable=True))
+    op.create_index("idx_files_blob", "files", ["blob_digest"], unique=False)
+
+    op.execute(
+        """
+        CREATE FUNCTION files_blob_refcount() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.blob_digest IS NOT NULL THEN
+                UPDATE blobs SET refcount = refcount + 1 WHERE digest = NEW.blob_digest;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') AND OLD.blob_digest IS NOT NULL THEN
+                UPDATE blobs SET refcount = refcount - 1 WHERE digest = OLD.blob_digest;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER files_blob_refcount
+        AFTER INSERT OR DELETE OR UPDATE OF blob_digest ON files
+        FOR EACH ROW EXECUTE FUNCTION files_blob_refcount()
+        """
+    )
+    op.execute("CREATE INDEX idx_blobs_unreferenced ON blobs (created_at) WHERE refcount <= 0")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_blobs_unreferenced")
+    op.execute("DROP TRIGGER IF EXISTS files_blob_refcount ON files")
+    op.execute("DROP FUNCTION IF EXISTS files_blob_refcount()")
+    op.drop_index("idx_files_blob", table_name="files")
+    op.drop_column("files", "name")
+    op.drop_column("files", "blob_digest")
+    op.drop_table("blobs")
@@ -0,0 +1,52 @@
+"""resumable upload sessions and 64-bit file sizes"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0005_upload_sessions"
+down_revision = "0004_blobs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "files", "size", type_=sa.BigInteger(), existing_type=sa.Integer(), existing_nullable=False
+    )
+
+    op.create_table(
+        "upload_sessions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "project_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+        ),
+        sa.Column(
+            "user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE")
+        ),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("mime", sa.String(length=120), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=True),
+        sa.Column("received", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+    )
+    op.create_index("idx_upload_sessions_updated", "upload_sessions", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_upload_sessions_updated", table_name="upload_sessions")
+    op.drop_table("upload_sessions")
+    op.alter_column(
+        "files", "size", type_=sa.Integer(), existing_type=sa.BigInteger(), existing_nullable=False
+    )
@@ -0,0 +1,75 @@
+"""file listing index and incrementally maintained project file stats"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0007_file_listing"
+down_revision = "0006_thumbnails"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_files_project_created", "files", ["project_id", "created_at", "id"], unique=False
+    )
+
+    op.create_table(
+        "project_stats",
+        sa.Column(
+            "project_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("file_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("file_bytes", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION files_project_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE project_stats
+                SET file_count = file_count - 1, file_bytes = file_bytes - OLD.size
+                WHERE project_id = OLD.project_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO project_stats (project_id, file_count, file_bytes)
+                VALUES (NEW.project_id, 1, NEW.size)
+                ON CONFLICT (project_id) DO UPDATE
+                SET file_count = project_stats.file_count + 1,
+                    file_bytes = project_stats.file_bytes + EXCLUDED.file_bytes;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER files_project_stats
+        AFTER INSERT OR DELETE OR UPDATE OF project_id, size ON files
+        FOR EACH ROW EXECUTE FUNCTION files_project_stats()
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO project_stats (project_id, file_count, file_bytes)
+        SELECT project_id, count(*), coalesce(sum(size), 0)
+        FROM files
+        GROUP BY project_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS files_project_stats ON files")
+    op.execute("DROP FUNCTION IF EXISTS files_project_stats()")
+    op.drop_table("project_stats")
+    op.drop_index("idx_files_project_created", table_name="files")
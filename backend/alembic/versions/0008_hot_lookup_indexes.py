@@ -0,0 +1,36 @@
+"""indexes for permission checks, board/column lookups and the audit log"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0008_hot_lookup_indexes"
+down_revision = "0007_file_listing"
+branch_labels = None
+depends_on = None
+
+# files(project_id) is already served by idx_files_project_created (0007), whose leading
+# column is project_id.
+INDEXES = (
+    ("idx_members_user", "members", ["user_id", "project_id"]),
+    ("idx_boards_project", "boards", ["project_id"]),
+    ("idx_columns_board_order", "columns", ["board_id", "order"]),
+    ("idx_events_audit_project_created", "events_audit", ["project_id", "created_at"]),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build; it cannot run
+    # inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
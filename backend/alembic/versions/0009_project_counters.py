@@ -0,0 +1,279 @@
+"""card, member and message counters in project_stats and per-member read marks"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0009_project_counters"
+down_revision = "0008_hot_lookup_indexes"
+branch_labels = None
+depends_on = None
+
+COUNTERS = ("card_count", "open_card_count", "member_count", "message_count")
+
+
+def upgrade() -> None:
+    for name in COUNTERS:
+        op.add_column(
+            "project_stats", sa.Column(name, sa.BigInteger(), nullable=False, server_default="0")
+        )
+    op.add_column(
+        "members",
+        sa.Column("read_message_count", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+    # A card is open until it reaches the last column of its board ("Done" by default).
+    # NULL for a deleted column: cards removed with their column are left out of the open
+    # decrement, because the column trigger recounts that project anyway.
+    op.execute(
+        """
+        CREATE FUNCTION column_is_done(column_id uuid) RETURNS boolean AS $$
+            SELECT NOT EXISTS (
+                SELECT 1 FROM columns later
+                WHERE later.board_id = c.board_id AND later."order" > c."order"
+            )
+            FROM columns c
+            WHERE c.id = column_id
+        $$ LANGUAGE sql STABLE
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION refresh_open_cards(project uuid) RETURNS void AS $$
+            UPDATE project_stats
+            SET open_card_count = (
+                SELECT count(*) FROM cards
+                WHERE cards.project_id = project AND NOT column_is_done(cards.column_id)
+            )
+            WHERE project_id = project
+        $$ LANGUAGE sql
+        """
+    )
+    # Card and message counters are maintained per statement from the transition tables,
+    # so a bulk import or archive touches each project's stats row once, not once per row.
+    op.execute(
+        """
+        CREATE FUNCTION cards_project_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO project_stats (project_id, card_count, open_card_count)
+                SELECT project_id, count(*), count(*) FILTER (WHERE NOT column_is_done(column_id))
+                FROM new_cards
+                GROUP BY project_id
+                ON CONFLICT (project_id) DO UPDATE
+                SET card_count = project_stats.card_count + EXCLUDED.card_count,
+                    open_card_count = project_stats.open_card_count + EXCLUDED.open_card_count;
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP = 'DELETE' THEN
+                UPDATE project_stats
+                SET card_count = project_stats.card_count - delta.cards,
+                    open_card_count = project_stats.open_card_count - delta.open_cards
+                FROM (
+                    SELECT project_id,
+                           count(*) AS cards,
+                           count(*) FILTER (WHERE NOT column_is_done(column_id)) AS open_cards
+                    FROM old_cards
+                    GROUP BY project_id
+                ) AS delta
+                WHERE project_stats.project_id = delta.project_id;
+                RETURN NULL;
+            END IF;
+
+            -- UPDATE: only cards that changed project or column move the counters.
+            UPDATE project_stats
+            SET card_count = project_stats.card_count + delta.cards,
+                open_card_count = project_stats.open_card_count + delta.open_cards
+            FROM (
+                SELECT project_id, sum(cards) AS cards, sum(open_cards) AS open_cards
+                FROM (
+                    SELECT side.project_id, side.cards,
+                           side.cards * (NOT column_is_done(side.column_id))::int
+                    FROM old_cards o
+                    JOIN new_cards n USING (id)
+                    CROSS JOIN LATERAL (
+                        VALUES (o.project_id, o.column_id, -1), (n.project_id, n.column_id, 1)
+                    ) AS side (project_id, column_id, cards)
+                    WHERE (o.project_id, o.column_id) IS DISTINCT FROM (n.project_id, n.column_id)
+                ) AS changes (project_id, cards, open_cards)
+                GROUP BY project_id
+            ) AS delta
+            WHERE project_stats.project_id = delta.project_id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_project_stats_insert AFTER INSERT ON cards
+        REFERENCING NEW TABLE AS new_cards
+        FOR EACH STATEMENT EXECUTE FUNCTION cards_project_stats()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_project_stats_update AFTER UPDATE ON cards
+        REFERENCING OLD TABLE AS old_cards NEW TABLE AS new_cards
+        FOR EACH STATEMENT EXECUTE FUNCTION cards_project_stats()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_project_stats_delete AFTER DELETE ON cards
+        REFERENCING OLD TABLE AS old_cards
+        FOR EACH STATEMENT EXECUTE FUNCTION cards_project_stats()
+        """
+    )
+    # Adding, removing or reordering columns changes which column is last, so the open
+    # count of that project is recounted. Column changes are rare next to card moves.
+    op.execute(
+        """
+        CREATE FUNCTION columns_project_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                PERFORM refresh_open_cards(project_id) FROM boards WHERE id = OLD.board_id;
+            END IF;
+            IF TG_OP = 'INSERT'
+               OR (TG_OP = 'UPDATE' AND NEW.board_id IS DISTINCT FROM OLD.board_id) THEN
+                PERFORM refresh_open_cards(project_id) FROM boards WHERE id = NEW.board_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER columns_project_stats
+        AFTER INSERT OR DELETE OR UPDATE OF board_id, "order" ON columns
+        FOR EACH ROW EXECUTE FUNCTION columns_project_stats()
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION members_project_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                UPDATE project_stats SET member_count = member_count - 1
+                WHERE project_id = OLD.project_id;
+            ELSE
+                INSERT INTO project_stats (project_id, member_count)
+                VALUES (NEW.project_id, 1)
+                ON CONFLICT (project_id) DO UPDATE
+                SET member_count = project_stats.member_count + 1;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER members_project_stats
+        AFTER INSERT OR DELETE ON members
+        FOR EACH ROW EXECUTE FUNCTION members_project_stats()
+        """
+    )
+    # Authors have read their own messages: their read mark moves with the counter.
+    op.execute(
+        """
+        CREATE FUNCTION messages_project_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                UPDATE project_stats SET message_count = message_count - delta.messages
+                FROM (
+                    SELECT project_id, count(*) AS messages FROM old_messages GROUP BY project_id
+                ) AS delta
+                WHERE project_stats.project_id = delta.project_id;
+                RETURN NULL;
+            END IF;
+
+            INSERT INTO project_stats (project_id, message_count)
+            SELECT project_id, count(*) FROM new_messages GROUP BY project_id
+            ON CONFLICT (project_id) DO UPDATE
+            SET message_count = project_stats.message_count + EXCLUDED.message_count;
+            UPDATE members SET read_message_count = read_message_count + delta.messages
+            FROM (
+                SELECT project_id, user_id, count(*) AS messages FROM new_messages
+                GROUP BY project_id, user_id
+            ) AS delta
+            WHERE members.project_id = delta.project_id AND members.user_id = delta.user_id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER messages_project_stats_insert AFTER INSERT ON messages
+        REFERENCING NEW TABLE AS new_messages
+        FOR EACH STATEMENT EXECUTE FUNCTION messages_project_stats()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER messages_project_stats_delete AFTER DELETE ON messages
+        REFERENCING OLD TABLE AS old_messages
+        FOR EACH STATEMENT EXECUTE FUNCTION messages_project_stats()
+        """
+    )
+
+    # Owners get a membership row (new projects already create one), so listing a user's
+    # projects is a lookup in members alone.
+    op.execute(
+        """
+        INSERT INTO members (project_id, user_id, role)
+        SELECT id, owner_id, 'owner' FROM projects WHERE owner_id IS NOT NULL
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO project_stats (
+            project_id, card_count, open_card_count, member_count, message_count
+        )
+        SELECT p.id,
+               (SELECT count(*) FROM cards WHERE cards.project_id = p.id),
+               (
+                   SELECT count(*) FROM cards
+                   WHERE cards.project_id = p.id AND NOT column_is_done(cards.column_id)
+               ),
+               (SELECT count(*) FROM members WHERE members.project_id = p.id),
+               (SELECT count(*) FROM messages WHERE messages.project_id = p.id)
+        FROM projects p
+        ON CONFLICT (project_id) DO UPDATE
+        SET card_count = EXCLUDED.card_count,
+            open_card_count = EXCLUDED.open_card_count,
+            member_count = EXCLUDED.member_count,
+            message_count = EXCLUDED.message_count
+        """
+    )
+    # Existing history counts as read.
+    op.execute(
+        """
+        UPDATE members SET read_message_count = project_stats.message_count
+        FROM project_stats WHERE project_stats.project_id = members.project_id
+        """
+    )
+
+
+def downgrade() -> None:
+    for table, operations in (
+        ("messages", ("insert", "delete")),
+        ("cards", ("insert", "update", "delete")),
+    ):
+        for operation in operations:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_project_stats_{operation} ON {table}")
+    for table in ("members", "columns"):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_project_stats ON {table}")
+    for table in ("messages", "members", "columns", "cards"):
+        op.execute(f"DROP FUNCTION IF EXISTS {table}_project_stats()")
+    op.execute("DROP FUNCTION IF EXISTS refresh_open_cards(uuid)")
+    op.execute("DROP FUNCTION IF EXISTS column_is_done(uuid)")
+    op.drop_column("members", "read_message_count")
+    for name in reversed(COUNTERS):
+        op.drop_column("project_stats", name)
@@ -0,0 +1,161 @@
+"""per-day column flow and card cycle rollups for board analytics"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0010_board_analytics"
+down_revision = "0009_project_counters"
+branch_labels = None
+depends_on = None
+
+OPERATIONS = ("insert", "update", "delete")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "column_daily_flow",
+        sa.Column(
+            "project_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("day", sa.Date(), primary_key=True),
+        # No foreign key: the history of a deleted column stays consistent with its cards' exits.
+        sa.Column("column_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("entered", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("exited", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_table(
+        "card_cycles",
+        sa.Column("card_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "project_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True)),
+        sa.Column("done_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index(
+        "idx_card_cycles_project_done",
+        "card_cycles",
+        ["project_id", "done_at"],
+        postgresql_where=sa.text("done_at IS NOT NULL"),
+    )
+
+    # Days are UTC. A card enters a column when it is created in or moved to it and exits
+    # when it is moved away or deleted; the per-day net of a column summed up to a day is
+    # its card count at the end of that day. Deletes cascading from a project are skipped.
+    op.execute(
+        """
+        CREATE FUNCTION cards_analytics() RETURNS trigger AS $$
+        DECLARE
+            today date := (now() AT TIME ZONE 'UTC')::date;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO column_daily_flow (project_id, day, column_id, entered)
+                SELECT project_id, today, column_id, count(*)
+                FROM new_cards
+                GROUP BY project_id, column_id
+                ON CONFLICT (project_id, day, column_id) DO UPDATE
+                SET entered = column_daily_flow.entered + EXCLUDED.entered;
+                INSERT INTO card_cycles (card_id, project_id, created_at, done_at)
+                SELECT id, project_id, created_at,
+                       CASE WHEN column_is_done(column_id) THEN now() END
+                FROM new_cards
+                ON CONFLICT (card_id) DO NOTHING;
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO column_daily_flow (project_id, day, column_id, exited)
+                SELECT project_id, today, column_id, count(*)
+                FROM old_cards
+                WHERE EXISTS (SELECT 1 FROM projects WHERE projects.id = old_cards.project_id)
+                GROUP BY project_id, column_id
+                ON CONFLICT (project_id, day, column_id) DO UPDATE
+                SET exited = column_daily_flow.exited + EXCLUDED.exited;
+                RETURN NULL;
+            END IF;
+
+            INSERT INTO column_daily_flow (project_id, day, column_id, entered, exited)
+            SELECT side.project_id, today, side.column_id, sum(side.entered), sum(1 - side.entered)
+            FROM old_cards o
+            JOIN new_cards n USING (id)
+            CROSS JOIN LATERAL (
+                VALUES (o.project_id, o.column_id, 0), (n.project_id, n.column_id, 1)
+            ) AS side (project_id, column_id, entered)
+            WHERE (o.project_id, o.column_id) IS DISTINCT FROM (n.project_id, n.column_id)
+            GROUP BY side.project_id, side.column_id
+            ON CONFLICT (project_id, day, column_id) DO UPDATE
+            SET entered = column_daily_flow.entered + EXCLUDED.entered,
+                exited = column_daily_flow.exited + EXCLUDED.exited;
+            -- The first move starts the cycle; entering the last column finishes it.
+            UPDATE card_cycles
+            SET project_id = n.project_id,
+                started_at = coalesce(card_cycles.started_at, now()),
+                done_at = CASE WHEN column_is_done(n.column_id) THEN now() END
+            FROM old_cards o
+            JOIN new_cards n USING (id)
+            WHERE card_cycles.card_id = n.id
+              AND (o.project_id, o.column_id) IS DISTINCT FROM (n.project_id, n.column_id);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_analytics_insert AFTER INSERT ON cards
+        REFERENCING NEW TABLE AS new_cards
+        FOR EACH STATEMENT EXECUTE FUNCTION cards_analytics()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_analytics_update AFTER UPDATE ON cards
+        REFERENCING OLD TABLE AS old_cards NEW TABLE AS new_cards
+        FOR EACH STATEMENT EXECUTE FUNCTION cards_analytics()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_analytics_delete AFTER DELETE ON cards
+        REFERENCING OLD TABLE AS old_cards
+        FOR EACH STATEMENT EXECUTE FUNCTION cards_analytics()
+        """
+    )
+
+    # Existing cards entered their current column on the day they were created; cards
+    # already in the last column are taken as done at their last update.
+    op.execute(
+        """
+        INSERT INTO column_daily_flow (project_id, day, column_id, entered)
+        SELECT project_id, (created_at AT TIME ZONE 'UTC')::date, column_id, count(*)
+        FROM cards
+        GROUP BY 1, 2, 3
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO card_cycles (card_id, project_id, created_at, done_at)
+        SELECT id, project_id, created_at, CASE WHEN column_is_done(column_id) THEN updated_at END
+        FROM cards
+        """
+    )
+
+
+def downgrade() -> None:
+    for operation in OPERATIONS:
+        op.execute(f"DROP TRIGGER IF EXISTS cards_analytics_{operation} ON cards")
+    op.execute("DROP FUNCTION IF EXISTS cards_analytics()")
+    op.drop_index("idx_card_cycles_project_done", table_name="card_cycles")
+    op.drop_table("card_cycles")
+    op.drop_table("column_daily_flow")
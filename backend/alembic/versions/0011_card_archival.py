@@ -0,0 +1,183 @@
+"""card archival: archived_at, partial indexes on active cards, archive-aware counters"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0011_card_archival"
+down_revision = "0010_board_analytics"
+branch_labels = None
+depends_on = None
+
+# Board, column and list queries only read active cards, so their indexes skip the
+# archive: their size follows the live board, not the project's history.
+ACTIVE = "archived_at IS NULL"
+INDEXES = (
+    ("idx_cards_active_column_pos", ["column_id", "position", "id"], ACTIVE),
+    ("idx_cards_active_project_pos", ["project_id", "column_id", "position", "id"], ACTIVE),
+    (
+        "idx_cards_active_project_due",
+        ["project_id", "due_date"],
+        f"due_date IS NOT NULL AND {ACTIVE}",
+    ),
+    (
+        "idx_cards_active_project_priority",
+        ["project_id", "priority"],
+        f"priority IS NOT NULL AND {ACTIVE}",
+    ),
+    # The archive endpoint pages a project's archive newest first.
+    (
+        "idx_cards_archived",
+        [sa.text("project_id"), sa.text("archived_at DESC"), sa.text("id DESC")],
+        "archived_at IS NOT NULL",
+    ),
+)
+# Superseded by their active-only versions above.
+REPLACED = (
+    ("idx_cards_project_due", ["project_id", "due_date"], "due_date IS NOT NULL"),
+    ("idx_cards_project_priority", ["project_id", "priority"], "priority IS NOT NULL"),
+)
+
+
+def _counter_functions(active: str) -> tuple[str, ...]:
+    """refresh_open_cards and cards_project_stats (0009), counting only cards where ``active``.
+
+    ``active`` is a predicate on the ``cards`` row alias ``{card}``. Archiving or restoring a
+    card moves the counters like deleting or inserting it would.
+    """
+
+    def is_active(alias: str) -> str:
+        return active.format(card=alias)
+
+    return (
+        f"""
+        CREATE OR REPLACE FUNCTION refresh_open_cards(project uuid) RETURNS void AS $$
+            UPDATE project_stats
+            SET open_card_count = (
+                SELECT count(*) FROM cards
+                WHERE cards.project_id = project
+                  AND {is_active("cards")}
+                  AND NOT column_is_done(cards.column_id)
+            )
+            WHERE project_id = project
+        $$ LANGUAGE sql
+        """,
+        f"""
+        CREATE OR REPLACE FUNCTION cards_project_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO project_stats (project_id, card_count, open_card_count)
+                SELECT project_id,
+                       count(*) FILTER (WHERE {is_active("new_cards")}),
+                       count(*) FILTER (
+                          WHERE {is_active("new_cards")} AND NOT column_is_done(column_id)
+                      )
+                FROM new_cards
+                GROUP BY project_id
+                ON CONFLICT (project_id) DO UPDATE
+                SET card_count = project_stats.card_count + EXCLUDED.card_count,
+                    open_card_count = project_stats.open_card_count + EXCLUDED.open_card_count;
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP = 'DELETE' THEN
+                UPDATE project_stats
+                SET card_count = project_stats.card_count - delta.cards,
+                    open_card_count = project_stats.open_card_count - delta.open_cards
+                FROM (
+                    SELECT project_id,
+                           count(*) FILTER (WHERE {is_active("old_cards")}) AS cards,
+                           count(*) FILTER (
+                               WHERE {is_active("old_cards")} AND NOT column_is_done(column_id)
+                           ) AS open_cards
+                    FROM old_cards
+                    GROUP BY project_id
+                ) AS delta
+                WHERE project_stats.project_id = delta.project_id;
+                RETURN NULL;
+            END IF;
+
+            -- UPDATE: only cards that changed project, column or archive state move the counters.
+            UPDATE project_stats
+            SET card_count = project_stats.card_count + delta.cards,
+                open_card_count = project_stats.open_card_count + delta.open_cards
+            FROM (
+                SELECT project_id, sum(cards) AS cards, sum(open_cards) AS open_cards
+                FROM (
+                    SELECT side.project_id, side.cards,
+                           side.cards * (NOT column_is_done(side.column_id))::int
+                    FROM old_cards o
+                    JOIN new_cards n USING (id)
+                    CROSS JOIN LATERAL (
+                        VALUES (o.project_id, o.column_id, -({is_active("o")})::int),
+                               (n.project_id, n.column_id, ({is_active("n")})::int)
+                    ) AS side (project_id, column_id, cards)
+                    WHERE (o.project_id, o.column_id, {is_active("o")})
+                        IS DISTINCT FROM (n.project_id, n.column_id, {is_active("n")})
+                ) AS changes (project_id, cards, open_cards)
+                GROUP BY project_id
+            ) AS delta
+            WHERE project_stats.project_id = delta.project_id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+    )
+
+
+def _recount_cards() -> None:
+    op.execute(
+        """
+        UPDATE project_stats
+        SET card_count = (
+            SELECT count(*) FROM cards WHERE cards.project_id = project_stats.project_id
+        )
+        """
+    )
+    op.execute("SELECT refresh_open_cards(project_id) FROM project_stats")
+
+
+def upgrade() -> None:
+    op.add_column("cards", sa.Column("archived_at", sa.DateTime(timezone=True)))
+    for statement in _counter_functions("{card}.archived_at IS NULL"):
+        op.execute(statement)
+    # Archived cards keep their column_daily_flow and card_cycles history (0010): they
+    # were done on the board, archiving only takes them off it.
+
+    # CONCURRENTLY keeps cards writable while the indexes build; it cannot run inside the
+    # migration transaction.
+    with op.get_context().autocommit_block():
+        for name, columns, where in INDEXES:
+            op.create_index(
+                name,
+                "cards",
+                columns,
+                postgresql_where=sa.text(where),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _, _ in REPLACED:
+            op.drop_index(name, table_name="cards", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns, where in REPLACED:
+            op.create_index(
+                name,
+                "cards",
+                columns,
+                postgresql_where=sa.text(where),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name="cards", postgresql_concurrently=True, if_exists=True)
+
+    # Without archive state every card counts again, as in 0009.
+    for statement in _counter_functions("true"):
+        op.execute(statement)
+    op.drop_column("cards", "archived_at")
+    _recount_cards()
@@ -0,0 +1,120 @@
+"""archive-aware column flow; card_cycles rows go with their card"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0012_archive_flow"
+down_revision = "0011_card_archival"
+branch_labels = None
+depends_on = None
+
+
+def _analytics_function(active: str) -> str:
+    """cards_analytics (0010), counting a card in its column only while ``active``.
+
+    ``active`` is a predicate on the ``cards`` row alias ``{card}``. Archiving a card is an
+    exit from its column and restoring it an entry, so a column's net flow stays its number
+    of cards on the board. Deleting a card also deletes its cycle row.
+    """
+
+    def is_active(alias: str) -> str:
+        return active.format(card=alias)
+
+    return f"""
+        CREATE OR REPLACE FUNCTION cards_analytics() RETURNS trigger AS $$
+        DECLARE
+            today date := (now() AT TIME ZONE 'UTC')::date;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO column_daily_flow (project_id, day, column_id, entered)
+                SELECT project_id, today, column_id, count(*)
+                FROM new_cards
+                WHERE {is_active("new_cards")}
+                GROUP BY project_id, column_id
+                ON CONFLICT (project_id, day, column_id) DO UPDATE
+                SET entered = column_daily_flow.entered + EXCLUDED.entered;
+                INSERT INTO card_cycles (card_id, project_id, created_at, done_at)
+                SELECT id, project_id, created_at,
+                       CASE WHEN column_is_done(column_id) THEN now() END
+                FROM new_cards
+                ON CONFLICT (card_id) DO NOTHING;
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO column_daily_flow (project_id, day, column_id, exited)
+                SELECT project_id, today, column_id, count(*)
+                FROM old_cards
+                WHERE {is_active("old_cards")}
+                  AND EXISTS (SELECT 1 FROM projects WHERE projects.id = old_cards.project_id)
+                GROUP BY project_id, column_id
+                ON CONFLICT (project_id, day, column_id) DO UPDATE
+                SET exited = column_daily_flow.exited + EXCLUDED.exited;
+                DELETE FROM card_cycles USING old_cards WHERE card_cycles.card_id = old_cards.id;
+                RETURN NULL;
+            END IF;
+
+            INSERT INTO column_daily_flow (project_id, day, column_id, entered, exited)
+            SELECT side.project_id, today, side.column_id, sum(side.entered), sum(1 - side.entered)
+            FROM old_cards o
+            JOIN new_cards n USING (id)
+            CROSS JOIN LATERAL (
+                VALUES (o.project_id, o.column_id, 0, {is_active("o")}),
+                       (n.project_id, n.column_id, 1, {is_active("n")})
+            ) AS side (project_id, column_id, entered, active)
+            WHERE side.active
+              AND (o.project_id, o.column_id, {is_active("o")})
+                  IS DISTINCT FROM (n.project_id, n.column_id, {is_active("n")})
+            GROUP BY side.project_id, side.column_id
+            ON CONFLICT (project_id, day, column_id) DO UPDATE
+            SET entered = column_daily_flow.entered + EXCLUDED.entered,
+                exited = column_daily_flow.exited + EXCLUDED.exited;
+            -- The first move starts the cycle; entering the last column finishes it.
+            UPDATE card_cycles
+            SET project_id = n.project_id,
+                started_at = coalesce(card_cycles.started_at, now()),
+                done_at = CASE WHEN column_is_done(n.column_id) THEN now() END
+            FROM old_cards o
+            JOIN new_cards n USING (id)
+            WHERE card_cycles.card_id = n.id
+              AND (o.project_id, o.column_id) IS DISTINCT FROM (n.project_id, n.column_id);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+
+
+def _archived_flow(counter: str) -> None:
+    """Add each archived card to ``counter`` of its column on the day it was archived."""
+    op.execute(
+        f"""
+        INSERT INTO column_daily_flow (project_id, day, column_id, {counter})
+        SELECT project_id, (archived_at AT TIME ZONE 'UTC')::date, column_id, count(*)
+        FROM cards
+        WHERE archived_at IS NOT NULL
+        GROUP BY 1, 2, 3
+        ON CONFLICT (project_id, day, column_id) DO UPDATE
+        SET {counter} = column_daily_flow.{counter} + EXCLUDED.{counter}
+        """
+    )
+
+
+def upgrade() -> None:
+    op.execute(_analytics_function("{card}.archived_at IS NULL"))
+    # Cards archived so far left their column on their archive day.
+    _archived_flow("exited")
+    op.execute(
+        """
+        DELETE FROM card_cycles
+        WHERE NOT EXISTS (SELECT 1 FROM cards WHERE cards.id = card_cycles.card_id)
+        """
+    )
+
+
+def downgrade() -> None:
+    # 0011 counts archived cards in their column, so they enter it again. Cycle rows of
+    # deleted cards are still removed with them.
+    _archived_flow("entered")
+    op.execute(_analytics_function("true"))
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import math
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_db, read_session, replica_engines, wrote_recently
 from app.models import User
+from app.services.ratelimit import limiter
 from app.services.security import decode_token
 
 
@@ -29,4 +32,66 @@ async def get_current_user(
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    # Commits on this session open the user's read-your-writes window.
+    db.info["user_id"] = user.id
     return user
+
+
+async def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
+    """The current user, if listed in ``ADMIN_EMAILS``; guards the worker diagnostics."""
+    if current_user.email.lower() not in {email.lower() for email in settings.admin_emails}:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin only")
+    return current_user
+
+
+def _token_subject(request: Request) -> uuid.UUID | None:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return uuid.UUID(decode_token(token).get("sub"))
+    except (ValueError, TypeError):
+        return None
+
+
+async def get_read_db(
+    request: Request, db: AsyncSession = Depends(get_db)
+) -> AsyncIterator[AsyncSession]:
+    """Session for read-only endpoints: a replica, unless the caller wrote recently.
+
+    On the primary this is the request's ``get_db`` session, the one ``get_current_user``
+    already used, so a read request holds a single primary connection.
+    """
+    user_id = _token_subject(request)
+    sticky = user_id is not None and await wrote_recently(user_id)
+    if sticky or not replica_engines:
+        yield db
+        return
+    async with read_session() as session:
+        yield session
+
+
+def rate_limit(policy: str) -> Callable[[Request], Awaitable[None]]:
+    """Route dependency charging the caller to ``policy`` in ``app.services.ratelimit``.
+
+    The caller is the token's user. Meant for authenticated routes: the client address
+    that anonymous requests fall back to is the proxy's when the API sits behind one, so
+    all anonymous callers would share a bucket.
+    """
+    if policy not in limiter.policies:
+        raise ValueError(f"Unknown rate limit policy {policy!r}")
+
+    async def dependency(request: Request) -> None:
+        user_id = _token_subject(request)
+        subject = (
+            str(user_id) if user_id else request.client.host if request.client else "anonymous"
+        )
+        retry_after = limiter.acquire(policy, subject, "http")
+        if retry_after is not None:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too Many Requests",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+    return dependency
@@ -1,8 +1,22 @@
 from fastapi import APIRouter
 
-from app.api.routes import auth, board, cards, chat, columns, files, projects, system
+from app.api.responses import FastJSONResponse
+from app.api.routes import (
+    analytics,
+    auth,
+    board,
+    cards,
+    chat,
+    columns,
+    files,
+    imports,
+    projects,
+    search,
+    system,
+    uploads,
+)
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=FastJSONResponse)
 api_router.include_router(system.router)
 api_router.include_router(auth.router)
 api_router.include_router(projects.router)
@@ -10,4 +24,8 @@ api_router.include_router(board.router)
 api_router.include_router(columns.router)
 api_router.include_router(cards.router)
 api_router.include_router(chat.router)
+api_router.include_router(uploads.router)
 api_router.include_router(files.router)
+api_router.include_router(search.router)
+api_router.include_router(analytics.router)
+api_router.include_router(imports.router)
@@ -5,6 +5,9 @@ __all__ = [
     "chat",
     "columns",
     "files",
+    "imports",
     "projects",
+    "search",
     "system",
+    "uploads",
 ]
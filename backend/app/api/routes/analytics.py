@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, date, datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_read_db
+from app.api.responses import FastJSONResponse
+from app.schemas.analytics import CumulativeFlow, CycleTimeReport, WipReport
+from app.services import analytics
+from app.utils.permissions import ensure_project_member
+
+router = APIRouter(prefix="/projects", tags=["analytics"])
+
+DEFAULT_RANGE_DAYS = 30
+MAX_RANGE_DAYS = 366
+
+
+def date_range(
+    start: date | None = Query(default=None, description="First UTC day, inclusive"),
+    end: date | None = Query(default=None, description="Last UTC day, inclusive (default: today)"),
+) -> tuple[date, date]:
+    end = end or datetime.now(UTC).date()
+    start = start or end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="start must not be after end"
+        )
+    if (end - start).days >= MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range is limited to {MAX_RANGE_DAYS} days",
+        )
+    return start, end
+
+
+@router.get("/{project_id}/analytics/wip", response_model=WipReport)
+async def get_wip(
+    project_id: uuid.UUID,
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    """Cards currently in each column of the board."""
+    await ensure_project_member(project_id, current_user, db)
+    return FastJSONResponse(await analytics.column_wip(db, project_id))
+
+
+@router.get("/{project_id}/analytics/flow", response_model=CumulativeFlow)
+async def get_cumulative_flow(
+    project_id: uuid.UUID,
+    days: tuple[date, date] = Depends(date_range),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    """Cumulative flow: cards in each column at the end of every day of the range."""
+    await ensure_project_member(project_id, current_user, db)
+    return FastJSONResponse(await analytics.cumulative_flow(db, project_id, *days))
+
+
+@router.get("/{project_id}/analytics/cycle-time", response_model=CycleTimeReport)
+async def get_cycle_time(
+    project_id: uuid.UUID,
+    days: tuple[date, date] = Depends(date_range),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    """Cycle and lead time, in hours, of the cards that reached the last column in the range."""
+    await ensure_project_member(project_id, current_user, db)
+    return FastJSONResponse(await analytics.cycle_time(db, project_id, *days))
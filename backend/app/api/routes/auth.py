@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
+from app.api.responses import FastJSONResponse, ResponseAdapter
 from app.models import User
 from app.schemas.auth import Token
 from app.schemas.user import UserCreate, UserLogin, UserRead
@@ -12,9 +13,12 @@ from app.services.security import create_access_token, hash_password, verify_pas
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_user_response = ResponseAdapter(UserRead)
+_token_response = ResponseAdapter(Token)
+
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def register(payload: UserCreate, db: AsyncSession = Depends(get_db)) -> User:
+async def register(payload: UserCreate, db: AsyncSession = Depends(get_db)) -> FastJSONResponse:
     exists = await db.scalar(select(User).where(User.email == payload.email))
     if exists:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already in use")
@@ -23,14 +27,14 @@ async def register(payload: UserCreate, db: AsyncSession = Depends(get_db)) -> U
     db.add(user)
     await db.commit()
     await db.refresh(user)
-    return user
+    return _user_response(user, status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/login", response_model=Token)
-async def login(payload: UserLogin, db: AsyncSession = Depends(get_db)) -> Token:
+async def login(payload: UserLogin, db: AsyncSession = Depends(get_db)) -> FastJSONResponse:
     user = await db.scalar(select(User).where(User.email == payload.email))
     if not user or not verify_password(payload.password, user.password_hash):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
     access_token = create_access_token(str(user.id))
-    return Token(access_token=access_token, user=UserRead.model_validate(user))
+    return _token_response({"access_token": access_token, "user": user})
@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_read_db
+from app.api.responses import FastJSONResponse, row_dicts
 from app.models import Board as BoardModel
 from app.models import Card, Column
-from app.schemas.board import BoardSnapshot
+from app.schemas.board import BoardSnapshot, ColumnWindow
+from app.services.snapshot import CARD_SUMMARY_COLUMNS, SnapshotFormat, stream_board_snapshot
+from app.utils.card_filters import CardFilter, card_cursor, card_filter_params
+from app.utils.fieldsets import SUMMARY_REQUIRED_FIELDS, card_columns, card_fields_param
 from app.utils.permissions import ensure_project_member
 
 router = APIRouter(prefix="/projects", tags=["board"])
@@ -18,20 +23,117 @@ router = APIRouter(prefix="/projects", tags=["board"])
 @router.get("/{project_id}/board", response_model=BoardSnapshot)
 async def get_board_snapshot(
     project_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    per_column: int | None = Query(
+        default=None, ge=1, le=500, description="Cards per column window"
+    ),
+    filters: CardFilter = Depends(card_filter_params),
+    fields: frozenset[str] | None = Depends(card_fields_param),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user),
-):
+) -> FastJSONResponse:
     await ensure_project_member(project_id, current_user, db)
 
     board = await db.scalar(select(BoardModel).where(BoardModel.project_id == project_id))
     if not board:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
 
-    columns_result = await db.execute(select(Column).where(Column.board_id == board.id).order_by(Column.order))
-    cards_result = await db.execute(
-        select(Card).where(Card.project_id == project_id).order_by(Card.column_id, Card.position)
+    columns_result = await db.execute(
+        select(Column.id, Column.board_id, Column.name, Column.order)
+        .where(Column.board_id == board.id)
+        .order_by(Column.order)
     )
+    columns = columns_result.all()
 
-    columns = columns_result.scalars().all()
-    cards = cards_result.scalars().all()
-    return BoardSnapshot(board_id=board.id, columns=columns, cards=cards)
+    # Cards are selected as plain Core rows (only the requested columns with a fieldset)
+    # and encoded straight to JSON: no ORM identity map or pydantic model per card.
+    card_fields = (
+        CARD_SUMMARY_COLUMNS if fields is None else card_columns(fields, SUMMARY_REQUIRED_FIELDS)
+    )
+    base = select(*card_fields)
+
+    windows: list[ColumnWindow] | None = None
+    if per_column is None:
+        cards_stmt = filters.apply(base.where(Card.project_id == project_id))
+        cards_result = await db.execute(cards_stmt.order_by(Card.column_id, Card.position))
+    else:
+        # One LATERAL probe per column: each is a range scan over idx_cards_active_column_pos that
+        # stops after `per_column` rows, regardless of how many cards the column holds.
+        window = (
+            filters.apply(base.where(Card.column_id == Column.id))
+            .order_by(Card.position, Card.id)
+            .limit(per_column)
+            .lateral("column_cards")
+        )
+        cards_result = await db.execute(
+            select(window)
+            .select_from(Column)
+            .join(window, true())
+            .where(Column.board_id == board.id)
+            .order_by(window.c.column_id, window.c.position, window.c.id)
+        )
+    cards = cards_result.all()
+
+    if per_column is not None:
+        totals_stmt = filters.apply(
+            select(Card.column_id, func.count()).where(
+                Card.column_id.in_([column.id for column in columns])
+            )
+        ).group_by(Card.column_id)
+        totals = dict((await db.execute(totals_stmt)).all())
+
+        last_cards = {card.column_id: card for card in cards}
+        windows = [
+            ColumnWindow(
+                column_id=column.id,
+                total=totals.get(column.id, 0),
+                next_cursor=(
+                    card_cursor(last_cards[column.id], "position")
+                    if totals.get(column.id, 0) > per_column
+                    else None
+                ),
+            )
+            for column in columns
+        ]
+
+    return FastJSONResponse(
+        {
+            "board_id": board.id,
+            "columns": row_dicts(columns),
+            "cards": row_dicts(cards),
+            "windows": (
+                None if windows is None else [window.model_dump(mode="json") for window in windows]
+            ),
+        }
+    )
+
+
+@router.get(
+    "/{project_id}/board/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "model": BoardSnapshot,
+            "description": "One JSON document, or one JSON object per line with format=ndjson",
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def stream_board(
+    project_id: uuid.UUID,
+    format: SnapshotFormat = Query(default="json"),
+    filters: CardFilter = Depends(card_filter_params),
+    fields: frozenset[str] | None = Depends(card_fields_param),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> StreamingResponse:
+    await ensure_project_member(project_id, current_user, db)
+
+    board_id = await db.scalar(select(BoardModel.id).where(BoardModel.project_id == project_id))
+    if not board_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
+
+    media_type = "application/x-ndjson" if format == "ndjson" else "application/json"
+    return StreamingResponse(
+        stream_board_snapshot(board_id, project_id, filters, format, fields, bind=db.bind),
+        media_type=media_type,
+    )
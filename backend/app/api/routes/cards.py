@@ -2,33 +2,72 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_read_db, rate_limit
+from app.api.responses import FastJSONResponse, ResponseAdapter, row_dicts
 from app.models import Card, Column, Project
-from app.schemas.card import CardCreate, CardMoveRequest, CardRead, CardUpdate
+from app.repositories import card_by_id, max_card_position
+from app.schemas.card import CardCreate, CardMoveRequest, CardPage, CardRead, CardUpdate
+from app.utils.card_filters import (
+    ArchiveSort,
+    CardFilter,
+    CardSort,
+    apply_card_cursor,
+    card_cursor,
+    card_filter_params,
+    card_sort_fields,
+    order_cards,
+)
+from app.utils.fieldsets import (
+    CARD_FIELDS,
+    CARD_REQUIRED_FIELDS,
+    card_columns,
+    card_fields_param,
+    card_patch_payload,
+)
 from app.utils.permissions import ensure_project_member
 from app.services.bus import broadcast
 
 router = APIRouter(prefix="/cards", tags=["cards"])
 
+_card_response = ResponseAdapter(CardRead)
+
+_ARCHIVE_SORT: ArchiveSort = "-archived_at"
+
 
 async def _get_card_or_404(card_id: uuid.UUID, db: AsyncSession) -> Card:
-    card = await db.scalar(select(Card).where(Card.id == card_id))
+    card = await card_by_id(db, card_id)
     if not card:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Card not found")
     return card
 
 
-@router.post("", response_model=CardRead, status_code=status.HTTP_201_CREATED)
+def _ensure_not_archived(card: Card) -> None:
+    """Archived cards are read-only until ``POST /cards/{card_id}/restore`` brings them back."""
+    if card.archived_at is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "Card is archived; restore it first",
+                "restore": f"/cards/{card.id}/restore",
+            },
+        )
+
+
+@router.post(
+    "",
+    response_model=CardRead,
+    dependencies=[Depends(rate_limit("card.write"))],
+    status_code=status.HTTP_201_CREATED,
+)
 async def create_card(
     payload: CardCreate,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-) -> Card:
+) -> FastJSONResponse:
     project = await db.scalar(select(Project).where(Project.id == payload.project_id))
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
@@ -38,9 +77,7 @@ async def create_card(
     if not column:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Column not found")
 
-    max_position = await db.scalar(
-        select(func.max(Card.position)).where(Card.column_id == payload.column_id)
-    )
+    max_position = await max_card_position(db, payload.column_id)
     position = payload.position if payload.position is not None else (max_position or -1) + 1
 
     card = Card(
@@ -57,79 +94,148 @@ async def create_card(
     db.add(card)
     await db.commit()
     await db.refresh(card)
-    card_payload = CardRead.model_validate(card).model_dump(mode="json")
+    card_payload = _card_response.payload(card)
     await broadcast("card.created", card_payload, room=f"project:{card.project_id}")
-    return card
+    return FastJSONResponse(card_payload, status_code=status.HTTP_201_CREATED)
+
+
+@router.get("", response_model=CardPage)
+async def list_cards(
+    project_id: uuid.UUID,
+    filters: CardFilter = Depends(card_filter_params),
+    sort: CardSort = Query(default="position"),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=500),
+    fields: frozenset[str] | None = Depends(card_fields_param),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    await ensure_project_member(project_id, current_user, db)
+
+    # Plain Core rows encoded straight to JSON; a fieldset narrows the selected columns.
+    requested = CARD_FIELDS if fields is None else fields
+    base = select(*card_columns(requested, CARD_REQUIRED_FIELDS + card_sort_fields(sort)))
+    stmt = filters.apply(base.where(Card.project_id == project_id))
+    if cursor:
+        stmt = apply_card_cursor(stmt, sort, cursor)
+    stmt = order_cards(stmt, sort).limit(limit + 1)
+    cards = (await db.execute(stmt)).all()
+
+    next_cursor = None
+    if len(cards) > limit:
+        cards = cards[:limit]
+        next_cursor = card_cursor(cards[-1], sort)
+    return FastJSONResponse({"items": row_dicts(cards), "next_cursor": next_cursor})
+
+
+@router.get("/archived", response_model=CardPage)
+async def list_archived_cards(
+    project_id: uuid.UUID,
+    filters: CardFilter = Depends(card_filter_params),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=500),
+    fields: frozenset[str] | None = Depends(card_fields_param),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    """A project's archived cards, most recently archived first."""
+    await ensure_project_member(project_id, current_user, db)
+
+    filters.archived = True
+    requested = CARD_FIELDS if fields is None else fields
+    base = select(*card_columns(requested, CARD_REQUIRED_FIELDS + card_sort_fields(_ARCHIVE_SORT)))
+    stmt = filters.apply(base.where(Card.project_id == project_id))
+    if cursor:
+        stmt = apply_card_cursor(stmt, _ARCHIVE_SORT, cursor)
+    stmt = order_cards(stmt, _ARCHIVE_SORT).limit(limit + 1)
+    cards = (await db.execute(stmt)).all()
+
+    next_cursor = None
+    if len(cards) > limit:
+        cards = cards[:limit]
+        next_cursor = card_cursor(cards[-1], _ARCHIVE_SORT)
+    return FastJSONResponse({"items": row_dicts(cards), "next_cursor": next_cursor})
 
 
 @router.get("/{card_id}", response_model=CardRead)
 async def get_card(
     card_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    fields: frozenset[str] | None = Depends(card_fields_param),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user),
-) -> Card:
-    card = await _get_card_or_404(card_id, db)
-    await ensure_project_member(card.project_id, current_user, db)
-    return card
+) -> FastJSONResponse:
+    if fields is None:
+        card = await _get_card_or_404(card_id, db)
+        await ensure_project_member(card.project_id, current_user, db)
+        return _card_response(card)
+
+    result = await db.execute(
+        select(*card_columns(fields, CARD_REQUIRED_FIELDS)).where(Card.id == card_id)
+    )
+    row = result.one_or_none()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Card not found")
+    await ensure_project_member(row.project_id, current_user, db)
+    return FastJSONResponse(row._asdict())
 
 
-@router.patch("/{card_id}", response_model=CardRead)
+@router.patch(
+    "/{card_id}",
+    response_model=CardRead,
+    dependencies=[Depends(rate_limit("card.write"))],
+)
 async def update_card(
     card_id: uuid.UUID,
     payload: CardUpdate,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-) -> Card:
+) -> FastJSONResponse:
     card = await _get_card_or_404(card_id, db)
     await ensure_project_member(card.project_id, current_user, db)
+    _ensure_not_archived(card)
 
     if payload.version != card.version:
-        state_payload = CardRead.model_validate(card).model_dump(mode="json")
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=jsonable_encoder(
-                {
-                    "serverVersion": card.version,
-                    "serverState": state_payload,
-                },
-            ),
+            detail={"serverVersion": card.version, "serverState": _card_response.payload(card)},
         )
 
     update_fields = payload.model_dump(exclude_unset=True, exclude={"version"}, by_alias=False)
+    changed = [field for field, value in update_fields.items() if getattr(card, field) != value]
     for field, value in update_fields.items():
         setattr(card, field, value)
 
     card.version += 1
     await db.commit()
     await db.refresh(card)
-    card_payload = CardRead.model_validate(card).model_dump(mode="json")
-    await broadcast("card.updated", card_payload, room=f"project:{card.project_id}")
-    return card
+    await broadcast(
+        "card.updated", card_patch_payload(card, changed), room=f"project:{card.project_id}"
+    )
+    return _card_response(card)
 
 
-@router.post("/{card_id}/move", response_model=CardRead)
+@router.post(
+    "/{card_id}/move",
+    response_model=CardRead,
+    dependencies=[Depends(rate_limit("card.write"))],
+)
 async def move_card(
     card_id: uuid.UUID,
     payload: CardMoveRequest,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-) -> Card:
+) -> FastJSONResponse:
     if payload.id != card_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Payload mismatch")
 
     card = await _get_card_or_404(card_id, db)
     await ensure_project_member(card.project_id, current_user, db)
+    _ensure_not_archived(card)
 
     if payload.client_version != card.version:
-        state_payload = CardRead.model_validate(card).model_dump(mode="json")
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=jsonable_encoder(
-                {
-                    "serverVersion": card.version,
-                    "serverState": state_payload,
-                },
-            ),
+            detail={"serverVersion": card.version, "serverState": _card_response.payload(card)},
         )
 
     if card.column_id != payload.from_column_id:
@@ -152,7 +258,31 @@ async def move_card(
         },
         room=f"project:{card.project_id}",
     )
-    return card
+    return _card_response(card)
+
+
+@router.post("/{card_id}/restore", response_model=CardRead)
+async def restore_card(
+    card_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    card = await _get_card_or_404(card_id, db)
+    await ensure_project_member(card.project_id, current_user, db)
+    if card.archived_at is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Card is not archived")
+
+    # Back at the bottom of its column: the positions it left have been reused since.
+    max_position = await max_card_position(db, card.column_id)
+    card.archived_at = None
+    card.position = 0 if max_position is None else max_position + 1
+    card.version += 1
+    await db.commit()
+    await db.refresh(card)
+    card_payload = _card_response.payload(card)
+    # Clients see a restored card as a new one on the board.
+    await broadcast("card.created", card_payload, room=f"project:{card.project_id}")
+    return FastJSONResponse(card_payload)
 
 
 @router.delete("/{card_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -4,53 +4,40 @@ import uuid
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi_limiter.depends import RateLimiter
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
-from app.models import Message
+from app.api.deps import get_current_user, get_db, get_read_db, rate_limit
+from app.api.responses import FastJSONResponse, ResponseAdapter, row_dicts
+from app.models import Member, Message, ProjectStats
+from app.repositories import latest_messages
 from app.schemas.chat import MessageCreate, MessageRead
 from app.services.bus import broadcast
 from app.utils.permissions import ensure_project_member
 
 router = APIRouter(prefix="/projects", tags=["chat"])
 
+_message_response = ResponseAdapter(MessageRead)
+
 
 @router.get("/{project_id}/messages", response_model=list[MessageRead])
 async def get_messages(
     project_id: uuid.UUID,
     cursor: datetime | None = Query(default=None, description="ISO timestamp cursor"),
     limit: int = Query(default=50, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user),
-):
+) -> FastJSONResponse:
     await ensure_project_member(project_id, current_user, db)
 
-    stmt = select(Message).where(Message.project_id == project_id).options(selectinload(Message.author))
-    if cursor:
-        stmt = stmt.where(Message.created_at < cursor)
-    stmt = stmt.order_by(Message.created_at.desc()).limit(limit)
-    result = await db.execute(stmt)
-    messages = list(reversed(result.scalars().all()))
-    return [
-        MessageRead(
-            id=message.id,
-            project_id=message.project_id,
-            user_id=message.user_id,
-            content=message.content,
-            created_at=message.created_at,
-            user_display_name=message.author.display_name if message.author else None,
-        )
-        for message in messages
-    ]
+    messages = await latest_messages(db, project_id, limit, before=cursor)
+    return FastJSONResponse(row_dicts(messages[::-1]))
 
 
 @router.post(
     "/{project_id}/messages",
     response_model=MessageRead,
-    dependencies=[Depends(RateLimiter(times=5, seconds=10))],
+    dependencies=[Depends(rate_limit("chat.message"))],
     status_code=status.HTTP_201_CREATED,
 )
 async def post_message(
@@ -58,7 +45,7 @@ async def post_message(
     payload: MessageCreate,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-) -> Message:
+) -> FastJSONResponse:
     if payload.project_id != project_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Project mismatch")
 
@@ -80,11 +67,31 @@ async def post_message(
         },
         room=f"project:{project_id}",
     )
-    return MessageRead(
-        id=message.id,
-        project_id=message.project_id,
-        user_id=message.user_id,
-        content=message.content,
-        created_at=message.created_at,
-        user_display_name=current_user.display_name,
+    return _message_response(
+        MessageRead(
+            id=message.id,
+            project_id=message.project_id,
+            user_id=message.user_id,
+            content=message.content,
+            created_at=message.created_at,
+            user_display_name=current_user.display_name,
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.post("/{project_id}/messages/read", status_code=status.HTTP_204_NO_CONTENT)
+async def mark_messages_read(
+    project_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> None:
+    """Move the user's read mark to the project's current message count (unread -> 0)."""
+    await ensure_project_member(project_id, current_user, db)
+    message_count = select(ProjectStats.message_count).where(ProjectStats.project_id == project_id)
+    await db.execute(
+        update(Member)
+        .where(Member.project_id == project_id, Member.user_id == current_user.id)
+        .values(read_message_count=func.coalesce(message_count.scalar_subquery(), 0))
     )
+    await db.commit()
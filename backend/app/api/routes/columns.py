@@ -1,26 +1,44 @@
 from __future__ import annotations
 
 import uuid
+from datetime import UTC, datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
-from app.models import Board, Column
-from app.schemas.board import ColumnCreate, ColumnRead, ColumnUpdate
-from app.utils.permissions import ensure_project_member
+from app.api.deps import get_current_user, get_db, get_read_db
+from app.api.responses import FastJSONResponse, ResponseAdapter, row_dicts
+from app.models import Board, Card, Column
+from app.schemas.board import (
+    ColumnArchiveResult,
+    ColumnCardsPage,
+    ColumnCreate,
+    ColumnRead,
+    ColumnUpdate,
+)
 from app.services.bus import broadcast
+from app.services.snapshot import CARD_SUMMARY_COLUMNS
+from app.utils.card_filters import (
+    CardFilter,
+    apply_card_cursor,
+    card_cursor,
+    card_filter_params,
+    order_cards,
+)
+from app.utils.permissions import ensure_project_member
 
 router = APIRouter(prefix="/columns", tags=["columns"])
 
+_column_response = ResponseAdapter(ColumnRead)
+
 
 @router.post("", response_model=ColumnRead, status_code=status.HTTP_201_CREATED)
 async def create_column(
     payload: ColumnCreate,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-) -> Column:
+) -> FastJSONResponse:
     board = await db.scalar(select(Board).where(Board.id == payload.board_id))
     if not board:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
@@ -35,7 +53,7 @@ async def create_column(
     db.add(column)
     await db.commit()
     await db.refresh(column)
-    return column
+    return _column_response(column, status_code=status.HTTP_201_CREATED)
 
 
 @router.delete("/{column_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -68,7 +86,7 @@ async def update_column(
     payload: ColumnUpdate,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-) -> Column:
+) -> FastJSONResponse:
     column = await db.scalar(select(Column).where(Column.id == column_id))
     if not column:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Column not found")
@@ -86,4 +104,78 @@ async def update_column(
 
     await db.commit()
     await db.refresh(column)
-    return column
+    return _column_response(column)
+
+
+@router.get("/{column_id}/cards", response_model=ColumnCardsPage)
+async def list_column_cards(
+    column_id: uuid.UUID,
+    after: str | None = Query(
+        default=None, description="Cursor from a board window or previous page"
+    ),
+    limit: int = Query(default=50, ge=1, le=500),
+    filters: CardFilter = Depends(card_filter_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    column = await db.scalar(select(Column).where(Column.id == column_id))
+    if not column:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Column not found")
+
+    board = await db.scalar(select(Board).where(Board.id == column.board_id))
+    if not board:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board missing")
+
+    await ensure_project_member(board.project_id, current_user, db)
+
+    stmt = filters.apply(select(*CARD_SUMMARY_COLUMNS).where(Card.column_id == column_id))
+    if after:
+        stmt = apply_card_cursor(stmt, "position", after)
+    stmt = order_cards(stmt, "position").limit(limit + 1)
+    cards = (await db.execute(stmt)).all()
+
+    next_cursor = None
+    if len(cards) > limit:
+        cards = cards[:limit]
+        next_cursor = card_cursor(cards[-1], "position")
+    return FastJSONResponse(
+        {"column_id": column_id, "items": row_dicts(cards), "next_cursor": next_cursor}
+    )
+
+
+@router.post("/{column_id}/archive", response_model=ColumnArchiveResult)
+async def archive_column_cards(
+    column_id: uuid.UUID,
+    older_than_days: int = Query(
+        default=14, ge=0, le=3650, description="Days since the card last changed"
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    column = await db.scalar(select(Column).where(Column.id == column_id))
+    if not column:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Column not found")
+
+    board = await db.scalar(select(Board).where(Board.id == column.board_id))
+    if not board:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board missing")
+
+    await ensure_project_member(board.project_id, current_user, db)
+
+    # One statement over the column's active cards; the counter triggers run once for it.
+    cutoff = datetime.now(UTC) - timedelta(days=older_than_days)
+    result = await db.execute(
+        update(Card)
+        .where(Card.column_id == column_id, Card.archived_at.is_(None), Card.updated_at < cutoff)
+        .values(archived_at=func.now(), version=Card.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if result.rowcount:
+        # One event instead of one per card: clients reload the board snapshot.
+        await broadcast(
+            "board.reset",
+            {"projectId": board.project_id, "boardId": board.id},
+            room=f"project:{board.project_id}",
+        )
+    return FastJSONResponse({"column_id": column_id, "archived": result.rowcount})
@@ -1,93 +1,187 @@
 from __future__ import annotations
 
-import os
 import uuid
+from datetime import datetime
 from pathlib import Path
-from typing import List  
+from typing import Literal
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from fastapi.responses import FileResponse
-from sqlalchemy import select
+from anyio import to_thread
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_read_db
+from app.api.responses import FastJSONResponse, ResponseAdapter
 from app.core.config import settings
-from app.models import FileAsset
-from app.schemas.file import FileRead
+from app.models import FileAsset, ProjectStats
+from app.schemas.file import FileFromDigest, FilePage, FileRead
+from app.services import thumbnails
+from app.services.blobs import acquire_blob, blob_path, commit_blob, stage_upload
+from app.services.storage import StoredFileResponse, UploadTooLarge, stat_file
+from app.utils.pagination import decode_cursor, encode_cursor
 from app.utils.permissions import ensure_project_member
 
 router = APIRouter(prefix="/files", tags=["files"])
 
+_file_response = ResponseAdapter(FileRead)
+_file_page_response = ResponseAdapter(FilePage)
+
 MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10 MB
 
 
+def schedule_thumbnails(file_record: FileAsset, background_tasks: BackgroundTasks) -> None:
+    """Render previews after the response is sent; identical content is rendered once."""
+    if file_record.blob_digest and thumbnails.supports(file_record.mime):
+        background_tasks.add_task(
+            thumbnails.generate_in_background, file_record.blob_digest, Path(file_record.path)
+        )
+
+
 @router.post("", response_model=FileRead, status_code=status.HTTP_201_CREATED)
 async def upload_file(
     project_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     upload: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-) -> FileAsset:
+) -> FastJSONResponse:
     await ensure_project_member(project_id, current_user, db)
 
-    size = 0
-    destination_dir = Path(settings.uploads_dir) / str(project_id)
-    destination_dir.mkdir(parents=True, exist_ok=True)
-    file_id = uuid.uuid4()
     original_name = upload.filename or "file"
  
     safe_original_name = "".join(
         c for c in original_name if c.isalnum() or c in ("_.- ")
     ).strip()
-    destination_path = destination_dir / f"{file_id}_{safe_original_name}"
-
-    with destination_path.open("wb") as buffer:
-        while chunk := await upload.read(1024 * 1024):
-            size += len(chunk)
-            if size > MAX_UPLOAD_SIZE:
-                buffer.close()
-                destination_path.unlink(missing_ok=True)
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST, detail="File too large"
-                )
-            buffer.write(chunk)
-    await upload.close()
+
+    try:
+        staged = await stage_upload(upload, MAX_UPLOAD_SIZE)
+    except UploadTooLarge as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="File too large"
+        ) from exc
+    finally:
+        await upload.close()
+
+    async with commit_blob(db, staged) as blob_file:
+        file_record = FileAsset(
+            project_id=project_id,
+            user_id=current_user.id,
+            blob_digest=staged.digest,
+            name=safe_original_name or "file",
+            path=str(blob_file),
+            mime=upload.content_type or "application/octet-stream",
+            size=staged.size,
+        )
+        db.add(file_record)
+        await db.commit()
+    await db.refresh(file_record)
+    schedule_thumbnails(file_record, background_tasks)
+    return _file_response(file_record, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/by-digest", response_model=FileRead, status_code=status.HTTP_201_CREATED)
+async def attach_existing_blob(
+    payload: FileFromDigest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    """Create a file from content the server already stores, without re-uploading it.
+
+    Only content already attached to a file in one of the caller's projects can be reused.
+    Any other digest gets 404, as an unknown one does; the client then falls back to
+    ``POST /files``.
+    """
+    await ensure_project_member(payload.project_id, current_user, db)
+
+    blob = await acquire_blob(db, payload.sha256, current_user.id)
+    if blob is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Unknown digest")
 
     file_record = FileAsset(
-        id=file_id,
-        project_id=project_id,
+        project_id=payload.project_id,
         user_id=current_user.id,
-        path=str(destination_path),
-        mime=upload.content_type or "application/octet-stream",
-        size=size,
+        blob_digest=blob.digest,
+        name=payload.name,
+        path=str(blob_path(blob.digest)),
+        mime=payload.mime,
+        size=blob.size,
     )
     db.add(file_record)
     await db.commit()
     await db.refresh(file_record)
-    return file_record
+    schedule_thumbnails(file_record, background_tasks)
+    return _file_response(file_record, status_code=status.HTTP_201_CREATED)
 
 
 #НОВЫЙ ЭНДПОИНТ ДЛЯ СПИСКА ФАЙЛОВ
-@router.get("", response_model=List[FileRead])
+@router.get("", response_model=FilePage)
 async def list_files(
     project_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    mime: str | None = Query(default=None, max_length=120),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user),
-) -> List[FileAsset]:
+) -> FastJSONResponse:
     """
-    Get a list of all files for a given project.
+    Newest files of a project first, paginated by ``(created_at, id)``.
+
+    ``mime`` is a prefix (``image/``, ``application/pdf``). Totals cover the whole project
+    and come from ``project_stats``, not from counting rows.
     """
     await ensure_project_member(project_id, current_user, db)
 
-    query = select(FileAsset).where(FileAsset.project_id == project_id)
-    result = await db.scalars(query)
-    return result.all()
+    stmt = select(FileAsset).where(FileAsset.project_id == project_id)
+    if mime:
+        stmt = stmt.where(FileAsset.mime.startswith(mime, autoescape=True))
+    if cursor:
+        created_value, id_value = decode_cursor(cursor, 2)
+        try:
+            after = tuple_(datetime.fromisoformat(created_value), uuid.UUID(id_value))
+        except (TypeError, ValueError) as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from exc
+        stmt = stmt.where(tuple_(FileAsset.created_at, FileAsset.id) < after)
+    stmt = stmt.order_by(FileAsset.created_at.desc(), FileAsset.id.desc()).limit(limit + 1)
+    files = (await db.scalars(stmt)).all()
+
+    next_cursor = None
+    if len(files) > limit:
+        files = files[:limit]
+        next_cursor = encode_cursor(files[-1].created_at.isoformat(), files[-1].id)
+
+    stats = await db.execute(
+        select(ProjectStats.file_count, ProjectStats.file_bytes).where(
+            ProjectStats.project_id == project_id
+        )
+    )
+    total_count, total_bytes = stats.one_or_none() or (0, 0)
+    return _file_page_response(
+        {
+            "items": files,
+            "next_cursor": next_cursor,
+            "total_count": total_count,
+            "total_bytes": total_bytes,
+        }
+    )
 
 
 @router.get("/{file_id}")
 async def download_file(
     file_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    disposition: Literal["attachment", "inline"] = Query(default="attachment"),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user),
 ):
     file_record = await db.scalar(select(FileAsset).where(FileAsset.id == file_id))
@@ -96,12 +190,77 @@ async def download_file(
 
     await ensure_project_member(file_record.project_id, current_user, db)
 
-    if not os.path.exists(file_record.path):
+    stat_result = await stat_file(file_record.path)
+    if stat_result is None:
         raise HTTPException(status_code=status.HTTP_410_GONE, detail="File missing on disk")
 
     # Используем Path() для безопасного извлечения имени файла
-    filename = Path(file_record.path).name
+    filename = file_record.name or Path(file_record.path).name
+
+    # Blob content never changes, so its digest is a strong validator for If-Range.
+    headers = {"ETag": f'"{file_record.blob_digest}"'} if file_record.blob_digest else None
+    return StoredFileResponse(
+        path=file_record.path,
+        media_type=file_record.mime,
+        filename=filename,
+        stat_result=stat_result,
+        headers=headers,
+        content_disposition_type=disposition,
+    )
+
 
-    return FileResponse(
-        path=file_record.path, media_type=file_record.mime, filename=filename
-    )
\ No newline at end of file
+@router.get("/{file_id}/thumbnail")
+async def get_thumbnail(
+    file_id: uuid.UUID,
+    size: int = Query(default=min(settings.thumbnail_sizes), ge=1),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+):
+    file_record = await db.scalar(select(FileAsset).where(FileAsset.id == file_id))
+    if not file_record:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    await ensure_project_member(file_record.project_id, current_user, db)
+    if not file_record.blob_digest or not thumbnails.supports(file_record.mime):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No thumbnail for this file"
+        )
+
+    bucket = thumbnails.bucket_for(size)
+    # Missing derivatives (never rendered, or removed from disk) are rebuilt on demand.
+    path = await thumbnails.ensure_thumbnail(
+        file_record.blob_digest, Path(file_record.path), bucket
+    )
+    stat_result = await stat_file(path) if path is not None else None
+    if stat_result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Thumbnail unavailable")
+
+    return StoredFileResponse(
+        path=path,
+        media_type=thumbnails.THUMBNAIL_MEDIA_TYPE,
+        stat_result=stat_result,
+        headers={
+            "ETag": f'"{file_record.blob_digest}-{bucket}"',
+            "Cache-Control": "private, max-age=31536000, immutable",
+        },
+    )
+
+
+@router.delete("/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_file(
+    file_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> None:
+    file_record = await db.scalar(select(FileAsset).where(FileAsset.id == file_id))
+    if not file_record:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    await ensure_project_member(file_record.project_id, current_user, db)
+    # Blob content is shared between projects; the garbage collector removes it once
+    # the last referencing file is gone. Files stored before blobs existed are unlinked here.
+    legacy_path = Path(file_record.path) if file_record.blob_digest is None else None
+    await db.delete(file_record)
+    await db.commit()
+    if legacy_path is not None:
+        await to_thread.run_sync(legacy_path.unlink, True)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_db, rate_limit
+from app.api.responses import FastJSONResponse, ResponseAdapter
+from app.core.config import settings
+from app.schemas.imports import ImportResult
+from app.services.bus import broadcast
+from app.services.importer import (
+    BulkImporter,
+    ImportFailed,
+    ImportFormat,
+    ImportKind,
+    ImportTooLarge,
+    iter_lines,
+    parse_csv,
+    parse_ndjson,
+)
+from app.utils.permissions import ensure_project_member
+
+router = APIRouter(prefix="/projects", tags=["import"])
+
+_result_response = ResponseAdapter(ImportResult)
+
+
+@router.post(
+    "/{project_id}/import",
+    response_model=ImportResult,
+    dependencies=[Depends(rate_limit("import"))],
+)
+async def import_project_data(
+    project_id: uuid.UUID,
+    request: Request,
+    format: ImportFormat = Query(default="ndjson"),
+    kind: ImportKind | None = Query(default=None),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    """Bulk-load columns, cards and messages from the request body.
+
+    NDJSON lines carry a ``type`` of ``column``, ``card`` or ``message``; a CSV body holds
+    one ``kind`` with a header row (``labels``/``assignees`` are ``;``-separated). Cards
+    reference columns by name, and unknown columns are created. Nothing is written unless
+    every record is valid. Bodies over ``import_max_size`` and lines over
+    ``import_max_line_size`` are rejected with 413.
+    """
+    await ensure_project_member(project_id, current_user, db)
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > settings.import_max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Body exceeds {settings.import_max_size} bytes",
+        )
+    if format == "csv" and kind is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="kind is required for CSV"
+        )
+
+    importer = BulkImporter(db, project_id, current_user.id)
+    board_id = await importer.start()
+    if board_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
+
+    lines = iter_lines(request.stream(), settings.import_max_size, settings.import_max_line_size)
+    records = parse_ndjson(lines) if format == "ndjson" else parse_csv(lines, kind)
+    try:
+        await importer.consume(records)
+    except ImportFailed as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[issue.model_dump() for issue in exc.issues],
+        ) from exc
+    except ImportTooLarge as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc)
+        ) from exc
+
+    result = await importer.finish()
+    await db.commit()
+    # One event instead of one per card: clients reload the board snapshot.
+    await broadcast(
+        "board.reset", {"projectId": project_id, "boardId": board_id}, room=f"project:{project_id}"
+    )
+    return _result_response(result)
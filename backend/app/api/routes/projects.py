@@ -1,31 +1,54 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import or_, select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_read_db
+from app.api.responses import FastJSONResponse, row_dicts
 from app.models import Board, Column, Member, Project, User
-from app.schemas.project import ProjectCreate, ProjectRead
+from app.repositories import project_summary, user_projects
+from app.schemas.project import ProjectCreate, ProjectPage, ProjectRead
+from app.services.export import stream_project_export
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.permissions import ensure_project_member
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-@router.get("", response_model=list[ProjectRead])
+@router.get("", response_model=ProjectPage)
 async def list_projects(
-    db: AsyncSession = Depends(get_db), current_user=Depends(get_current_user)
-) -> list[Project]:
-    stmt = (
-        select(Project)
-        .outerjoin(Member, Member.project_id == Project.id)
-        .where(or_(Project.owner_id == current_user.id, Member.user_id == current_user.id))
-        .distinct()
-        .order_by(Project.created_at.desc())
-    )
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    """
+    The user's projects newest first, paginated by ``(created_at, id)``.
+
+    Card, open-card and member counts and the user's unread messages come from
+    ``project_stats``, not from counting rows.
+    """
+    after = None
+    if cursor:
+        created_value, id_value = decode_cursor(cursor, 2)
+        try:
+            after = (datetime.fromisoformat(created_value), uuid.UUID(id_value))
+        except (TypeError, ValueError) as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from exc
+    projects = await user_projects(db, current_user.id, limit + 1, after)
+
+    next_cursor = None
+    if len(projects) > limit:
+        projects = projects[:limit]
+        next_cursor = encode_cursor(projects[-1].created_at.isoformat(), projects[-1].id)
+    return FastJSONResponse({"items": row_dicts(projects), "next_cursor": next_cursor})
 
 
 @router.post("", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
@@ -33,7 +56,7 @@ async def create_project(
     payload: ProjectCreate,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-) -> Project:
+) -> FastJSONResponse:
     project = Project(name=payload.name, owner_id=current_user.id)
     db.add(project)
     await db.flush()
@@ -48,28 +71,36 @@ async def create_project(
         db.add(Column(board_id=board.id, name=name, order=index))
 
     await db.commit()
-    await db.refresh(project)
-    return project
+    summary = await project_summary(db, project.id, current_user.id)
+    return FastJSONResponse(summary._asdict(), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
 async def get_project(
     project_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user),
-) -> Project:
-    stmt = (
-        select(Project)
-        .outerjoin(Member, Member.project_id == Project.id)
-        .where(Project.id == project_id)
-        .where(or_(Project.owner_id == current_user.id, Member.user_id == current_user.id))
-        .distinct()
-    )
-    result = await db.execute(stmt)
-    project = result.scalar_one_or_none()
-    if not project:
+) -> FastJSONResponse:
+    summary = await project_summary(db, project_id, current_user.id)
+    if not summary:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-    return project
+    return FastJSONResponse(summary._asdict())
+
+@router.get("/{project_id}/export")
+async def export_project(
+    project_id: uuid.UUID,
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> StreamingResponse:
+    """ZIP with ``boards/columns/cards/messages.ndjson``, ``files/<id>/<name>`` and
+    ``files.ndjson``."""
+    await ensure_project_member(project_id, current_user, db)
+    return StreamingResponse(
+        stream_project_export(project_id, bind=db.bind),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}.zip"'},
+    )
+
 
 @router.post("/{project_id}/members", status_code=status.HTTP_201_CREATED)
 async def add_user_to_project(
@@ -77,7 +108,7 @@ async def add_user_to_project(
     user_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-):
+) -> FastJSONResponse:
     """Добавить пользователя к проекту. Только владелец проекта может добавлять участников."""
     
     # Проверяем, что текущий пользователь - владелец проекта
@@ -114,4 +145,7 @@ async def add_user_to_project(
     db.add(new_member)
     await db.commit()
     
-    return {"message": "User added to project successfully", "user_id": user_id} 
\ No newline at end of file
+    return FastJSONResponse(
+        {"message": "User added to project successfully", "user_id": user_id},
+        status_code=status.HTTP_201_CREATED,
+    ) 
\ No newline at end of file
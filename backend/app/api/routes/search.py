@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import html
+import uuid
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import (
+    DateTime,
+    String,
+    cast,
+    func,
+    literal,
+    literal_column,
+    null,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_read_db
+from app.api.responses import FastJSONResponse, ResponseAdapter
+from app.models import Card, Message
+from app.models.entities import SEARCH_CONFIG
+from app.schemas.search import SearchPage
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.permissions import ensure_project_member
+
+router = APIRouter(prefix="/projects", tags=["search"])
+
+# ts_headline copies card and chat text verbatim, markup included. Matches are delimited
+# with private-use characters instead of <mark>, and the text is HTML-escaped before the
+# delimiters become <mark> tags, so ``highlight`` is safe to render as HTML.
+MARK_START, MARK_END = "\ue000", "\ue001"
+HEADLINE_OPTIONS = (
+    f'StartSel="{MARK_START}", StopSel="{MARK_END}", MaxWords=30, MinWords=10, MaxFragments=2'
+)
+
+_page_response = ResponseAdapter(SearchPage)
+
+
+def _highlight_html(headline: str) -> str:
+    return html.escape(headline).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+@router.get("/{project_id}/search", response_model=SearchPage)
+async def search_project(
+    project_id: uuid.UUID,
+    q: str = Query(min_length=1, max_length=200),
+    scope: Literal["all", "cards", "messages"] = Query(default="all"),
+    include_archived: bool = Query(default=False),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=50),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    """Full-text search over a project's cards and chat; archived cards only on request."""
+    await ensure_project_member(project_id, current_user, db)
+
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    tsquery = func.websearch_to_tsquery(config, q)
+
+    # Each branch is driven by its GIN index on search_vector; only matching rows are ranked.
+    branches = []
+    if scope in ("all", "cards"):
+        cards = select(
+            literal("card", String).label("kind"),
+            Card.id.label("id"),
+            Card.column_id.label("column_id"),
+            Card.title.label("title"),
+            func.concat_ws(" ", Card.title, Card.description).label("document"),
+            Card.created_at.label("created_at"),
+            Card.archived_at.label("archived_at"),
+            cast(func.ts_rank_cd(Card.search_vector, tsquery), DOUBLE_PRECISION).label("rank"),
+        ).where(Card.project_id == project_id, Card.search_vector.bool_op("@@")(tsquery))
+        if not include_archived:
+            cards = cards.where(Card.archived_at.is_(None))
+        branches.append(cards)
+    if scope in ("all", "messages"):
+        branches.append(
+            select(
+                literal("message", String).label("kind"),
+                Message.id.label("id"),
+                cast(null(), UUID(as_uuid=True)).label("column_id"),
+                cast(null(), String).label("title"),
+                Message.content.label("document"),
+                Message.created_at.label("created_at"),
+                cast(null(), DateTime(timezone=True)).label("archived_at"),
+                cast(
+                    func.ts_rank_cd(Message.search_vector, tsquery), DOUBLE_PRECISION
+                ).label("rank"),
+            ).where(Message.project_id == project_id, Message.search_vector.bool_op("@@")(tsquery))
+        )
+
+    hits = (union_all(*branches) if len(branches) > 1 else branches[0]).subquery("hits")
+    page_stmt = select(hits).order_by(hits.c.rank.desc(), hits.c.id.desc()).limit(limit + 1)
+    if cursor:
+        rank_value, id_value = decode_cursor(cursor, 2)
+        try:
+            after = (float(rank_value), uuid.UUID(id_value))
+        except (TypeError, ValueError) as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from exc
+        page_stmt = page_stmt.where(tuple_(hits.c.rank, hits.c.id) < tuple_(*after))
+
+    # Headlines are expensive, so they are only computed for the rows on the page.
+    page = page_stmt.subquery("page")
+    # Delimiter characters typed into a card or message must not turn into marks.
+    document = func.translate(page.c.document, MARK_START + MARK_END, "")
+    stmt = select(
+        page.c.kind,
+        page.c.id,
+        page.c.column_id,
+        page.c.title,
+        page.c.created_at,
+        page.c.archived_at,
+        page.c.rank,
+        func.ts_headline(config, document, tsquery, HEADLINE_OPTIONS).label("highlight"),
+    ).order_by(page.c.rank.desc(), page.c.id.desc())
+    rows = (await db.execute(stmt)).mappings().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["rank"], rows[-1]["id"])
+    items = [{**row, "highlight": _highlight_html(row["highlight"])} for row in rows]
+    return _page_response({"items": items, "next_cursor": next_cursor})
@@ -1,39 +1,100 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import text
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_admin_user, get_current_user, get_db
+from app.api.responses import FastJSONResponse, ResponseAdapter
+from app.core.config import settings
+from app.db.session import pool_status
 from app.schemas.system import HealthStatus
 from app.schemas.user import UserRead
-from app.services.redis import get_redis
+from app.services.health import checker
+from app.services.looplag import monitor as loop_monitor
+from app.services.profiler import ProfileMode, ProfilerBusy, profile
 
 router = APIRouter(tags=["system"])
+# Kubernetes probes, mounted at the root rather than under the API prefix.
+probes = APIRouter(tags=["system"], include_in_schema=False)
+
+_health_response = ResponseAdapter(HealthStatus)
+_user_response = ResponseAdapter(UserRead)
 
 
 @router.get("/health", response_model=HealthStatus)
-async def health(db: AsyncSession = Depends(get_db)) -> HealthStatus:
-    postgres_ok = False
-    redis_ok = False
+async def health() -> FastJSONResponse:
+    """Summary of the background dependency checks; like ``/readyz``, it sends no query."""
+    _, report = checker.readiness()
+    postgres_ok, redis_ok = report["postgres"]["ok"], report["redis"]["ok"]
+    status_text = "ok" if postgres_ok and redis_ok else "degraded"
+    return _health_response({"status": status_text, "postgres": postgres_ok, "redis": redis_ok})
+
+
+@probes.get("/livez")
+async def livez() -> FastJSONResponse:
+    """The process serves HTTP. Dependencies are not consulted, so a DB outage does not
+    restart pods."""
+    return FastJSONResponse({"status": "alive"})
+
+
+@probes.get("/readyz")
+async def readyz() -> FastJSONResponse:
+    """Cached Postgres and Redis checks, pool saturation and loop lag; 503 while not ready."""
+    ready, report = checker.readiness()
+    return FastJSONResponse(
+        report, status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
 
-    try:
-        await db.execute(text("SELECT 1"))
-        postgres_ok = True
-    except Exception:  # pragma: no cover - best effort
-        postgres_ok = False
 
+@router.get("/health/pools")
+async def database_pools(current_user=Depends(get_current_user)) -> FastJSONResponse:
+    """Per-engine pool usage: checked-out connections, saturation and checkout wait times."""
+    return FastJSONResponse(pool_status())
+
+
+@router.post("/debug/profile", response_class=PlainTextResponse)
+async def profile_worker(
+    seconds: float = Query(default=10.0, gt=0),
+    mode: ProfileMode = Query(default="wall"),
+    interval_ms: float = Query(default=10.0, ge=1.0, le=1000.0),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_admin_user),
+) -> PlainTextResponse:
+    """Samples the worker that serves this request for ``seconds``.
+
+    The response is collapsed stacks, ready for flame graph tools.
+
+    Each uvicorn process profiles only itself, so with several workers call it until the hot
+    one answers, or profile one worker behind a dedicated port.
+    """
+    if seconds > settings.profile_max_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"seconds must be at most {settings.profile_max_seconds}",
+        )
+    # The admin check is done; return its connection instead of idling in a transaction
+    # while sampling.
+    await db.close()
     try:
-        redis = get_redis()
-        await redis.ping()
-        redis_ok = True
-    except Exception:  # pragma: no cover
-        redis_ok = False
+        profiler = await profile(seconds, mode, interval_ms / 1000)
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={
+            "Content-Disposition": f'attachment; filename="profile-{mode}.folded"',
+            "X-Profile-Samples": str(profiler.samples),
+        },
+    )
 
-    status_text = "ok" if postgres_ok and redis_ok else "degraded"
-    return HealthStatus(status=status_text, postgres=postgres_ok, redis=redis_ok)
+
+@router.get("/debug/loop")
+async def event_loop_status(current_user=Depends(get_admin_user)) -> FastJSONResponse:
+    """Event-loop lag and the stacks of the latest callbacks that blocked it."""
+    return FastJSONResponse(loop_monitor.snapshot())
 
 
 @router.get("/me", response_model=UserRead)
-async def me(current_user=Depends(get_current_user)) -> UserRead:
-    return UserRead.model_validate(current_user)
+async def me(current_user=Depends(get_current_user)) -> FastJSONResponse:
+    return _user_response(current_user)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import hashlib
+import uuid
+
+from anyio import to_thread
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import ClientDisconnect
+
+from app.api.deps import get_current_user, get_db
+from app.api.responses import FastJSONResponse, ResponseAdapter
+from app.api.routes.files import schedule_thumbnails
+from app.core.config import settings
+from app.models import FileAsset, UploadSession
+from app.schemas.file import FileRead, UploadSessionCreate, UploadSessionRead
+from app.services.blobs import StagedBlob, commit_blob
+from app.services.storage import FileWriter, hash_file
+from app.services.uploads import session_path
+from app.utils.permissions import ensure_project_member
+
+router = APIRouter(prefix="/files/uploads", tags=["files"])
+
+_session_response = ResponseAdapter(UploadSessionRead)
+_file_response = ResponseAdapter(FileRead)
+
+
+def _session_read(session: UploadSession) -> UploadSessionRead:
+    return UploadSessionRead(
+        id=session.id,
+        project_id=session.project_id,
+        name=session.name,
+        mime=session.mime,
+        size=session.size,
+        received=session.received,
+        chunk_max_size=settings.upload_chunk_max_size,
+        updated_at=session.updated_at,
+    )
+
+
+async def _get_session_or_404(
+    upload_id: uuid.UUID, user_id: uuid.UUID, db: AsyncSession, lock: bool = False
+) -> UploadSession:
+    stmt = select(UploadSession).where(
+        UploadSession.id == upload_id, UploadSession.user_id == user_id
+    )
+    if lock:
+        # Re-read under the lock: the copy in the identity map may predate other requests.
+        stmt = stmt.with_for_update().execution_options(populate_existing=True)
+    session = await db.scalar(stmt)
+    if not session:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+    return session
+
+
+def _offset_conflict(session: UploadSession) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail={"message": "Offset mismatch", "offset": session.received},
+    )
+
+
+@router.post("", response_model=UploadSessionRead, status_code=status.HTTP_201_CREATED)
+async def create_upload(
+    payload: UploadSessionCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    await ensure_project_member(payload.project_id, current_user, db)
+    if payload.size > settings.max_upload_size:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="File too large")
+
+    session = UploadSession(
+        project_id=payload.project_id,
+        user_id=current_user.id,
+        name=payload.name,
+        mime=payload.mime,
+        size=payload.size,
+        sha256=payload.sha256,
+    )
+    db.add(session)
+    await db.commit()
+    await db.refresh(session)
+    return _session_response(_session_read(session), status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/{upload_id}", response_model=UploadSessionRead)
+async def get_upload(
+    upload_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    session = await _get_session_or_404(upload_id, current_user.id, db)
+    return _session_response(_session_read(session))
+
+
+@router.put("/{upload_id}", response_model=UploadSessionRead)
+async def upload_part(
+    upload_id: uuid.UUID,
+    request: Request,
+    offset: int = Query(ge=0),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    """Write the raw request body at ``offset``; it must equal the bytes received so far.
+
+    No lock is held while the part streams in. Afterwards, ``received`` only moves if it
+    still equals ``offset``, so of two parallel retries of the same part exactly one is
+    accepted and the other gets 409. Retries of a part must carry the same bytes; the
+    declared ``sha256`` catches anything else at completion. If the client disconnects
+    mid-part, whatever arrived is kept and the next ``offset`` reflects it.
+    """
+    session = await _get_session_or_404(upload_id, current_user.id, db)
+    if offset != session.received:
+        raise _offset_conflict(session)
+    # End the read transaction so the part does not hold a pooled connection while it streams.
+    await db.commit()
+
+    remaining = session.size - offset
+    limit = min(remaining, settings.upload_chunk_max_size)
+    writer = await FileWriter(session_path(upload_id), offset=offset).open()
+    too_large = False
+    try:
+        async for chunk in request.stream():
+            if writer.size + len(chunk) > limit:
+                too_large = True
+                break
+            await writer.write(chunk)
+    except ClientDisconnect:
+        pass
+    finally:
+        await writer.close()
+
+    advanced = await db.scalar(
+        update(UploadSession)
+        .where(UploadSession.id == upload_id, UploadSession.received == offset)
+        .values(received=offset + writer.size)
+        .returning(UploadSession)
+        .execution_options(populate_existing=True)
+    )
+    await db.commit()
+    if advanced is None:
+        db.expire(session)
+        current = await db.scalar(select(UploadSession).where(UploadSession.id == upload_id))
+        if current is None:
+            # Aborted or expired while the part streamed in; drop the file the part re-created.
+            await to_thread.run_sync(session_path(upload_id).unlink, True)
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+        raise _offset_conflict(current)
+    if too_large:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "message": "Part exceeds the declared size or chunk limit",
+                "offset": session.received,
+            },
+        )
+    return _session_response(_session_read(session))
+
+
+@router.post("/{upload_id}/complete", response_model=FileRead, status_code=status.HTTP_201_CREATED)
+async def complete_upload(
+    upload_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> FastJSONResponse:
+    """Hash the assembled file and turn the session into a file.
+
+    The file is hashed outside any transaction, since it can be as large as
+    ``max_upload_size``. The session row is locked only afterwards, to re-check that it is
+    still complete and to replace it with the file row.
+    """
+    session = await _get_session_or_404(upload_id, current_user.id, db)
+    if session.received != session.size:
+        raise _offset_conflict(session)
+    await ensure_project_member(session.project_id, current_user, db)
+    await db.commit()
+
+    temp_path = session_path(upload_id)
+    if session.size == 0:
+        async with FileWriter(temp_path):
+            pass
+    try:
+        digest = await to_thread.run_sync(hash_file, temp_path, hashlib.sha256())
+    except FileNotFoundError:
+        # A parallel completion (or an abort) took the file first.
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found"
+        ) from None
+
+    # Once received equals size no part can add bytes, so the digest still describes the file.
+    session = await _get_session_or_404(upload_id, current_user.id, db, lock=True)
+    if session.received != session.size:
+        raise _offset_conflict(session)
+    if session.sha256 and session.sha256 != digest:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Checksum mismatch"
+        )
+
+    staged = StagedBlob(digest=digest, size=session.size, temp_path=temp_path)
+    async with commit_blob(db, staged) as blob_file:
+        file_record = FileAsset(
+            project_id=session.project_id,
+            user_id=current_user.id,
+            blob_digest=digest,
+            name=session.name,
+            path=str(blob_file),
+            mime=session.mime,
+            size=session.size,
+        )
+        db.add(file_record)
+        await db.delete(session)
+        await db.commit()
+    await db.refresh(file_record)
+    schedule_thumbnails(file_record, background_tasks)
+    return _file_response(file_record, status_code=status.HTTP_201_CREATED)
+
+
+@router.delete("/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_upload(
+    upload_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> None:
+    session = await _get_session_or_404(upload_id, current_user.id, db, lock=True)
+    await db.delete(session)
+    await db.commit()
+    await to_thread.run_sync(session_path(upload_id).unlink, True)
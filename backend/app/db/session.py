@@ -1,12 +1,188 @@
+from __future__ import annotations
+
+import itertools
+import time
+import uuid
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
+from app.services.redis import get_redis
+from app.services.timing import track_queries
+
+STICKY_KEY = "db:wrote:{user_id}"
+
+
+@dataclass(slots=True)
+class PoolStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            self.stats.timeouts += 1
+            raise
+        waited = time.perf_counter() - started
+        self.stats.checkouts += 1
+        self.stats.wait_seconds_total += waited
+        self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, waited)
+        return connection
+
+    def recreate(self) -> MeasuredQueuePool:
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def _connect_args() -> dict:
+    if settings.db_pgbouncer_transaction_mode:
+        # Each transaction may land on a different server connection, so a statement
+        # prepared earlier may be missing (or a name may already be taken). Disable both
+        # caches and give every prepared statement a unique name.
+        return {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": settings.db_statement_cache_size}
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        connect_args=_connect_args(),
+        poolclass=MeasuredQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    track_queries(engine.sync_engine)
+    return engine
+
+
+class WriteTrackingSession(Session):
+    """Flags ``info["wrote"]`` when the transaction flushes or runs a non-SELECT statement."""
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _mark_statement(state) -> None:
+    if not state.is_select:
+        state.session.info["wrote"] = True
+
+
+class PrimarySession(AsyncSession):
+    """Session on the primary. A commit that wrote opens a read-your-writes window for
+    ``info["user_id"]``, during which that user's reads skip the replicas."""
+
+    sync_session_class = WriteTrackingSession
+
+    async def commit(self) -> None:
+        await super().commit()
+        user_id = self.info.get("user_id")
+        if self.info.pop("wrote", False) and user_id is not None:
+            await remember_write(user_id)
+
+
+async_engine = _create_engine(settings.async_database_url)
+replica_engines = [_create_engine(url) for url in settings.read_replica_urls]
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, class_=PrimarySession)
+_replica_sessions = [
+    async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    for engine in replica_engines
+]
+_next_replica = itertools.cycle(_replica_sessions)
+
+
+async def remember_write(user_id: uuid.UUID) -> None:
+    if not replica_engines:
+        return
+    try:
+        window_ms = int(settings.read_your_writes_seconds * 1000)
+        await get_redis().set(STICKY_KEY.format(user_id=user_id), "1", px=window_ms)
+    except (RedisError, OSError):
+        logger.exception("Could not record read-your-writes window")
+
+
+async def wrote_recently(user_id: uuid.UUID) -> bool:
+    if not replica_engines:
+        return True
+    try:
+        return bool(await get_redis().exists(STICKY_KEY.format(user_id=user_id)))
+    except (RedisError, OSError):
+        # Without the marker we cannot rule out replica lag, so stay on the primary.
+        return True
+
+
+def read_session(sticky: bool = False) -> AsyncSession:
+    if sticky or not _replica_sessions:
+        return AsyncSessionLocal()
+    return next(_next_replica)()
+
+
+def session_for(bind: AsyncEngine | None) -> AsyncSession:
+    """A fresh session on ``bind`` (e.g. the replica a request was routed to), or the primary."""
+    if bind is None:
+        return AsyncSessionLocal()
+    return AsyncSession(bind, expire_on_commit=False)
 
 
-async_engine = create_async_engine(settings.async_database_url, echo=False, future=True)
-AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, class_=AsyncSession)
+def pool_status() -> dict[str, dict[str, float | int]]:
+    engines = {"primary": async_engine}
+    engines.update({f"replica-{index}": engine for index, engine in enumerate(replica_engines)})
+    status = {}
+    for name, engine in engines.items():
+        pool: MeasuredQueuePool = engine.pool
+        capacity = pool.size() + settings.db_max_overflow
+        stats = pool.stats
+        status[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "saturation": round(pool.checkedout() / capacity, 3) if capacity else 0.0,
+            "checkouts": stats.checkouts,
+            "timeouts": stats.timeouts,
+            "wait_seconds_total": stats.wait_seconds_total,
+            "wait_seconds_avg": (
+                stats.wait_seconds_total / stats.checkouts if stats.checkouts else 0.0
+            ),
+            "wait_seconds_max": stats.wait_seconds_max,
+        }
+    return status
 
 
 async def get_db() -> AsyncIterator[AsyncSession]:
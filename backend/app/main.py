@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 
 import socketio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi_limiter import FastAPILimiter
+from prometheus_client import REGISTRY
 
 from app.api.router import api_router
+from app.api.routes import system
 from app.core.config import settings
-from app.services.redis import close_redis, get_redis, init_redis
+from app.db.session import pool_status
+from app.services import thumbnails
+from app.services.blobs import collect_all_garbage
+from app.services.health import checker as health_checker
+from app.services.looplag import monitor as loop_monitor
+from app.services.metrics import MetricsMiddleware, StatsCollector, metrics_endpoint
+from app.services.periodic import run_periodically
+from app.services.ratelimit import limiter
+from app.services.redis import close_redis, init_redis
+from app.services.timing import ServerTimingMiddleware
 from app.services.bus import attach_socket
+from app.services.uploads import expire_upload_sessions
 
 sio = socketio.AsyncServer(async_mode="asgi", cors_allowed_origins=settings.cors_origins)
 
@@ -18,9 +30,32 @@ sio = socketio.AsyncServer(async_mode="asgi", cors_allowed_origins=settings.cors
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_redis()
-    await FastAPILimiter.init(get_redis())
+    maintenance = [
+        asyncio.create_task(loop_monitor.run()),
+        # Readiness stays false until the first check, so run one now instead of after an interval.
+        asyncio.create_task(health_checker.check()),
+        asyncio.create_task(
+            run_periodically(
+                "health-check", settings.health_check_interval_seconds, health_checker.check
+            )
+        ),
+        asyncio.create_task(
+            run_periodically("rate-limit-sync", settings.rate_limit_sync_seconds, limiter.sync)
+        ),
+        asyncio.create_task(
+            run_periodically("blob-gc", settings.blob_gc_interval_seconds, collect_all_garbage)
+        ),
+        asyncio.create_task(
+            run_periodically(
+                "upload-expiry", settings.blob_gc_interval_seconds, expire_upload_sessions
+            )
+        ),
+    ]
     yield
-    await FastAPILimiter.close()
+    for task in maintenance:
+        task.cancel()
+    await asyncio.gather(*maintenance, return_exceptions=True)
+    thumbnails.shutdown()
     await close_redis()
 
 
@@ -32,7 +67,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(api_router, prefix=settings.api_v1_prefix)
+app.include_router(system.probes)
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+REGISTRY.register(
+    StatsCollector(pool_status, lambda: {"allowed": limiter.allowed, "limited": limiter.limited})
+)
 
 
 from app.websocket import handlers  # noqa: E402  # ensure handlers register events
@@ -1,23 +1,33 @@
 from .entities import (
+    Blob,
     Board,
     Card,
+    CardCycle,
     Column,
+    ColumnDailyFlow,
     EventAudit,
     FileAsset,
     Member,
     Message,
     Project,
+    ProjectStats,
+    UploadSession,
     User,
 )
 
 __all__ = [
+    "Blob",
     "Board",
     "Card",
+    "CardCycle",
     "Column",
+    "ColumnDailyFlow",
     "EventAudit",
     "FileAsset",
     "Member",
     "Message",
     "Project",
+    "ProjectStats",
+    "UploadSession",
     "User",
 ]
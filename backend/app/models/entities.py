@@ -3,13 +3,34 @@ from __future__ import annotations
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import CheckConstraint, Date, DateTime, ForeignKey, Index, Integer, String, Text, text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    Computed,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
 
+# Full-text search uses the language-agnostic "simple" configuration: boards and chat
+# mix Russian and English, and stemming for one language mangles the other.
+SEARCH_CONFIG = "simple"
+CARD_SEARCH_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+MESSAGE_SEARCH_EXPRESSION = f"to_tsvector('{SEARCH_CONFIG}', content)"
+
 
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(
@@ -53,10 +74,30 @@ class Project(Base):
     cards: Mapped[list[Card]] = relationship(back_populates="project", cascade="all,delete")
 
 
+class ProjectStats(Base):
+    """Per-project aggregates kept current by triggers, so listings never run ``COUNT(*)``."""
+
+    __tablename__ = "project_stats"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    file_count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    file_bytes: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    card_count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    # Cards outside the last column of their board.
+    open_card_count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    member_count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    message_count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+
+
 class Member(Base):
     __tablename__ = "members"
     __table_args__ = (
         CheckConstraint("role IN ('owner','member')", name="members_role_check"),
+        # The primary key leads with project_id; permission checks and project listing
+        # look members up by user. project_id is included for index-only scans.
+        Index("idx_members_user", "user_id", "project_id"),
         {
             "mysql_engine": "InnoDB",
         },
@@ -67,6 +108,8 @@ class Member(Base):
     )
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     role: Mapped[str] = mapped_column(String(16), default="member", nullable=False)
+    # ``project_stats.message_count`` when the member last read the chat.
+    read_message_count: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
 
     user: Mapped[User] = relationship(back_populates="memberships")
     project: Mapped[Project] = relationship(back_populates="members")
@@ -74,6 +117,7 @@ class Member(Base):
 
 class Board(Base):
     __tablename__ = "boards"
+    __table_args__ = (Index("idx_boards_project", "project_id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
@@ -87,6 +131,7 @@ class Board(Base):
 
 class Column(Base):
     __tablename__ = "columns"
+    __table_args__ = (Index("idx_columns_board_order", "board_id", "order"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     board_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("boards.id", ondelete="CASCADE"))
@@ -102,9 +147,59 @@ class Column(Base):
 class Card(Base, TimestampMixin):
     __tablename__ = "cards"
     __table_args__ = (
-        CheckConstraint("priority IN ('low','medium','high') OR priority IS NULL", name="cards_priority_check"),
+        CheckConstraint(
+            "priority IN ('low','medium','high') OR priority IS NULL", name="cards_priority_check"
+        ),
         Index("idx_cards_project", "project_id"),
         Index("idx_cards_column_pos", "column_id", "position"),
+        Index("idx_cards_search", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_cards_labels",
+            "labels",
+            postgresql_using="gin",
+            postgresql_ops={"labels": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_cards_assignees",
+            "assignees",
+            postgresql_using="gin",
+            postgresql_ops={"assignees": "jsonb_path_ops"},
+        ),
+        # Board and list queries read active cards only; these skip the archive.
+        Index(
+            "idx_cards_active_column_pos",
+            "column_id",
+            "position",
+            "id",
+            postgresql_where=text("archived_at IS NULL"),
+        ),
+        Index(
+            "idx_cards_active_project_pos",
+            "project_id",
+            "column_id",
+            "position",
+            "id",
+            postgresql_where=text("archived_at IS NULL"),
+        ),
+        Index(
+            "idx_cards_active_project_due",
+            "project_id",
+            "due_date",
+            postgresql_where=text("due_date IS NOT NULL AND archived_at IS NULL"),
+        ),
+        Index(
+            "idx_cards_active_project_priority",
+            "project_id",
+            "priority",
+            postgresql_where=text("priority IS NOT NULL AND archived_at IS NULL"),
+        ),
+        Index(
+            "idx_cards_archived",
+            "project_id",
+            text("archived_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("archived_at IS NOT NULL"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -122,15 +217,61 @@ class Card(Base, TimestampMixin):
     due_date: Mapped[date | None] = mapped_column(Date())
     position: Mapped[int] = mapped_column(Integer, default=0, server_default=text("0"), nullable=False)
     version: Mapped[int] = mapped_column(Integer, default=1, server_default=text("1"), nullable=False)
+    archived_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(CARD_SEARCH_EXPRESSION, persisted=True), deferred=True
+    )
 
     project: Mapped[Project] = relationship(back_populates="cards")
     column: Mapped[Column] = relationship(back_populates="cards")
 
 
+class ColumnDailyFlow(Base):
+    """Cards entering and leaving a column per UTC day, written by the cards_analytics trigger.
+
+    Archiving a card counts as leaving its column, restoring it as entering again.
+    """
+
+    __tablename__ = "column_daily_flow"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date(), primary_key=True)
+    column_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    entered: Mapped[int] = mapped_column(
+        Integer, default=0, server_default=text("0"), nullable=False
+    )
+    exited: Mapped[int] = mapped_column(
+        Integer, default=0, server_default=text("0"), nullable=False
+    )
+
+
+class CardCycle(Base):
+    """When a card was created, first moved and last entered the board's final column."""
+
+    __tablename__ = "card_cycles"
+    __table_args__ = (
+        Index(
+            "idx_card_cycles_project_done",
+            "project_id",
+            "done_at",
+            postgresql_where=text("done_at IS NOT NULL"),
+        ),
+    )
+
+    card_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    done_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+
 class Message(Base):
     __tablename__ = "messages"
     __table_args__ = (
         Index("idx_messages_proj_time", "project_id", "created_at"),
+        Index("idx_messages_search", "search_vector", postgresql_using="gin"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -140,19 +281,48 @@ class Message(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(MESSAGE_SEARCH_EXPRESSION, persisted=True), deferred=True
+    )
 
     author: Mapped[User] = relationship(back_populates="messages")
 
 
+class Blob(Base):
+    __tablename__ = "blobs"
+    __table_args__ = (
+        Index("idx_blobs_unreferenced", "created_at", postgresql_where=text("refcount <= 0")),
+    )
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Maintained by the files_blob_refcount trigger so cascaded deletes are counted too.
+    refcount: Mapped[int] = mapped_column(
+        Integer, default=0, server_default=text("0"), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
 class FileAsset(Base):
     __tablename__ = "files"
+    __table_args__ = (
+        Index("idx_files_blob", "blob_digest"),
+        Index("idx_files_project_created", "project_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"))
+    blob_digest: Mapped[str | None] = mapped_column(ForeignKey("blobs.digest", ondelete="RESTRICT"))
+    name: Mapped[str | None] = mapped_column(String(255))
     path: Mapped[str] = mapped_column(String(500), nullable=False)
     mime: Mapped[str] = mapped_column(String(120), nullable=False)
-    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    thumbnail_sizes: Mapped[list[int]] = mapped_column(
+        JSONB, default=list, server_default=text("'[]'::jsonb")
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -160,8 +330,25 @@ class FileAsset(Base):
     author: Mapped[User] = relationship(back_populates="files")
 
 
+class UploadSession(Base, TimestampMixin):
+    __tablename__ = "upload_sessions"
+    __table_args__ = (Index("idx_upload_sessions_updated", "updated_at"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    mime: Mapped[str] = mapped_column(String(120), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    sha256: Mapped[str | None] = mapped_column(String(64))
+    received: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default=text("0"), nullable=False
+    )
+
+
 class EventAudit(Base):
     __tablename__ = "events_audit"
+    __table_args__ = (Index("idx_events_audit_project_created", "project_id", "created_at"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     actor_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"))
@@ -0,0 +1,20 @@
+"""Hot-path queries as statements built once at import.
+
+Values travel as bound parameters, so every call reuses the same statement object: the
+cache key is computed from a constant structure, the compiled SQL is a hit in the engine's
+compiled cache, and the SQL text stays stable for asyncpg's prepared-statement cache.
+"""
+
+from .cards import card_by_id, max_card_position
+from .messages import latest_messages
+from .projects import get_member_project, has_project_access, project_summary, user_projects
+
+__all__ = [
+    "card_by_id",
+    "get_member_project",
+    "has_project_access",
+    "latest_messages",
+    "max_card_position",
+    "project_summary",
+    "user_projects",
+]
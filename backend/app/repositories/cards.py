@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Card
+
+_CARD_BY_ID = select(Card).where(Card.id == bindparam("card_id"))
+_MAX_POSITION = select(func.max(Card.position)).where(
+    Card.column_id == bindparam("column_id"), Card.archived_at.is_(None)
+)
+
+
+async def card_by_id(db: AsyncSession, card_id: uuid.UUID) -> Card | None:
+    return await db.scalar(_CARD_BY_ID, {"card_id": card_id})
+
+
+async def max_card_position(db: AsyncSession, column_id: uuid.UUID) -> int | None:
+    return await db.scalar(_MAX_POSITION, {"column_id": column_id})
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Row, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Message, User
+
+# Rows in MessageRead's shape; the author's name comes from the join instead of a
+# per-message relationship load.
+_LATEST = (
+    select(
+        Message.id,
+        Message.project_id,
+        Message.user_id,
+        Message.content,
+        Message.created_at,
+        User.display_name.label("user_display_name"),
+    )
+    .outerjoin(User, User.id == Message.user_id)
+    .where(Message.project_id == bindparam("project_id"))
+    .order_by(Message.created_at.desc())
+    .limit(bindparam("limit"))
+)
+_LATEST_BEFORE = _LATEST.where(Message.created_at < bindparam("before"))
+
+
+async def latest_messages(
+    db: AsyncSession, project_id: uuid.UUID, limit: int, before: datetime | None = None
+) -> Sequence[Row]:
+    """Newest ``limit`` messages (older than ``before``) with the author's name, newest first."""
+    params = {"project_id": project_id, "limit": limit}
+    if before is None:
+        result = await db.execute(_LATEST, params)
+    else:
+        result = await db.execute(_LATEST_BEFORE, {**params, "before": before})
+    return result.all()
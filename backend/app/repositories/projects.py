@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Row, and_, bindparam, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Member, Project, ProjectStats
+
+_IS_MEMBER = or_(
+    Project.owner_id == bindparam("user_id"),
+    Project.id.in_(select(Member.project_id).where(Member.user_id == bindparam("user_id"))),
+)
+_OWNED_PROJECT = select(Project).where(
+    Project.id == bindparam("project_id"), Project.owner_id == bindparam("user_id")
+)
+_MEMBER_PROJECT = select(Project).where(Project.id == bindparam("project_id"), _IS_MEMBER)
+_HAS_ACCESS = select(Project.id).where(Project.id == bindparam("project_id"), _IS_MEMBER)
+
+# Projects in ProjectRead's shape with the counters from project_stats. (project_id, user_id)
+# is the members primary key, so the join matches at most one row per project: a semi-join
+# that also yields the user's read mark, with no DISTINCT or sort over member rows.
+_SUMMARY = (
+    select(
+        Project.id,
+        Project.name,
+        Project.owner_id,
+        Project.created_at,
+        func.coalesce(ProjectStats.card_count, 0).label("card_count"),
+        func.coalesce(ProjectStats.open_card_count, 0).label("open_card_count"),
+        func.coalesce(ProjectStats.member_count, 0).label("member_count"),
+        func.greatest(
+            func.coalesce(ProjectStats.message_count, 0) - Member.read_message_count, 0
+        ).label("unread_count"),
+    )
+    .join(Member, and_(Member.project_id == Project.id, Member.user_id == bindparam("user_id")))
+    .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+)
+_PROJECT_SUMMARY = _SUMMARY.where(Project.id == bindparam("project_id"))
+_USER_PROJECTS = _SUMMARY.order_by(Project.created_at.desc(), Project.id.desc()).limit(
+    bindparam("limit")
+)
+_USER_PROJECTS_AFTER = _USER_PROJECTS.where(
+    tuple_(Project.created_at, Project.id)
+    < tuple_(
+        bindparam("created_at", type_=Project.created_at.type),
+        bindparam("id", type_=Project.id.type),
+    )
+)
+
+
+async def get_member_project(
+    db: AsyncSession, project_id: uuid.UUID, user_id: uuid.UUID, owner_only: bool = False
+) -> Project | None:
+    stmt = _OWNED_PROJECT if owner_only else _MEMBER_PROJECT
+    return await db.scalar(stmt, {"project_id": project_id, "user_id": user_id})
+
+
+async def has_project_access(db: AsyncSession, project_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    return await db.scalar(_HAS_ACCESS, {"project_id": project_id, "user_id": user_id}) is not None
+
+
+async def project_summary(
+    db: AsyncSession, project_id: uuid.UUID, user_id: uuid.UUID
+) -> Row | None:
+    result = await db.execute(_PROJECT_SUMMARY, {"project_id": project_id, "user_id": user_id})
+    return result.one_or_none()
+
+
+async def user_projects(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    limit: int,
+    after: tuple[datetime, uuid.UUID] | None = None,
+) -> Sequence[Row]:
+    """The user's projects newest first, starting after the ``(created_at, id)`` key ``after``."""
+    params = {"user_id": user_id, "limit": limit}
+    if after is None:
+        result = await db.execute(_USER_PROJECTS, params)
+    else:
+        result = await db.execute(
+            _USER_PROJECTS_AFTER, {**params, "created_at": after[0], "id": after[1]}
+        )
+    return result.all()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+from .base import ORMModel
+
+
+class ColumnWip(ORMModel):
+    column_id: uuid.UUID
+    name: str
+    order: int
+    cards: int
+
+
+class WipReport(ORMModel):
+    columns: list[ColumnWip]
+    total: int
+
+
+class FlowSeries(ORMModel):
+    column_id: uuid.UUID
+    name: str
+    counts: list[int]
+
+
+class CumulativeFlow(ORMModel):
+    start: date
+    end: date
+    days: list[date]
+    columns: list[FlowSeries]
+
+
+class DurationStats(ORMModel):
+    avg_hours: float | None = None
+    p50_hours: float | None = None
+    p85_hours: float | None = None
+    p95_hours: float | None = None
+
+
+class CycleTimeReport(ORMModel):
+    start: date
+    end: date
+    completed: int
+    cycle_time: DurationStats
+    lead_time: DurationStats
@@ -44,7 +44,25 @@ class CardSummary(ORMModel):
     updated_at: datetime
 
 
+class ColumnWindow(ORMModel):
+    column_id: uuid.UUID
+    total: int
+    next_cursor: str | None = None
+
+
 class BoardSnapshot(ORMModel):
     board_id: uuid.UUID
     columns: list[ColumnRead]
     cards: list[CardSummary]
+    windows: list[ColumnWindow] | None = None
+
+
+class ColumnCardsPage(ORMModel):
+    column_id: uuid.UUID
+    items: list[CardSummary]
+    next_cursor: str | None = None
+
+
+class ColumnArchiveResult(ORMModel):
+    column_id: uuid.UUID
+    archived: int
@@ -52,3 +52,9 @@ class CardRead(ORMModel):
     version: int
     created_at: datetime
     updated_at: datetime
+    archived_at: datetime | None = None
+
+
+class CardPage(ORMModel):
+    items: list[CardRead]
+    next_cursor: str | None = None
@@ -3,6 +3,11 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
+from pydantic import Field, computed_field
+
+from app.core.config import settings
+from app.services import thumbnails
+
 from .base import ORMModel
 
 
@@ -10,7 +15,55 @@ class FileRead(ORMModel):
     id: uuid.UUID
     project_id: uuid.UUID
     user_id: uuid.UUID | None
+    name: str | None = None
+    blob_digest: str | None = None
     path: str
     mime: str
     size: int
+    thumbnail_sizes: list[int] = Field(default_factory=list)
     created_at: datetime
+
+    @computed_field
+    @property
+    def thumbnails(self) -> dict[str, str]:
+        """Thumbnail URL per size bucket; a bucket that is not rendered yet is made on request.
+
+        Empty when this worker cannot render the file (no Pillow, or not a raster image).
+        """
+        if self.blob_digest is None or not thumbnails.supports(self.mime):
+            return {}
+        base = f"{settings.api_v1_prefix}/files/{self.id}/thumbnail"
+        return {str(size): f"{base}?size={size}" for size in sorted(settings.thumbnail_sizes)}
+
+
+class FilePage(ORMModel):
+    items: list[FileRead]
+    next_cursor: str | None = None
+    total_count: int
+    total_bytes: int
+
+
+class FileFromDigest(ORMModel):
+    project_id: uuid.UUID
+    sha256: str = Field(pattern="^[0-9a-f]{64}$")
+    name: str = Field(min_length=1, max_length=255)
+    mime: str = Field(default="application/octet-stream", max_length=120)
+
+
+class UploadSessionCreate(ORMModel):
+    project_id: uuid.UUID
+    name: str = Field(min_length=1, max_length=255)
+    mime: str = Field(default="application/octet-stream", max_length=120)
+    size: int = Field(ge=0)
+    sha256: str | None = Field(default=None, pattern="^[0-9a-f]{64}$")
+
+
+class UploadSessionRead(ORMModel):
+    id: uuid.UUID
+    project_id: uuid.UUID
+    name: str
+    mime: str
+    size: int
+    offset: int = Field(validation_alias="received")
+    chunk_max_size: int
+    updated_at: datetime
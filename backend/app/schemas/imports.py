@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Annotated, Literal, NotRequired
+
+from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
+
+
+# Records are TypedDicts rather than models: validating straight into dicts is several
+# times faster, which matters at tens of thousands of rows per second.
+class ImportColumn(TypedDict):
+    type: Literal["column"]
+    name: Annotated[str, Field(min_length=1, max_length=120)]
+    order: NotRequired[int | None]
+
+
+class ImportCard(TypedDict):
+    type: Literal["card"]
+    column: Annotated[str, Field(min_length=1, max_length=120)]
+    title: Annotated[str, Field(min_length=1, max_length=255)]
+    description: NotRequired[str | None]
+    labels: NotRequired[list[dict] | list[str]]
+    assignees: NotRequired[list[str]]
+    priority: NotRequired[Annotated[str, Field(pattern="^(low|medium|high)$")] | None]
+    due_date: NotRequired[date | None]
+    position: NotRequired[int | None]
+
+
+class ImportMessage(TypedDict):
+    type: Literal["message"]
+    content: Annotated[str, Field(min_length=1, max_length=2000)]
+    created_at: NotRequired[datetime | None]
+
+
+ImportRecord = Annotated[ImportColumn | ImportCard | ImportMessage, Field(discriminator="type")]
+
+
+class ImportIssue(BaseModel):
+    line: int
+    message: str
+
+
+class ImportResult(BaseModel):
+    columns: int
+    cards: int
+    messages: int
@@ -17,6 +17,15 @@ class ProjectRead(ORMModel):
     name: str
     owner_id: uuid.UUID
     created_at: datetime
+    card_count: int = 0
+    open_card_count: int = 0
+    member_count: int = 0
+    unread_count: int = 0
+
+
+class ProjectPage(ORMModel):
+    items: list[ProjectRead]
+    next_cursor: str | None = None
 
 
 class ProjectList(ORMModel):
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Literal
+
+from .base import ORMModel
+
+
+class SearchHit(ORMModel):
+    kind: Literal["card", "message"]
+    id: uuid.UUID
+    column_id: uuid.UUID | None = None
+    title: str | None = None
+    # HTML-escaped text with matches wrapped in <mark>.
+    highlight: str
+    rank: float
+    created_at: datetime
+    archived_at: datetime | None = None
+
+
+class SearchPage(ORMModel):
+    items: list[SearchHit]
+    next_cursor: str | None = None
@@ -0,0 +1,123 @@
+"""Board analytics read from the rollups the ``cards_analytics`` trigger maintains.
+
+``column_daily_flow`` holds how many cards entered and left each column per UTC day, so a
+column's card count at the end of a day is the sum of its net flow up to that day.
+Archiving a card counts as leaving its column and restoring it as entering, so these
+counts cover the board, not the archive. ``card_cycles`` holds each card's creation, first
+move and completion times; archived cards keep theirs, deleted cards lose them. Neither query
+touches ``cards``; a year of history is at most a few thousand rows per project.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Board, CardCycle, Column, ColumnDailyFlow
+
+HOUR = 3600
+
+
+async def board_columns(db: AsyncSession, project_id: uuid.UUID) -> Sequence[Row]:
+    stmt = (
+        select(Column.id, Column.name, Column.order)
+        .join(Board, Board.id == Column.board_id)
+        .where(Board.project_id == project_id)
+        .order_by(Column.order, Column.id)
+    )
+    return (await db.execute(stmt)).all()
+
+
+async def column_wip(db: AsyncSession, project_id: uuid.UUID) -> dict[str, Any]:
+    stmt = select(
+        ColumnDailyFlow.column_id, func.sum(ColumnDailyFlow.entered - ColumnDailyFlow.exited)
+    ).where(ColumnDailyFlow.project_id == project_id).group_by(ColumnDailyFlow.column_id)
+    net = dict((await db.execute(stmt)).all())
+    columns = [
+        {
+            "column_id": column.id,
+            "name": column.name,
+            "order": column.order,
+            "cards": net.get(column.id, 0),
+        }
+        for column in await board_columns(db, project_id)
+    ]
+    return {"columns": columns, "total": sum(column["cards"] for column in columns)}
+
+
+async def cumulative_flow(
+    db: AsyncSession, project_id: uuid.UUID, start: date, end: date
+) -> dict[str, Any]:
+    net = ColumnDailyFlow.entered - ColumnDailyFlow.exited
+    in_project = ColumnDailyFlow.project_id == project_id
+    before = select(ColumnDailyFlow.column_id, func.sum(net)).where(
+        in_project, ColumnDailyFlow.day < start
+    )
+    running = dict((await db.execute(before.group_by(ColumnDailyFlow.column_id))).all())
+    daily = select(ColumnDailyFlow.day, ColumnDailyFlow.column_id, net).where(
+        in_project, ColumnDailyFlow.day.between(start, end)
+    )
+    deltas = {(day, column_id): delta for day, column_id, delta in (await db.execute(daily)).all()}
+
+    days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    series = []
+    for column in await board_columns(db, project_id):
+        count = running.get(column.id, 0)
+        counts = []
+        for day in days:
+            count += deltas.get((day, column.id), 0)
+            counts.append(count)
+        series.append({"column_id": column.id, "name": column.name, "counts": counts})
+    return {"start": start, "end": end, "days": days, "columns": series}
+
+
+def _duration_stats(values: Sequence[float | None]) -> dict[str, float | None]:
+    names = ("avg_hours", "p50_hours", "p85_hours", "p95_hours")
+    return {
+        name: None if value is None else round(value / HOUR, 2)
+        for name, value in zip(names, values)
+    }
+
+
+async def cycle_time(
+    db: AsyncSession, project_id: uuid.UUID, start: date, end: date
+) -> dict[str, Any]:
+    """Cycle time runs from the first move (or creation) to done, lead time from creation."""
+    cycle = func.extract(
+        "epoch", CardCycle.done_at - func.coalesce(CardCycle.started_at, CardCycle.created_at)
+    )
+    lead = func.extract("epoch", CardCycle.done_at - CardCycle.created_at)
+    stmt = select(
+        func.count(),
+        *(
+            aggregate
+            for seconds in (cycle, lead)
+            for aggregate in (
+                func.avg(seconds),
+                func.percentile_cont(0.5).within_group(seconds),
+                func.percentile_cont(0.85).within_group(seconds),
+                func.percentile_cont(0.95).within_group(seconds),
+            )
+        ),
+    ).where(
+        CardCycle.project_id == project_id,
+        CardCycle.done_at >= datetime.combine(start, time.min, UTC),
+        CardCycle.done_at < datetime.combine(end + timedelta(days=1), time.min, UTC),
+    )
+    completed, *values = (await db.execute(stmt)).one()
+    return {
+        "start": start,
+        "end": end,
+        "completed": completed,
+        "cycle_time": _duration_stats(
+            [None if value is None else float(value) for value in values[:4]]
+        ),
+        "lead_time": _duration_stats(
+            [None if value is None else float(value) for value in values[4:]]
+        ),
+    }
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from anyio import to_thread
+from fastapi import UploadFile
+from sqlalchemy import delete, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models import Blob, FileAsset, Member
+from app.services.storage import save_upload
+
+GC_BATCH_SIZE = 500
+
+
+def blob_path(digest: str) -> Path:
+    return Path(settings.uploads_dir) / "blobs" / digest[:2] / digest[2:4] / digest
+
+
+@dataclass(slots=True)
+class StagedBlob:
+    digest: str
+    size: int
+    temp_path: Path
+
+
+async def stage_upload(upload: UploadFile, max_size: int) -> StagedBlob:
+    """Stream an upload to a temporary file, hashing it on the way."""
+    temp_path = Path(settings.uploads_dir) / "tmp" / uuid.uuid4().hex
+    hasher = hashlib.sha256()
+    size = await save_upload(upload, temp_path, max_size, hasher=hasher)
+    return StagedBlob(digest=hasher.hexdigest(), size=size, temp_path=temp_path)
+
+
+def _place(temp_path: Path, final_path: Path, inserted: bool) -> None:
+    if inserted or not final_path.exists():
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_path, final_path)
+    else:
+        temp_path.unlink(missing_ok=True)
+
+
+@asynccontextmanager
+async def commit_blob(db: AsyncSession, staged: StagedBlob) -> AsyncIterator[Path]:
+    """Register ``staged`` as a blob and move it into place; the block commits ``db``.
+
+    The file is placed before the commit, so a committed blob row always has its file. If
+    the block fails (the commit included), a file this call placed for a new row is removed
+    again; content already stored under an existing row is left alone. The temporary file
+    is removed either way.
+    """
+    try:
+        # The upsert takes a row lock that the garbage collector skips, so the blob cannot be
+        # reclaimed between here and the commit that inserts the referencing FileAsset.
+        inserted = bool(
+            await db.scalar(
+                insert(Blob)
+                .values(digest=staged.digest, size=staged.size)
+                .on_conflict_do_update(index_elements=[Blob.digest], set_={"size": staged.size})
+                .returning(literal_column("xmax = 0"))
+            )
+        )
+        final_path = blob_path(staged.digest)
+        await to_thread.run_sync(_place, staged.temp_path, final_path, inserted)
+        try:
+            yield final_path
+        except BaseException:
+            if inserted:
+                await to_thread.run_sync(final_path.unlink, True)
+            raise
+    finally:
+        await discard_staged(staged)
+
+
+async def discard_staged(staged: StagedBlob) -> None:
+    await to_thread.run_sync(staged.temp_path.unlink, True)
+
+
+async def acquire_blob(db: AsyncSession, digest: str, user_id: uuid.UUID) -> Blob | None:
+    """The blob ``digest``, if a file in one of the user's projects already references it.
+
+    Content the user has no access to is reported like an unknown digest, so the digest of
+    someone else's file neither reveals that it exists nor lets its content be attached.
+    """
+    visible = (
+        select(FileAsset.id)
+        .join(Member, Member.project_id == FileAsset.project_id)
+        .where(FileAsset.blob_digest == digest, Member.user_id == user_id)
+    )
+    blob = await db.scalar(
+        select(Blob)
+        .where(Blob.digest == digest, visible.exists())
+        .with_for_update(read=True, of=Blob)
+    )
+    if blob is None:
+        return None
+    if not await to_thread.run_sync(blob_path(digest).exists):
+        return None
+    return blob
+
+
+def _unlink_blobs(digests: list[str]) -> None:
+    for digest in digests:
+        path = blob_path(digest)
+        path.unlink(missing_ok=True)
+        # Derivatives (thumbnails) live next to the blob as ``<digest>.<suffix>``.
+        for derivative in path.parent.glob(f"{digest}.*"):
+            derivative.unlink(missing_ok=True)
+
+
+async def collect_garbage(limit: int = GC_BATCH_SIZE) -> int:
+    async with AsyncSessionLocal() as db:
+        candidates = (
+            select(Blob.digest)
+            .where(Blob.refcount <= literal_column("0"))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            delete(Blob).where(Blob.digest.in_(candidates)).returning(Blob.digest)
+        )
+        digests = list(result.scalars())
+        # Unlink before committing: an upload racing on the same digest waits on these row
+        # locks and re-creates the file after we are done.
+        await to_thread.run_sync(_unlink_blobs, digests)
+        await db.commit()
+    return len(digests)
+
+
+async def collect_all_garbage() -> None:
+    while await collect_garbage() == GC_BATCH_SIZE:
+        pass
@@ -5,6 +5,8 @@ from typing import Any
 from fastapi.encoders import jsonable_encoder
 from socketio import AsyncServer
 
+from app.services.metrics import observe_broadcast
+
 NAMESPACE = "/ws"
 
 _socket: AsyncServer | None = None
@@ -19,4 +21,6 @@ async def broadcast(event: str, payload: Any, room: str | None = None) -> None:
     if _socket is None:
         return
     encoded = jsonable_encoder(payload)
+    rooms = _socket.manager.rooms.get(NAMESPACE, {})
+    observe_broadcast(event, len(rooms.get(room, ())))
     await _socket.emit(event, encoded, room=room, namespace=NAMESPACE)
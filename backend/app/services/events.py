@@ -4,6 +4,8 @@ import uuid
 
 from redis.asyncio import Redis
 
+from app.services.metrics import DEDUP_CHECKS
+
 
 class EventDeduplicator:
     def __init__(self, redis: Redis, ttl_seconds: int = 120):
@@ -15,5 +17,7 @@ class EventDeduplicator:
         added = await self.redis.setnx(key, "1")
         if added:
             await self.redis.expire(key, self.ttl)
+            DEDUP_CHECKS.labels("miss").inc()
             return False
+        DEDUP_CHECKS.labels("hit").inc()
         return True
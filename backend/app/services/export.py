@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import io
+import uuid
+import zipfile
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from pathlib import Path
+
+from anyio import to_thread
+from sqlalchemy import Row, Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.db.session import session_for
+from app.models import Board, Card, Column, FileAsset, Message
+from app.services.storage import READ_CHUNK_SIZE
+from app.utils.json import dumps
+
+EXPORT_BATCH_SIZE = 500
+# Entries this large get zip64 headers up front; deflate may grow incompressible data.
+ZIP64_THRESHOLD = 1024 * 1024 * 1024
+
+FILE_COLUMNS = (
+    FileAsset.id,
+    FileAsset.name,
+    FileAsset.path,
+    FileAsset.mime,
+    FileAsset.size,
+    FileAsset.blob_digest,
+    FileAsset.created_at,
+)
+
+# Formats that are already compressed: deflating them again only burns CPU.
+COMPRESSED_MIME_PREFIXES = (
+    "image/jpeg",
+    "image/png",
+    "image/gif",
+    "image/webp",
+    "image/avif",
+    "image/heic",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-7z-compressed",
+    "application/x-rar-compressed",
+    "application/vnd.rar",
+    "application/x-bzip2",
+    "application/x-xz",
+    "application/zstd",
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.",
+    "application/vnd.oasis.opendocument.",
+    "application/epub+zip",
+)
+
+
+def is_compressed(mime: str) -> bool:
+    return mime.startswith(COMPRESSED_MIME_PREFIXES)
+
+
+class _ZipSink(io.RawIOBase):
+    """Non-seekable target for ``zipfile``: collects written bytes until they are drained."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _entry(name: str, modified: datetime | None, compress: bool) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=(modified or datetime.now()).timetuple()[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def _export_columns(model) -> list:
+    return [column for column in model.__table__.c if column.key != "search_vector"]
+
+
+def _archive_name(file_record: Row) -> str:
+    name = file_record.name or Path(file_record.path).name
+    return f"files/{file_record.id}/{name.replace('/', '_')}"
+
+
+def _open_source(path: str) -> io.BufferedReader | None:
+    try:
+        return open(path, "rb")
+    except FileNotFoundError:
+        return None
+
+
+def _row_dict(row: Row) -> dict:
+    return row._asdict()
+
+
+async def _no_pages() -> AsyncIterator[Sequence[Row]]:
+    return
+    yield
+
+
+def _copy_chunk(source: io.BufferedReader, target) -> bool:
+    chunk = source.read(READ_CHUNK_SIZE)
+    if not chunk:
+        return False
+    target.write(chunk)
+    return True
+
+
+async def _keyset_pages(
+    db: AsyncSession, stmt: Select, keys: tuple, until: tuple | None = None
+) -> AsyncIterator[Sequence[Row]]:
+    """Batches of ``stmt`` in order of the unique ``keys``, each read in its own transaction.
+
+    No transaction (or server-side cursor) stays open while a batch is sent to a slow
+    client. ``until`` caps the keys, for a second pass over rows seen before.
+    """
+    if until is not None:
+        stmt = stmt.where(tuple_(*keys) <= tuple_(*until))
+    after = None
+    while True:
+        page = stmt if after is None else stmt.where(tuple_(*keys) > tuple_(*after))
+        batch = (await db.execute(page.order_by(*keys).limit(EXPORT_BATCH_SIZE))).all()
+        await db.commit()
+        if batch:
+            yield batch
+        if len(batch) < EXPORT_BATCH_SIZE:
+            return
+        after = tuple(getattr(batch[-1], key.key) for key in keys)
+
+
+async def stream_project_export(
+    project_id: uuid.UUID, bind: AsyncEngine | None = None
+) -> AsyncIterator[bytes]:
+    """Yield a ZIP archive of the project's board, cards, chat and files.
+
+    The archive is written with data descriptors, so nothing is buffered beyond one
+    batch of rows or one file chunk and no temporary file is needed. Rows are paged by
+    key in short transactions, so the sections are not one snapshot: a row changed
+    mid-export appears as it was when its batch was read. Compression and disk reads run
+    in worker threads.
+    """
+    sink = _ZipSink()
+    archive = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED, allowZip64=True)
+
+    async with session_for(bind) as db:
+
+        async def write_ndjson(
+            name: str, pages: AsyncIterator[Sequence[Row]], encode=_row_dict
+        ) -> AsyncIterator[bytes]:
+            entry = archive.open(_entry(name, None, compress=True), mode="w", force_zip64=True)
+            async for rows in pages:
+                lines = b"".join(dumps(encode(row)) + b"\n" for row in rows)
+                await to_thread.run_sync(entry.write, lines)
+                if chunk := sink.drain():
+                    yield chunk
+            await to_thread.run_sync(entry.close)
+            yield sink.drain()
+
+        board_ids = select(Board.id).where(Board.project_id == project_id)
+        columns = select(Column.id).where(Column.board_id.in_(board_ids))
+        column_ids = (await db.scalars(columns)).all()
+        await db.commit()
+
+        async def card_pages() -> AsyncIterator[Sequence[Row]]:
+            # Column by column, so each page is a range of idx_cards_column_pos.
+            cards = select(*_export_columns(Card)).where(Card.project_id == project_id)
+            for column_id in sorted(column_ids):
+                in_column = cards.where(Card.column_id == column_id)
+                async for batch in _keyset_pages(db, in_column, (Card.position, Card.id)):
+                    yield batch
+
+        sections = [
+            (
+                "boards.ndjson",
+                _keyset_pages(
+                    db,
+                    select(*_export_columns(Board)).where(Board.project_id == project_id),
+                    (Board.id,),
+                ),
+            ),
+            (
+                "columns.ndjson",
+                _keyset_pages(
+                    db,
+                    select(*_export_columns(Column)).where(Column.board_id.in_(board_ids)),
+                    (Column.board_id, Column.order, Column.id),
+                ),
+            ),
+            ("cards.ndjson", card_pages()),
+            (
+                "messages.ndjson",
+                _keyset_pages(
+                    db,
+                    select(*_export_columns(Message)).where(Message.project_id == project_id),
+                    (Message.created_at, Message.id),
+                ),
+            ),
+        ]
+        for name, pages in sections:
+            async for chunk in write_ndjson(name, pages):
+                yield chunk
+
+        files = select(*FILE_COLUMNS).where(FileAsset.project_id == project_id)
+        file_keys = (FileAsset.created_at, FileAsset.id)
+        # Only files whose blob is gone are remembered; files.ndjson is paged again below.
+        missing: set[uuid.UUID] = set()
+        last = None
+        async for batch in _keyset_pages(db, files, file_keys):
+            last = (batch[-1].created_at, batch[-1].id)
+            for file_record in batch:
+                source = await to_thread.run_sync(_open_source, file_record.path)
+                if source is None:
+                    missing.add(file_record.id)
+                    continue
+                info = _entry(
+                    _archive_name(file_record),
+                    file_record.created_at,
+                    compress=not is_compressed(file_record.mime),
+                )
+                force_zip64 = file_record.size >= ZIP64_THRESHOLD
+                entry = archive.open(info, mode="w", force_zip64=force_zip64)
+                try:
+                    while await to_thread.run_sync(_copy_chunk, source, entry):
+                        if chunk := sink.drain():
+                            yield chunk
+                    await to_thread.run_sync(entry.close)
+                finally:
+                    source.close()
+                yield sink.drain()
+
+        def manifest_entry(file_record: Row) -> dict:
+            return {
+                "id": file_record.id,
+                "name": file_record.name,
+                "mime": file_record.mime,
+                "size": file_record.size,
+                "sha256": file_record.blob_digest,
+                "created_at": file_record.created_at,
+                "path": None if file_record.id in missing else _archive_name(file_record),
+            }
+
+        # Capped at the last file of the first pass: files uploaded since are not in the
+        # archive. Files deleted since are, but drop out of the manifest.
+        manifest = _keyset_pages(db, files, file_keys, until=last) if last else _no_pages()
+        async for chunk in write_ndjson("files.ndjson", manifest, manifest_entry):
+            yield chunk
+
+    archive.close()
+    yield sink.drain()
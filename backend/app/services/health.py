@@ -0,0 +1,106 @@
+"""Liveness and readiness probes answered from memory.
+
+``/livez`` only shows that the process serves HTTP. ``/readyz`` reports the latest
+Postgres and Redis checks, which a background task runs every
+``HEALTH_CHECK_INTERVAL_SECONDS`` with a timeout of its own. It also reports pool
+saturation and event-loop lag. A probe never touches a dependency, so probe traffic does
+not load the database, and a slow database cannot pile probes up. A check that has not
+run for three intervals counts as failed, so a stuck checker cannot keep a pod ready.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from loguru import logger
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import async_engine, pool_status
+from app.services.looplag import monitor as loop_monitor
+from app.services.redis import get_redis
+
+
+@dataclass(slots=True)
+class DependencyHealth:
+    ok: bool = False
+    latency_seconds: float | None = None
+    error: str | None = None
+    checked_at: float | None = None
+
+    def fresh(self, now: float) -> bool:
+        return (
+            self.checked_at is not None
+            and now - self.checked_at <= settings.health_check_interval_seconds * 3
+        )
+
+    def report(self, now: float) -> dict:
+        return {
+            "ok": self.ok and self.fresh(now),
+            "latency_ms": (
+                None if self.latency_seconds is None else round(self.latency_seconds * 1000, 2)
+            ),
+            "age_seconds": None if self.checked_at is None else round(now - self.checked_at, 1),
+            "error": self.error if self.fresh(now) else self.error or "not checked recently",
+        }
+
+
+async def _ping_postgres() -> None:
+    async with async_engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def _ping_redis() -> None:
+    await get_redis().ping()
+
+
+class HealthChecker:
+    def __init__(self) -> None:
+        self.postgres = DependencyHealth()
+        self.redis = DependencyHealth()
+
+    async def check(self) -> None:
+        await asyncio.gather(
+            self._check(self.postgres, _ping_postgres), self._check(self.redis, _ping_redis)
+        )
+
+    async def _check(self, health: DependencyHealth, ping: Callable[[], Awaitable[None]]) -> None:
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(ping(), settings.health_check_timeout_seconds)
+        except Exception as exc:  # noqa: BLE001 - any failed ping marks the dependency down
+            if health.ok or health.checked_at is None:
+                logger.warning("Health check {} failed: {!r}", ping.__name__, exc)
+            health.ok, health.error = False, repr(exc)
+        else:
+            if not health.ok and health.checked_at is not None:
+                logger.info("Health check {} recovered", ping.__name__)
+            health.ok, health.error = True, None
+        health.checked_at = now = time.monotonic()
+        health.latency_seconds = now - started
+
+    def readiness(self) -> tuple[bool, dict]:
+        now = time.monotonic()
+        postgres, redis = self.postgres.report(now), self.redis.report(now)
+        lag_ok = loop_monitor.lag <= settings.readiness_max_loop_lag_seconds
+        ready = postgres["ok"] and redis["ok"] and lag_ok
+        return ready, {
+            "status": "ready" if ready else "not ready",
+            "postgres": postgres,
+            "redis": redis,
+            "loop_lag_ms": round(loop_monitor.lag * 1000, 2),
+            "pools": {
+                name: {
+                    "saturation": pool["saturation"],
+                    "checked_out": pool["checked_out"],
+                    "size": pool["size"],
+                }
+                for name, pool in pool_status().items()
+            },
+        }
+
+
+checker = HealthChecker()
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import csv
+import json
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any, Literal
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Board
+from app.schemas.imports import ImportIssue, ImportRecord, ImportResult
+
+ImportFormat = Literal["ndjson", "csv"]
+ImportKind = Literal["columns", "cards", "messages"]
+
+COPY_BATCH_SIZE = 10_000
+MAX_REPORTED_ISSUES = 20
+CSV_LIST_SEPARATOR = ";"
+
+_record_adapter: TypeAdapter[ImportRecord] = TypeAdapter(ImportRecord)
+_csv_types: dict[ImportKind, str] = {"columns": "column", "cards": "card", "messages": "message"}
+
+# Temp tables live for the import transaction only. Rows keep their input line number
+# (``seq``) so the final INSERT ... SELECT preserves file order.
+_STAGING = {
+    "column": (
+        "import_columns",
+        ("seq", "name", "sort_order"),
+        "seq integer NOT NULL, name text NOT NULL, sort_order integer",
+    ),
+    "card": (
+        "import_cards",
+        (
+            "seq", "column_name", "title", "description", "labels", "assignees", "priority",
+            "due_date", "position"
+        ),
+        (
+            "seq integer NOT NULL, column_name text NOT NULL, title text NOT NULL, "
+            "description text, labels jsonb NOT NULL, assignees jsonb NOT NULL, "
+            "priority text, due_date date, position integer"
+        ),
+    ),
+    "message": (
+        "import_messages",
+        ("seq", "content", "created_at"),
+        "seq integer NOT NULL, content text NOT NULL, created_at timestamptz",
+    ),
+}
+
+_IMPLICIT_COLUMNS = text(
+    """
+    INSERT INTO import_columns (seq, name)
+    SELECT min(seq), column_name FROM import_cards
+    WHERE column_name NOT IN (SELECT name FROM import_columns)
+    GROUP BY column_name
+    """
+)
+_INSERT_COLUMNS = text(
+    """
+    INSERT INTO columns (id, board_id, name, "order")
+    SELECT gen_random_uuid(), :board_id, s.name,
+           coalesce(s.sort_order, base.max_order + row_number() OVER (ORDER BY s.seq))
+    FROM (SELECT DISTINCT ON (name) * FROM import_columns ORDER BY name, seq) AS s
+    CROSS JOIN (
+        SELECT coalesce(max("order"), -1) AS max_order FROM columns WHERE board_id = :board_id
+    ) AS base
+    WHERE NOT EXISTS (SELECT 1 FROM columns c WHERE c.board_id = :board_id AND c.name = s.name)
+    """
+)
+_INSERT_CARDS = text(
+    """
+    INSERT INTO cards (
+        id, project_id, column_id, title, description, labels, assignees, priority, due_date,
+        position
+    )
+    SELECT gen_random_uuid(), :project_id, c.id, s.title, s.description, s.labels, s.assignees,
+           s.priority, s.due_date,
+           coalesce(
+               s.position,
+               coalesce(base.max_position, -1)
+               + row_number() OVER (PARTITION BY c.id ORDER BY s.seq)
+           )
+    FROM import_cards AS s
+    JOIN (
+        SELECT DISTINCT ON (name) id, name FROM columns
+        WHERE board_id = :board_id
+        ORDER BY name, "order"
+    ) AS c ON c.name = s.column_name
+    LEFT JOIN (
+        SELECT column_id, max(position) AS max_position FROM cards
+        WHERE project_id = :project_id
+        GROUP BY column_id
+    ) AS base ON base.column_id = c.id
+    """
+)
+_INSERT_MESSAGES = text(
+    """
+    INSERT INTO messages (id, project_id, user_id, content, created_at)
+    SELECT gen_random_uuid(), :project_id, :user_id, content, coalesce(created_at, now())
+    FROM import_messages
+    ORDER BY seq
+    """
+)
+
+
+class ImportFailed(Exception):
+    def __init__(self, issues: list[ImportIssue]) -> None:
+        super().__init__(f"{len(issues)} invalid record(s)")
+        self.issues = issues
+
+
+class ImportTooLarge(Exception):
+    """The body, or a single line of it, is over its size limit."""
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes], max_size: int, max_line_size: int
+) -> AsyncIterator[bytes]:
+    """Split the body into lines; a line may span any number of chunks."""
+    pending = bytearray()
+    received = 0
+    async for chunk in chunks:
+        received += len(chunk)
+        if received > max_size:
+            raise ImportTooLarge(f"Body exceeds {max_size} bytes")
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            if len(pending) + end - start > max_line_size:
+                raise ImportTooLarge(f"A line exceeds {max_line_size} bytes")
+            if pending:
+                pending += chunk[start:end]
+                yield bytes(pending)
+                pending.clear()
+            else:
+                yield chunk[start:end]
+            start = end + 1
+        pending += chunk[start:]
+        if len(pending) > max_line_size:
+            raise ImportTooLarge(f"A line exceeds {max_line_size} bytes")
+    if pending:
+        yield bytes(pending)
+
+
+def _describe(exc: ValidationError) -> str:
+    error = exc.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+async def parse_ndjson(
+    lines: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, ImportRecord | str]]:
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            yield number, _record_adapter.validate_json(line)
+        except ValidationError as exc:
+            yield number, _describe(exc)
+
+
+def _csv_value(field: str, value: str) -> Any:
+    if field in ("labels", "assignees"):
+        return [item.strip() for item in value.split(CSV_LIST_SEPARATOR) if item.strip()]
+    return value
+
+
+async def parse_csv(
+    lines: AsyncIterator[bytes], kind: ImportKind
+) -> AsyncIterator[tuple[int, ImportRecord | str]]:
+    record_type = _csv_types[kind]
+    header: list[str] | None = None
+    buffered: list[str] = []
+    quotes = 0
+    number = start = 0
+    async for line in lines:
+        number += 1
+        decoded = line.decode("utf-8-sig" if number == 1 else "utf-8").rstrip("\r")
+        if not buffered:
+            start = number
+        buffered.append(decoded)
+        # A quoted field may contain newlines: keep reading until the quotes balance.
+        quotes += decoded.count('"')
+        if quotes % 2:
+            continue
+        record = "\n".join(buffered)
+        buffered, quotes = [], 0
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        data = {
+            field: _csv_value(field, value) for field, value in zip(header, values) if value != ""
+        }
+        data["type"] = record_type
+        try:
+            yield start, _record_adapter.validate_python(data)
+        except ValidationError as exc:
+            yield start, _describe(exc)
+    if buffered:
+        yield start, "Unterminated quoted field"
+
+
+class BulkImporter:
+    """Stage validated records with ``COPY`` and move them into place in one transaction."""
+
+    def __init__(self, db: AsyncSession, project_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        self.db = db
+        self.project_id = project_id
+        self.user_id = user_id
+        self.board_id: uuid.UUID | None = None
+        self.issues: list[ImportIssue] = []
+        self._rows: dict[str, list[tuple]] = {kind: [] for kind in _STAGING}
+        self._copy_connection = None
+
+    async def start(self) -> uuid.UUID | None:
+        self.board_id = await self.db.scalar(
+            select(Board.id).where(Board.project_id == self.project_id)
+        )
+        if self.board_id is None:
+            return None
+        for table, _, definition in _STAGING.values():
+            await self.db.execute(text(f"CREATE TEMP TABLE {table} ({definition}) ON COMMIT DROP"))
+        # COPY has to go through the driver connection; it runs inside the transaction
+        # the session has already opened on it.
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        self._copy_connection = raw.driver_connection
+        return self.board_id
+
+    async def consume(self, records: AsyncIterator[tuple[int, ImportRecord | str]]) -> None:
+        async for line, record in records:
+            if isinstance(record, str):
+                if len(self.issues) < MAX_REPORTED_ISSUES:
+                    self.issues.append(ImportIssue(line=line, message=record))
+                continue
+            if self.issues:
+                # Keep validating to report more problems, but stop staging rows.
+                continue
+            record_type = record["type"]
+            rows = self._rows[record_type]
+            rows.append(self._row(line, record))
+            if len(rows) >= COPY_BATCH_SIZE:
+                await self._copy(record_type)
+        if self.issues:
+            raise ImportFailed(self.issues)
+        for kind in _STAGING:
+            await self._copy(kind)
+
+    async def finish(self) -> ImportResult:
+        params = {"project_id": self.project_id, "board_id": self.board_id, "user_id": self.user_id}
+        await self.db.execute(_IMPLICIT_COLUMNS)
+        columns = await self.db.execute(_INSERT_COLUMNS, params)
+        cards = await self.db.execute(_INSERT_CARDS, params)
+        messages = await self.db.execute(_INSERT_MESSAGES, params)
+        return ImportResult(
+            columns=columns.rowcount, cards=cards.rowcount, messages=messages.rowcount
+        )
+
+    @staticmethod
+    def _row(line: int, record: ImportRecord) -> tuple:
+        record_type = record["type"]
+        if record_type == "card":
+            return (
+                line,
+                record["column"],
+                record["title"],
+                record.get("description"),
+                json.dumps(record.get("labels", [])),
+                json.dumps(record.get("assignees", [])),
+                record.get("priority"),
+                record.get("due_date"),
+                record.get("position"),
+            )
+        if record_type == "column":
+            return (line, record["name"], record.get("order"))
+        return (line, record["content"], record.get("created_at"))
+
+    async def _copy(self, kind: str) -> None:
+        rows = self._rows[kind]
+        if not rows:
+            return
+        table, columns, _ = _STAGING[kind]
+        await self._copy_connection.copy_records_to_table(table, records=rows, columns=columns)
+        rows.clear()
@@ -0,0 +1,107 @@
+"""Event-loop lag monitor.
+
+A task on the loop sleeps for ``interval`` and measures how late it wakes up. That delay
+is the loop's lag. It goes to ``event_loop_lag_seconds`` and is kept for the readiness
+probe. The task cannot see what is blocking the loop, because it only runs once the
+block is over. A watchdog thread can: when the task's heartbeat is more than
+``threshold`` overdue, the watchdog reads the loop thread's stack while the callback is
+still running. It logs that stack, for example an Argon2 hash or a file write called
+without ``to_thread``. The most recent blocks stay available in :attr:`LoopMonitor.blocks`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from loguru import logger
+
+from app.core.config import settings
+from app.services.metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG_SECONDS
+from app.services.profiler import collapse
+
+
+@dataclass(slots=True)
+class LoopBlock:
+    at: datetime
+    stack: list[str]
+    # How long the loop was blocked; known once it runs the monitor again.
+    seconds: float | None = None
+
+
+@dataclass
+class LoopMonitor:
+    interval: float
+    threshold: float
+    keep: int = 50
+    lag: float = 0.0
+    lag_max: float = 0.0
+    blocks: deque[LoopBlock] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.blocks = deque(maxlen=self.keep)
+        self._heartbeat = time.monotonic()
+        self._blocked: LoopBlock | None = None
+        self._loop_thread: int | None = None
+        # The watchdog thread appends to ``blocks`` while the loop reads it.
+        self._blocks_lock = threading.Lock()
+
+    async def run(self) -> None:
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        stop = threading.Event()
+        threading.Thread(
+            target=self._watch, args=(stop,), name="loop-watchdog", daemon=True
+        ).start()
+        try:
+            while True:
+                started = time.monotonic()
+                await asyncio.sleep(self.interval)
+                self._heartbeat = now = time.monotonic()
+                self.lag = max(now - started - self.interval, 0.0)
+                self.lag_max = max(self.lag_max, self.lag)
+                EVENT_LOOP_LAG_SECONDS.observe(self.lag)
+                if (blocked := self._blocked) is not None:
+                    self._blocked = None
+                    blocked.seconds = self.lag
+                    logger.warning(
+                        "Event loop was blocked for {:.3f}s in {}",
+                        self.lag,
+                        ";".join(blocked.stack[-8:]),
+                    )
+        finally:
+            stop.set()
+
+    def _watch(self, stop: threading.Event) -> None:
+        while not stop.wait(self.threshold / 4):
+            overdue = time.monotonic() - self._heartbeat - self.interval
+            if overdue < self.threshold or self._blocked is not None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            block = LoopBlock(at=datetime.now(UTC), stack=collapse(frame))
+            self._blocked = block
+            with self._blocks_lock:
+                self.blocks.append(block)
+            EVENT_LOOP_BLOCKS.inc()
+
+    def snapshot(self) -> dict:
+        with self._blocks_lock:
+            blocks = list(self.blocks)
+        return {
+            "lag_seconds": round(self.lag, 4),
+            "lag_max_seconds": round(self.lag_max, 4),
+            "blocks": [
+                {"at": block.at, "seconds": block.seconds, "stack": ";".join(block.stack)}
+                for block in reversed(blocks)
+            ],
+        }
+
+
+monitor = LoopMonitor(
+    interval=settings.loop_monitor_interval_seconds, threshold=settings.loop_block_threshold_seconds
+)
@@ -0,0 +1,194 @@
+"""Prometheus metrics, served at ``/metrics``.
+
+Hot paths only touch pre-registered histograms and counters (a dict lookup and a few
+additions under a lock). State the app already keeps, such as the pool statistics of
+``MeasuredQueuePool`` and the rate limiter's counters, is read at scrape time by
+``StatsCollector`` instead of being mirrored on every change.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Sub-millisecond to multi-second: Redis commands and cached reads sit at the low end.
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+    buckets=LATENCY_BUCKETS,
+)
+SOCKET_EVENT_SECONDS = Histogram(
+    "socketio_event_duration_seconds",
+    "Socket.IO event handler latency.",
+    ("event", "outcome"),
+    buckets=LATENCY_BUCKETS,
+)
+BROADCAST_EMITS = Counter(
+    "broadcast_emits_total", "Events emitted through bus.broadcast.", ("event",)
+)
+BROADCAST_ROOM_SIZE = Histogram(
+    "broadcast_room_size",
+    "Sockets connected to this worker in the room a broadcast goes to.",
+    ("event",),
+    buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250, 1000),
+)
+REDIS_COMMAND_SECONDS = Histogram(
+    "redis_command_duration_seconds",
+    "Redis command latency; a pipeline is one PIPELINE observation.",
+    ("command",),
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERIES = Histogram(
+    "db_queries_per_operation",
+    "Database round trips per HTTP request (method and route template) or Socket.IO event.",
+    ("operation",),
+    buckets=(0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 50),
+)
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "event_loop_lag_seconds",
+    "How late the loop monitor's timer fired.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocks", "Callbacks that held the event loop longer than the block threshold."
+)
+DEDUP_CHECKS = Counter(
+    "event_dedup_checks_total",
+    "EventDeduplicator lookups by result (hit: duplicate event dropped).",
+    ("result",),
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Times every HTTP request; labelled with the route template to keep cardinality low."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the (shared) scope.
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"], getattr(route, "path", UNMATCHED_ROUTE), str(status)
+            ).observe(time.perf_counter() - started)
+
+
+def instrument_event(event: str, handler: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    ok = SOCKET_EVENT_SECONDS.labels(event, "ok")
+    error = SOCKET_EVENT_SECONDS.labels(event, "error")
+
+    @wraps(handler)
+    async def timed(*args: P.args, **kwargs: P.kwargs) -> R:
+        started = time.perf_counter()
+        try:
+            result = await handler(*args, **kwargs)
+        except BaseException:
+            error.observe(time.perf_counter() - started)
+            raise
+        ok.observe(time.perf_counter() - started)
+        return result
+
+    return timed
+
+
+def observe_broadcast(event: str, room_size: int) -> None:
+    BROADCAST_EMITS.labels(event).inc()
+    BROADCAST_ROOM_SIZE.labels(event).observe(room_size)
+
+
+class StatsCollector(Collector):
+    """Exports statistics kept elsewhere in the app when Prometheus scrapes."""
+
+    def __init__(
+        self,
+        pools: Callable[[], Mapping[str, Mapping[str, float]]],
+        rate_limits: Callable[[], Mapping[str, Mapping[tuple[str, str], int]]],
+    ) -> None:
+        self.pools = pools
+        self.rate_limits = rate_limits
+
+    def collect(self) -> Iterator[Metric]:
+        checkouts = CounterMetricFamily(
+            "db_pool_checkouts", "Connections handed out by the pool.", labels=["engine"]
+        )
+        timeouts = CounterMetricFamily(
+            "db_pool_checkout_timeouts",
+            "Checkouts that gave up waiting for a connection.",
+            labels=["engine"],
+        )
+        waited = CounterMetricFamily(
+            "db_pool_checkout_wait_seconds",
+            "Time spent waiting for a pool connection.",
+            labels=["engine"],
+        )
+        waited_max = GaugeMetricFamily(
+            "db_pool_checkout_wait_max_seconds",
+            "Longest wait for a pool connection.",
+            labels=["engine"],
+        )
+        checked_out = GaugeMetricFamily(
+            "db_pool_checked_out", "Connections currently in use.", labels=["engine"]
+        )
+        saturation = GaugeMetricFamily(
+            "db_pool_saturation",
+            "Connections in use over pool size plus overflow.",
+            labels=["engine"],
+        )
+        for engine, pool in self.pools().items():
+            checkouts.add_metric([engine], pool["checkouts"])
+            timeouts.add_metric([engine], pool["timeouts"])
+            waited.add_metric([engine], pool["wait_seconds_total"])
+            waited_max.add_metric([engine], pool["wait_seconds_max"])
+            checked_out.add_metric([engine], pool["checked_out"])
+            saturation.add_metric([engine], pool["saturation"])
+        yield from (checkouts, timeouts, waited, waited_max, checked_out, saturation)
+
+        checks = CounterMetricFamily(
+            "rate_limit_checks",
+            "Rate limit checks by policy, transport and result.",
+            labels=["policy", "transport", "result"],
+        )
+        for result, counts in self.rate_limits().items():
+            for (policy, transport), count in counts.items():
+                checks.add_metric([policy, transport, result], count)
+        yield checks
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from loguru import logger
+
+
+async def run_periodically(
+    name: str, interval_seconds: float, job: Callable[[], Awaitable[object]]
+) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await job()
+        except Exception:  # noqa: BLE001 - a failed run must not end the loop; it is logged
+            logger.exception("Periodic job {} failed", name)
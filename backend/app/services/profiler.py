@@ -0,0 +1,165 @@
+"""In-process sampling profiler for live workers.
+
+A sampler thread reads every thread's current frame (``sys._current_frames()``) at a fixed
+interval and folds the stacks into the collapsed format used by ``flamegraph.pl``,
+speedscope and similar tools: one ``root;caller;callee count`` line per distinct stack.
+
+* ``wall`` counts one sample per thread per tick, whether the thread runs or waits. It
+  also adds the await chain of every pending asyncio task under an ``asyncio-tasks`` root.
+  That shows where requests are parked, for example on a pool checkout or a Redis reply.
+* ``cpu`` weighs each thread's stack by the CPU time it used since the previous tick (in
+  microseconds, from the thread's CPU clock). Idle threads and idle loops drop out.
+  Blocking calls on the event loop thread show up directly.
+
+The sampler runs while the worker keeps serving. The profiled code is not instrumented, so
+its cost is one stack walk per thread per tick on the sampler thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from types import CodeType, FrameType
+from typing import Literal
+
+ProfileMode = Literal["wall", "cpu"]
+
+TASKS_ROOT = "asyncio-tasks"
+
+_labels: dict[CodeType, str] = {}
+_running = threading.Lock()
+
+
+class ProfilerBusy(RuntimeError):
+    """Another profile is running in this worker."""
+
+
+def frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    label = _labels.get(code)
+    if label is None:
+        # Line numbers are left out so that samples aggregate per function.
+        module = frame.f_globals.get("__name__", "?")
+        label = _labels[code] = f"{module}:{code.co_qualname}".replace(";", ",")
+    return label
+
+
+def collapse(frame: FrameType | None) -> list[str]:
+    """Frame labels from the outermost caller down to ``frame``."""
+    stack = []
+    while frame is not None:
+        stack.append(frame_label(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _await_chain(task: asyncio.Task) -> Iterator[str]:
+    coro = task.get_coro()
+    while coro is not None:
+        frame = (
+            getattr(coro, "cr_frame", None)
+            or getattr(coro, "ag_frame", None)
+            or getattr(coro, "gi_frame", None)
+        )
+        if frame is None:
+            return
+        yield frame_label(frame)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+
+
+def _thread_names(loop_thread: int | None) -> dict[int, str]:
+    names = {
+        thread.ident: thread.name for thread in threading.enumerate() if thread.ident is not None
+    }
+    if loop_thread is not None:
+        names[loop_thread] = f"event-loop ({names.get(loop_thread, loop_thread)})"
+    return names
+
+
+class SamplingProfiler:
+    def __init__(
+        self,
+        mode: ProfileMode,
+        interval: float,
+        loop: asyncio.AbstractEventLoop | None = None,
+        loop_thread: int | None = None,
+    ) -> None:
+        self.mode = mode
+        self.interval = interval
+        self.loop = loop
+        self.loop_thread = loop_thread
+        self.samples = 0
+        self.stacks: Counter[str] = Counter()
+        self._cpu_seen: dict[int, float] = {}
+
+    def run(self, seconds: float) -> Counter[str]:
+        """Sample for ``seconds`` on the calling thread; call it from a thread of its own."""
+        own = threading.get_ident()
+        deadline = time.monotonic() + seconds
+        next_tick = time.monotonic()
+        while next_tick < deadline:
+            self._sample(own)
+            next_tick += self.interval
+            time.sleep(max(next_tick - time.monotonic(), 0))
+        return self.stacks
+
+    def _sample(self, own: int) -> None:
+        self.samples += 1
+        names = _thread_names(self.loop_thread)
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            weight = 1 if self.mode == "wall" else self._cpu_microseconds(ident)
+            if weight:
+                root = f"thread:{names.get(ident, ident)}"
+                self.stacks[";".join([root, *collapse(frame)])] += weight
+
+        if self.mode == "wall" and self.loop is not None and not self.loop.is_closed():
+            # all_tasks() retries if the loop changes the task set mid-copy, so calling it
+            # from this thread is safe; a task only needs to stay alive while it is walked.
+            for task in asyncio.all_tasks(self.loop):
+                chain = list(_await_chain(task))
+                if chain:
+                    self.stacks[";".join([TASKS_ROOT, *chain])] += 1
+
+    def _cpu_microseconds(self, ident: int) -> int:
+        try:
+            used = time.clock_gettime(time.pthread_getcpuclockid(ident))
+        except (OSError, AttributeError):
+            # The thread has exited, or the platform has no per-thread CPU clocks.
+            return 0
+        previous = self._cpu_seen.get(ident)
+        self._cpu_seen[ident] = used
+        return 0 if previous is None else round((used - previous) * 1_000_000)
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+async def profile(seconds: float, mode: ProfileMode, interval: float) -> SamplingProfiler:
+    """Profile this worker for ``seconds`` while it keeps serving requests."""
+    if not _running.acquire(blocking=False):
+        raise ProfilerBusy("A profile is already running in this worker")
+    loop = asyncio.get_running_loop()
+    profiler = SamplingProfiler(mode, interval, loop, threading.get_ident())
+    done: asyncio.Future[None] = loop.create_future()
+
+    def sample() -> None:
+        try:
+            profiler.run(seconds)
+        except BaseException as exc:  # noqa: BLE001 - re-raised in the awaiting request
+            loop.call_soon_threadsafe(done.set_exception, exc)
+        else:
+            loop.call_soon_threadsafe(done.set_result, None)
+        finally:
+            _running.release()
+
+    # A thread of its own: the default executor may be busy with the very work being profiled.
+    threading.Thread(target=sample, name="sampling-profiler", daemon=True).start()
+    await asyncio.shield(done)
+    return profiler
@@ -0,0 +1,134 @@
+"""Rate limits shared by HTTP routes and Socket.IO events.
+
+Each worker answers from an in-process token bucket per (policy, subject), so a check
+never waits on the network. A periodic sync flushes the tokens spent since the last run to
+Redis in one pipeline (a fixed-window counter per bucket, shared by every worker) and
+clamps each local bucket to what is left of its window. Across workers the limit therefore
+holds up to about one sync interval of drift; without Redis each worker enforces it alone.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from app.services.redis import get_redis
+
+KEY_PREFIX = "ratelimit"
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitPolicy:
+    times: int
+    seconds: float
+    # Socket.IO events charged to this policy; routes opt in with Depends(rate_limit(name)).
+    events: tuple[str, ...] = ()
+
+    @property
+    def rate(self) -> float:
+        return self.times / self.seconds
+
+
+# One table for both transports: a chat message costs the same token whether it arrives
+# over REST or the socket.
+POLICIES: dict[str, RateLimitPolicy] = {
+    "chat.message": RateLimitPolicy(times=5, seconds=10, events=("chat.message",)),
+    "chat.typing": RateLimitPolicy(times=10, seconds=10, events=("chat.typing",)),
+    # Bulk imports are the most expensive writes: COPY plus a board-wide reload per client.
+    "import": RateLimitPolicy(times=5, seconds=60),
+    "card.write": RateLimitPolicy(
+        times=30, seconds=10, events=("card.create", "card.update", "card.move")
+    ),
+}
+
+EVENT_POLICIES: dict[str, str] = {
+    event: name for name, policy in POLICIES.items() for event in policy.events
+}
+
+
+@dataclass(slots=True)
+class _Bucket:
+    tokens: float
+    updated: float
+    # Tokens spent locally and not yet added to the shared counter.
+    pending: int = 0
+
+
+class RateLimiter:
+    def __init__(self, policies: dict[str, RateLimitPolicy]) -> None:
+        self.policies = policies
+        self.allowed: Counter[tuple[str, str]] = Counter()
+        self.limited: Counter[tuple[str, str]] = Counter()
+        self._buckets: dict[tuple[str, str], _Bucket] = {}
+        self._reported: Counter[tuple[str, str]] = Counter()
+        self._redis_failing = False
+
+    def acquire(self, name: str, subject: str, transport: str) -> float | None:
+        """Spend a token: None when allowed, otherwise seconds until the next one."""
+        policy = self.policies[name]
+        now = time.monotonic()
+        bucket = self._buckets.get((name, subject))
+        if bucket is None:
+            bucket = self._buckets[name, subject] = _Bucket(tokens=policy.times, updated=now)
+        else:
+            bucket.tokens = min(policy.times, bucket.tokens + (now - bucket.updated) * policy.rate)
+            bucket.updated = now
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            bucket.pending += 1
+            self.allowed[name, transport] += 1
+            return None
+        self.limited[name, transport] += 1
+        return (1 - bucket.tokens) / policy.rate
+
+    async def sync(self) -> None:
+        now = time.monotonic()
+        window_now = time.time()
+        batch: list[tuple[_Bucket, RateLimitPolicy, int]] = []
+        pipeline = get_redis().pipeline(transaction=False)
+        for key, bucket in list(self._buckets.items()):
+            name, subject = key
+            policy = self.policies[name]
+            if bucket.pending:
+                window = int(window_now // policy.seconds)
+                counter = f"{KEY_PREFIX}:{name}:{subject}:{window}"
+                pipeline.incrby(counter, bucket.pending)
+                pipeline.expire(counter, math.ceil(policy.seconds) * 2)
+                batch.append((bucket, policy, bucket.pending))
+            elif now - bucket.updated > policy.seconds:
+                # Idle for a whole window: it is full again and the shared counter expired.
+                del self._buckets[key]
+
+        if batch:
+            try:
+                results = await pipeline.execute()
+            except RedisError as exc:
+                if not self._redis_failing:
+                    logger.warning("Rate limit sync failed, limiting per worker: {}", exc)
+                self._redis_failing = True
+            else:
+                if self._redis_failing:
+                    logger.info("Rate limit sync recovered")
+                self._redis_failing = False
+                for (bucket, policy, sent), count in zip(batch, results[::2]):
+                    # Tokens spent while the pipeline was in flight stay pending for the next run.
+                    bucket.pending -= sent
+                    remaining = policy.times - count - bucket.pending
+                    bucket.tokens = min(bucket.tokens, max(remaining, 0))
+        self._report()
+
+    def _report(self) -> None:
+        limited = self.limited - self._reported
+        if limited:
+            summary = {f"{name}/{transport}": count for (name, transport), count in limited.items()}
+            logger.warning("Rate limited requests since last sync: {}", summary)
+            self._reported = self.limited.copy()
+
+
+limiter = RateLimiter(POLICIES)
@@ -1,14 +1,47 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
+from typing import Any
 
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 
 from app.core.config import settings
+from app.services.metrics import REDIS_COMMAND_SECONDS
+from app.services.timing import record_redis
 
 redis_client: Redis | None = None
 
+
+class TimedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        started = time.perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        finally:
+            elapsed = time.perf_counter() - started
+            REDIS_COMMAND_SECONDS.labels("PIPELINE").observe(elapsed)
+            record_redis(elapsed)
+
+
+class TimedRedis(Redis):
+    """Redis client recording each command's round trip in ``redis_command_duration_seconds``."""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            elapsed = time.perf_counter() - started
+            REDIS_COMMAND_SECONDS.labels(str(args[0]).upper()).observe(elapsed)
+            record_redis(elapsed)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> Pipeline:
+        return TimedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
 def get_redis() -> Redis:
     if redis_client is None:
         raise RuntimeError("Redis client is not initialized")
@@ -18,7 +51,7 @@ def get_redis() -> Redis:
 async def init_redis() -> None:
     global redis_client
     if redis_client is None:
-        redis_client = Redis.from_url(settings.redis_url, decode_responses=True)
+        redis_client = TimedRedis.from_url(settings.redis_url, decode_responses=True)
         await redis_client.ping()
 
 
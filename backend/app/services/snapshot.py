@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import AsyncIterator, Iterable, Sequence
+from typing import Any, Literal
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.session import session_for
+from app.models import Card, Column
+from app.utils.card_filters import CardFilter
+from app.utils.fieldsets import SUMMARY_REQUIRED_FIELDS, card_columns
+from app.utils.json import dumps
+
+SnapshotFormat = Literal["json", "ndjson"]
+
+# Same fields as CardSummary, selected as plain Core rows so no ORM identity map or
+# pydantic model is built per card.
+CARD_SUMMARY_COLUMNS = (
+    Card.id,
+    Card.column_id,
+    Card.title,
+    Card.description,
+    Card.labels,
+    Card.assignees,
+    Card.priority,
+    Card.due_date,
+    Card.position,
+    Card.version,
+    Card.created_at,
+    Card.updated_at,
+)
+CARD_SUMMARY_FIELDS = tuple(column.key for column in CARD_SUMMARY_COLUMNS)
+COLUMN_FIELDS = ("id", "board_id", "name", "order")
+
+STREAM_BATCH_SIZE = 500
+
+
+def encode_card_rows(
+    rows: Iterable[Sequence[Any]],
+    fmt: SnapshotFormat,
+    field_names: Sequence[str] = CARD_SUMMARY_FIELDS,
+) -> bytes:
+    if fmt == "ndjson":
+        return b"".join(
+            dumps({"type": "card", **dict(zip(field_names, row))}) + b"\n" for row in rows
+        )
+    return b",".join(dumps(dict(zip(field_names, row))) for row in rows)
+
+
+async def stream_board_snapshot(
+    board_id: uuid.UUID,
+    project_id: uuid.UUID,
+    filters: CardFilter,
+    fmt: SnapshotFormat = "json",
+    fields: frozenset[str] | None = None,
+    bind: AsyncEngine | None = None,
+) -> AsyncIterator[bytes]:
+    card_select = (
+        CARD_SUMMARY_COLUMNS if fields is None else card_columns(fields, SUMMARY_REQUIRED_FIELDS)
+    )
+    field_names = tuple(column.key for column in card_select)
+
+    # The generator owns its session: it keeps reading from a server-side cursor after the
+    # request-scoped session has been released.
+    async with session_for(bind) as db:
+        columns_result = await db.execute(
+            select(Column.id, Column.board_id, Column.name, Column.order)
+            .where(Column.board_id == board_id)
+            .order_by(Column.order)
+        )
+        columns = [dict(zip(COLUMN_FIELDS, row)) for row in columns_result]
+
+        if fmt == "ndjson":
+            yield dumps({"type": "board", "board_id": board_id}) + b"\n"
+            for column in columns:
+                yield dumps({"type": "column", **column}) + b"\n"
+        else:
+            yield (
+                b'{"board_id":' + dumps(board_id) + b',"columns":' + dumps(columns) + b',"cards":['
+            )
+
+        stmt = filters.apply(select(*card_select).where(Card.project_id == project_id))
+        stmt = stmt.order_by(Card.column_id, Card.position).execution_options(
+            yield_per=STREAM_BATCH_SIZE
+        )
+        result = await db.stream(stmt)
+        first = True
+        async for rows in result.partitions():
+            chunk = encode_card_rows(rows, fmt, field_names)
+            if fmt == "json" and not first:
+                chunk = b"," + chunk
+            first = False
+            yield chunk
+
+        if fmt == "json":
+            yield b"]}"
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Literal, Self
+
+from anyio import to_thread
+from fastapi import UploadFile
+from fastapi.responses import FileResponse
+
+from app.core.config import settings
+
+FsyncPolicy = Literal["none", "file", "directory"]
+
+# Writes are issued in multiples of this size so the page cache and the filesystem see
+# whole blocks instead of whatever chunk sizes the multipart parser produced.
+WRITE_ALIGNMENT = 64 * 1024
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+def _open_for_write(path: Path, offset: int | None) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if offset is None else 0)
+    fd = os.open(path, flags, 0o644)
+    if offset:
+        os.lseek(fd, offset, os.SEEK_SET)
+    return fd
+
+
+def _write_all(fd: int, data: bytearray, length: int, hasher: Any = None) -> None:
+    view = memoryview(data)[:length]
+    if hasher is not None:
+        hasher.update(view)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _close(fd: int, path: Path, fsync: FsyncPolicy) -> None:
+    try:
+        if fsync != "none":
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    if fsync == "directory":
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _discard(fd: int | None, path: Path) -> None:
+    if fd is not None:
+        os.close(fd)
+    path.unlink(missing_ok=True)
+
+
+class FileWriter:
+    """Buffered file writer whose blocking syscalls all run in the worker thread pool.
+
+    Without ``offset`` the file is truncated. With one, writing starts there and the rest
+    of the file is kept, so a late retry of an earlier part cannot cut off later parts.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        buffer_size: int | None = None,
+        fsync: FsyncPolicy | None = None,
+        hasher: Any = None,
+        offset: int | None = None,
+    ) -> None:
+        self.path = path
+        self.hasher = hasher
+        self.offset = offset
+        self.buffer_size = max(buffer_size or settings.upload_write_buffer, WRITE_ALIGNMENT)
+        self.fsync: FsyncPolicy = fsync or settings.upload_fsync
+        self.size = 0
+        self._buffer = bytearray()
+        self._fd: int | None = None
+
+    async def open(self) -> FileWriter:
+        self._fd = await to_thread.run_sync(_open_for_write, self.path, self.offset)
+        return self
+
+    async def write(self, chunk: bytes) -> None:
+        self._buffer += chunk
+        self.size += len(chunk)
+        if len(self._buffer) >= self.buffer_size:
+            aligned = len(self._buffer) - len(self._buffer) % WRITE_ALIGNMENT
+            await self._flush(aligned)
+
+    async def close(self) -> None:
+        if self._fd is None:
+            return
+        if self._buffer:
+            await self._flush(len(self._buffer))
+        fd, self._fd = self._fd, None
+        await to_thread.run_sync(_close, fd, self.path, self.fsync)
+
+    async def abort(self) -> None:
+        fd, self._fd = self._fd, None
+        self._buffer.clear()
+        await to_thread.run_sync(_discard, fd, self.path)
+
+    async def _flush(self, length: int) -> None:
+        # Hand the filled buffer to the thread as-is; only the unaligned tail is copied.
+        data, self._buffer = self._buffer, bytearray(self._buffer[length:])
+        await to_thread.run_sync(_write_all, self._fd, data, length, self.hasher)
+
+    async def __aenter__(self) -> Self:
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.close()
+        else:
+            await self.abort()
+
+
+async def save_upload(
+    upload: UploadFile, destination: Path, max_size: int, hasher: Any = None
+) -> int:
+    async with FileWriter(destination, hasher=hasher) as writer:
+        while chunk := await upload.read(READ_CHUNK_SIZE):
+            if writer.size + len(chunk) > max_size:
+                raise UploadTooLarge(destination.name)
+            await writer.write(chunk)
+    return writer.size
+
+
+async def stat_file(path: str | os.PathLike[str]) -> os.stat_result | None:
+    try:
+        return await to_thread.run_sync(os.stat, path)
+    except FileNotFoundError:
+        return None
+
+
+def hash_file(path: Path, hasher: Any) -> str:
+    with path.open("rb") as source:
+        while chunk := source.read(READ_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class StoredFileResponse(FileResponse):
+    # Larger reads mean fewer thread-pool round trips per download. Servers that advertise
+    # the ASGI ``http.response.pathsend`` extension get the path instead and use sendfile.
+    # Range / If-Range requests are answered with 206 (or multipart/byteranges) by FileResponse.
+    chunk_size = READ_CHUNK_SIZE
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from anyio import to_thread
+from loguru import logger
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models import FileAsset
+from app.services.blobs import blob_path
+
+try:  # Pillow is an optional extra: without it uploads work but no previews are made.
+    from PIL import Image
+except ImportError:  # pragma: no cover - depends on the installed extras
+    Image = None
+
+THUMBNAIL_FORMAT = "webp"
+THUMBNAIL_MEDIA_TYPE = "image/webp"
+
+_executor: ProcessPoolExecutor | None = None
+_slots: asyncio.Semaphore | None = None
+_inflight: dict[str, asyncio.Future[list[int]]] = {}
+
+
+def available() -> bool:
+    return Image is not None
+
+
+def supports(mime: str) -> bool:
+    return available() and mime.startswith("image/") and mime != "image/svg+xml"
+
+
+def bucket_for(size: int) -> int:
+    buckets = sorted(settings.thumbnail_sizes)
+    return next((bucket for bucket in buckets if bucket >= size), buckets[-1])
+
+
+def thumbnail_path(digest: str, size: int) -> Path:
+    return blob_path(digest).with_name(f"{digest}.{size}.{THUMBNAIL_FORMAT}")
+
+
+def render_thumbnails(source: str, targets: list[tuple[int, str]]) -> list[int]:
+    """Process-pool entry point: decode once, write every missing size bucket."""
+    rendered = []
+    with Image.open(source) as image:
+        image.draft("RGB", (max(size for size, _ in targets),) * 2)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+        for size, target in sorted(targets, reverse=True):
+            image.thumbnail((size, size))
+            temp = f"{target}.tmp"
+            image.save(temp, THUMBNAIL_FORMAT.upper(), quality=80, method=4)
+            os.replace(temp, target)
+            rendered.append(size)
+    return rendered
+
+
+def _rendered_sizes(digest: str) -> list[int]:
+    sizes = [size for size in settings.thumbnail_sizes if thumbnail_path(digest, size).exists()]
+    return sorted(sizes)
+
+
+def _pool() -> tuple[ProcessPoolExecutor, asyncio.Semaphore]:
+    global _executor, _slots
+    if _executor is None:
+        # Spawned, not forked: the worker runs threads (anyio's pool, the loop watchdog) by
+        # now, and a forked child could inherit one of their locks held forever.
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.thumbnail_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        # Bound the backlog too, so a burst of uploads cannot queue unbounded source paths.
+        _slots = asyncio.Semaphore(settings.thumbnail_workers * 2)
+    return _executor, _slots
+
+
+async def _generate(digest: str, source: Path) -> list[int]:
+    sizes = await to_thread.run_sync(_rendered_sizes, digest)
+    missing = [size for size in settings.thumbnail_sizes if size not in sizes]
+    if missing:
+        executor, slots = _pool()
+        targets = [(size, str(thumbnail_path(digest, size))) for size in missing]
+        async with slots:
+            await asyncio.get_running_loop().run_in_executor(
+                executor, render_thumbnails, str(source), targets
+            )
+        # Record the sizes on disk, not the ones asked for.
+        sizes = await to_thread.run_sync(_rendered_sizes, digest)
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(FileAsset).where(FileAsset.blob_digest == digest).values(thumbnail_sizes=sizes)
+        )
+        await db.commit()
+    return sizes
+
+
+async def generate(digest: str, source: Path) -> list[int]:
+    """Render all size buckets for a blob, sharing the work with concurrent callers."""
+    future = _inflight.get(digest)
+    if future is None:
+        future = asyncio.ensure_future(_generate(digest, source))
+        _inflight[digest] = future
+        future.add_done_callback(lambda _: _inflight.pop(digest, None))
+    return await asyncio.shield(future)
+
+
+async def generate_in_background(digest: str, source: Path) -> None:
+    try:
+        await generate(digest, source)
+    except Exception:  # noqa: BLE001 - previews are best effort; the upload already succeeded
+        logger.exception("Thumbnail generation failed for blob {}", digest)
+
+
+async def ensure_thumbnail(digest: str, source: Path, size: int) -> Path | None:
+    path = thumbnail_path(digest, size)
+    if await to_thread.run_sync(path.exists):
+        return path
+    try:
+        await generate(digest, source)
+    except Exception:  # noqa: BLE001 - any render failure is answered with "unavailable"
+        logger.exception("Thumbnail generation failed for blob {}", digest)
+        return None
+    return path
+
+
+def shutdown() -> None:
+    global _executor, _slots
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        _slots = None
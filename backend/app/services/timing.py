@@ -0,0 +1,218 @@
+"""Per-operation query counting and the ``Server-Timing`` breakdown.
+
+An operation is one HTTP request or one Socket.IO event. It gets an
+:class:`OperationTiming` in a context variable. The engine hooks installed by
+:func:`track_queries` count each statement and its time into it, the Redis client adds
+its commands, and the response classes add serialization. When the operation ends, its
+query count goes to ``db_queries_per_operation``. A warning is logged when the count is
+over the operation's budget, or when one statement repeats often enough to look like
+an N+1 loop.
+
+Measurements nest: a block wrapped in :func:`measure` also counts the operations that
+run inside it. Benchmarks use this to check the budgets in :data:`QUERY_BUDGETS`.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.metrics import DB_QUERIES, UNMATCHED_ROUTE
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Statements an operation may send, keyed "<METHOD> <route template>" for HTTP routes and by
+# event name for Socket.IO events; operations not listed get DEFAULT_QUERY_BUDGET. Counts
+# include the user lookup of get_current_user but not BEGIN/COMMIT.
+QUERY_BUDGETS: dict[str, int] = {
+    "GET /projects": 2,
+    "POST /projects": 6,
+    "GET /projects/{project_id}": 2,
+    "GET /projects/{project_id}/board": 5,
+    "GET /cards": 3,
+    "POST /cards": 7,
+    "GET /cards/{card_id}": 3,
+    "PATCH /cards/{card_id}": 5,
+    "POST /cards/{card_id}/move": 5,
+    "GET /projects/{project_id}/messages": 3,
+    "POST /projects/{project_id}/messages": 4,
+    "join_room": 1,
+    "card.create": 5,
+    "card.update": 4,
+    "card.move": 4,
+    "chat.message": 4,
+    "chat.typing": 2,
+}
+DEFAULT_QUERY_BUDGET = 10
+# A statement sent this many times in one operation is reported as a likely N+1 loop.
+REPEATED_STATEMENT_THRESHOLD = 5
+
+
+@dataclass(slots=True)
+class OperationTiming:
+    name: str
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    redis_commands: int = 0
+    redis_seconds: float = 0.0
+    serialize_seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def budget(self) -> int:
+        return QUERY_BUDGETS.get(self.name, DEFAULT_QUERY_BUDGET)
+
+    @property
+    def over_budget(self) -> bool:
+        return self.db_queries > self.budget
+
+    def repeated_statements(self) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= REPEATED_STATEMENT_THRESHOLD
+        ]
+
+    def add(self, other: OperationTiming) -> None:
+        self.db_queries += other.db_queries
+        self.db_seconds += other.db_seconds
+        self.redis_commands += other.redis_commands
+        self.redis_seconds += other.redis_seconds
+        self.serialize_seconds += other.serialize_seconds
+        self.statements.update(other.statements)
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.db_queries} queries", '
+            f'redis;dur={self.redis_seconds * 1000:.2f};desc="{self.redis_commands} commands", '
+            f"serialize;dur={self.serialize_seconds * 1000:.2f}"
+        )
+
+
+_current: ContextVar[OperationTiming | None] = ContextVar("operation_timing", default=None)
+
+
+def current_operation() -> OperationTiming | None:
+    return _current.get()
+
+
+@contextmanager
+def measure(name: str) -> Iterator[OperationTiming]:
+    """Collect what runs inside the block; an enclosing measurement gets the totals too."""
+    operation = OperationTiming(name)
+    token = _current.set(operation)
+    try:
+        yield operation
+    finally:
+        _current.reset(token)
+        if (outer := _current.get()) is not None:
+            outer.add(operation)
+
+
+def finish(operation: OperationTiming) -> None:
+    DB_QUERIES.labels(operation.name).observe(operation.db_queries)
+    if operation.over_budget:
+        logger.warning(
+            "{} ran {} queries, over its budget of {}",
+            operation.name,
+            operation.db_queries,
+            operation.budget,
+        )
+    for statement, count in operation.repeated_statements():
+        logger.warning(
+            "{} sent the same statement {} times (N+1?): {}", operation.name, count, statement[:200]
+        )
+
+
+def measure_event(event: str, handler: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    @wraps(handler)
+    async def measured(*args: P.args, **kwargs: P.kwargs) -> R:
+        with measure(event) as operation:
+            try:
+                return await handler(*args, **kwargs)
+            finally:
+                finish(operation)
+
+    return measured
+
+
+def record_redis(seconds: float) -> None:
+    if (operation := _current.get()) is not None:
+        operation.redis_commands += 1
+        operation.redis_seconds += seconds
+
+
+@contextmanager
+def serializing() -> Iterator[None]:
+    operation = _current.get()
+    if operation is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        operation.serialize_seconds += time.perf_counter() - started
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and _current.get() is not None:
+        context.query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    operation = _current.get()
+    started = getattr(context, "query_started", None)
+    if operation is None or started is None:
+        return
+    operation.db_queries += 1
+    operation.db_seconds += time.perf_counter() - started
+    operation.statements[statement] += 1
+
+
+def track_queries(engine: Engine) -> None:
+    """Count ``engine``'s statements into the current operation.
+
+    Pass ``AsyncEngine.sync_engine`` for an async engine.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class ServerTimingMiddleware:
+    """Measures each HTTP request and sends the breakdown in a ``Server-Timing`` header."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with measure(UNMATCHED_ROUTE) as operation:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("Server-Timing", operation.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                route = scope.get("route")
+                operation.name = f"{scope['method']} {getattr(route, 'path', UNMATCHED_ROUTE)}"
+                finish(operation)
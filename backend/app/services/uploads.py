@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from anyio import to_thread
+from sqlalchemy import delete
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models import UploadSession
+
+
+def session_path(upload_id: uuid.UUID) -> Path:
+    return Path(settings.uploads_dir) / "tmp" / "sessions" / upload_id.hex
+
+
+def _unlink_sessions(upload_ids: list[uuid.UUID]) -> None:
+    for upload_id in upload_ids:
+        session_path(upload_id).unlink(missing_ok=True)
+
+
+async def expire_upload_sessions() -> int:
+    cutoff = datetime.now(UTC) - timedelta(seconds=settings.upload_session_ttl_seconds)
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            delete(UploadSession)
+            .where(UploadSession.updated_at < cutoff)
+            .returning(UploadSession.id)
+        )
+        upload_ids = list(result.scalars())
+        await db.commit()
+    await to_thread.run_sync(_unlink_sessions, upload_ids)
+    return len(upload_ids)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Literal
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import Select, or_, tuple_
+
+from app.models import Card
+from app.utils.pagination import decode_cursor, encode_cursor
+
+CardSort = Literal["position", "due_date", "created_at", "-created_at", "updated_at", "-updated_at"]
+# The archive is read newest first only.
+ArchiveSort = Literal["-archived_at"]
+
+
+@dataclass(slots=True)
+class CardFilter:
+    labels: list[str] = field(default_factory=list)
+    assignees: list[str] = field(default_factory=list)
+    priorities: list[str] = field(default_factory=list)
+    due_from: date | None = None
+    due_to: date | None = None
+    # Active cards by default; the archive endpoint reads the archived ones instead.
+    archived: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.labels or self.assignees or self.priorities or self.due_from or self.due_to
+        )
+
+    def apply(self, stmt: Select) -> Select:
+        # Spelled as in the partial indexes' predicates so the planner can match them.
+        stmt = stmt.where(
+            Card.archived_at.is_not(None) if self.archived else Card.archived_at.is_(None)
+        )
+        # Labels are stored either as plain strings or as {"name": ..., "color": ...} objects;
+        # both shapes are matched with @> so the jsonb_path_ops GIN index can serve them.
+        for label in self.labels:
+            stmt = stmt.where(
+                or_(Card.labels.contains([label]), Card.labels.contains([{"name": label}]))
+            )
+        if self.assignees:
+            stmt = stmt.where(Card.assignees.contains(self.assignees))
+        if self.priorities:
+            stmt = stmt.where(Card.priority.in_(self.priorities))
+        if self.due_from is not None:
+            stmt = stmt.where(Card.due_date >= self.due_from)
+        if self.due_to is not None:
+            stmt = stmt.where(Card.due_date <= self.due_to)
+        return stmt
+
+
+def card_filter_params(
+    label: list[str] = Query(default=[], description="Card must carry every listed label"),
+    assignee: list[str] = Query(
+        default=[], description="Card must be assigned to every listed user"
+    ),
+    priority: list[Literal["low", "medium", "high"]] = Query(default=[]),
+    due_from: date | None = Query(default=None),
+    due_to: date | None = Query(default=None),
+) -> CardFilter:
+    if due_from and due_to and due_from > due_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="due_from is after due_to"
+        )
+    return CardFilter(
+        labels=label,
+        assignees=assignee,
+        priorities=list(priority),
+        due_from=due_from,
+        due_to=due_to,
+    )
+
+
+def _parse_datetime(value: Any) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+_SORT_KEYS: dict[str, tuple[tuple[Any, Callable[[Any], Any]], ...]] = {
+    "position": ((Card.column_id, uuid.UUID), (Card.position, int), (Card.id, uuid.UUID)),
+    "created_at": ((Card.created_at, _parse_datetime), (Card.id, uuid.UUID)),
+    "updated_at": ((Card.updated_at, _parse_datetime), (Card.id, uuid.UUID)),
+    "archived_at": ((Card.archived_at, _parse_datetime), (Card.id, uuid.UUID)),
+}
+
+
+def order_cards(stmt: Select, sort: CardSort | ArchiveSort) -> Select:
+    if sort == "due_date":
+        return stmt.order_by(Card.due_date.asc().nulls_last(), Card.id)
+    descending = sort.startswith("-")
+    columns = [column for column, _ in _SORT_KEYS[sort.lstrip("-")]]
+    return stmt.order_by(*(column.desc() if descending else column for column in columns))
+
+
+def apply_card_cursor(stmt: Select, sort: CardSort | ArchiveSort, cursor: str) -> Select:
+    try:
+        if sort == "due_date":
+            due_value, id_value = decode_cursor(cursor, 2)
+            card_id = uuid.UUID(id_value)
+            if due_value is None:
+                return stmt.where(Card.due_date.is_(None), Card.id > card_id)
+            due = date.fromisoformat(due_value)
+            return stmt.where(
+                or_(
+                    Card.due_date.is_(None),
+                    tuple_(Card.due_date, Card.id) > tuple_(due, card_id),
+                )
+            )
+
+        keys = _SORT_KEYS[sort.lstrip("-")]
+        values = decode_cursor(cursor, len(keys))
+        bound = [parse(value) for (_, parse), value in zip(keys, values)]
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
+
+    key = tuple_(*(column for column, _ in keys))
+    after = tuple_(*bound)
+    return stmt.where(key < after if sort.startswith("-") else key > after)
+
+
+def card_sort_fields(sort: CardSort | ArchiveSort) -> tuple[str, ...]:
+    if sort == "due_date":
+        return ("due_date", "id")
+    return tuple(column.key for column, _ in _SORT_KEYS[sort.lstrip("-")])
+
+
+def card_cursor(card: Any, sort: CardSort | ArchiveSort) -> str:
+    if sort == "due_date":
+        return encode_cursor(card.due_date, card.id)
+    keys = _SORT_KEYS[sort.lstrip("-")]
+    return encode_cursor(*(getattr(card, column.key) for column, _ in keys))
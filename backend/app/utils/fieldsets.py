@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import HTTPException, Query, status
+
+from app.models import Card
+from app.schemas.card import CardRead
+
+CARD_FIELDS: tuple[str, ...] = tuple(CardRead.model_fields)
+
+# Fields a client cannot drop: they identify the card, place it on the board and carry
+# the optimistic-locking version.
+SUMMARY_REQUIRED_FIELDS = ("id", "column_id", "position", "version")
+CARD_REQUIRED_FIELDS = ("id", "project_id", "column_id", "position", "version")
+PATCH_REQUIRED_FIELDS = ("id", "project_id", "version", "updated_at")
+
+
+def card_fields_param(
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated card fields to return, e.g. fields=title,priority,due_date",
+    ),
+) -> frozenset[str] | None:
+    if not fields:
+        return None
+    requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    unknown = requested.difference(CARD_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown card fields: {', '.join(sorted(unknown))}",
+        )
+    return requested
+
+
+def card_field_names(requested: Iterable[str], required: Iterable[str]) -> tuple[str, ...]:
+    wanted = set(requested).union(required)
+    return tuple(name for name in CARD_FIELDS if name in wanted)
+
+
+def card_columns(requested: Iterable[str], required: Iterable[str]) -> list[Any]:
+    return [getattr(Card, name) for name in card_field_names(requested, required)]
+
+
+def card_patch_payload(card: Card, changed: Iterable[str]) -> dict[str, Any]:
+    include = set(PATCH_REQUIRED_FIELDS).union(name for name in changed if name in CARD_FIELDS)
+    return CardRead.model_validate(card).model_dump(mode="json", include=include)
+
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+import orjson
+
+# UTC timestamps render with a "Z" suffix, matching pydantic, so streamed and validated
+# payloads agree. Non-string keys (ints, UUIDs) become strings like in pydantic output.
+_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    # asyncpg returns its own UUID subclass, which orjson only serializes as an exact type.
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=_default, option=_OPTIONS)
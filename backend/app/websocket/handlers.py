@@ -2,15 +2,21 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import AsyncSessionLocal
 from app.main import sio
-from app.models import Card, Column, Member, Message, Project, User
+from app.models import Card, Column, Message, User
+from app.repositories import card_by_id, has_project_access, max_card_position
 from app.schemas.card import CardRead
 from app.services.events import EventDeduplicator
+from app.services.metrics import DEDUP_CHECKS, instrument_event
+from app.services.ratelimit import EVENT_POLICIES, limiter
 from app.services.redis import get_redis
 from app.services.security import decode_token
+from app.services.timing import measure_event
+from app.utils.fieldsets import CARD_FIELDS, card_patch_payload
 
 NAMESPACE = "/ws"
 SESSION_STORE: dict[str, uuid.UUID] = {}
@@ -23,17 +29,29 @@ async def _ensure_authenticated(sid: str) -> uuid.UUID:
     return user_id
 
 
-async def _ensure_project_access(project_id: uuid.UUID, user_id: uuid.UUID) -> None:
-    async with AsyncSessionLocal() as db:
-        stmt = (
-            select(Project.id)
-            .outerjoin(Member, Member.project_id == Project.id)
-            .where(Project.id == project_id)
-            .where(or_(Project.owner_id == user_id, Member.user_id == user_id))
-        )
-        result = await db.execute(stmt)
-        if not result.scalar_one_or_none():
-            raise PermissionError("Forbidden")
+async def _ensure_project_access(
+    project_id: uuid.UUID, user_id: uuid.UUID, db: AsyncSession | None = None
+) -> None:
+    """Checks on ``db`` when the handler already holds a session, so it needs no second
+    connection."""
+    if db is None:
+        async with AsyncSessionLocal() as session:
+            allowed = await has_project_access(session, project_id, user_id)
+    else:
+        allowed = await has_project_access(db, project_id, user_id)
+    if not allowed:
+        raise PermissionError("Forbidden")
+
+
+def _rate_limited(event: str, user_id: uuid.UUID) -> dict | None:
+    """The ack for an event over its user's rate limit, None when it may proceed.
+
+    Handlers check it before the Redis dedup lookup, so a flood costs no round trip.
+    """
+    retry_after = limiter.acquire(EVENT_POLICIES[event], str(user_id), "socket")
+    if retry_after is None:
+        return None
+    return {"rateLimited": True, "retryAfter": round(retry_after, 3)}
 
 
 async def _is_duplicate(event_id: str | None) -> bool:
@@ -43,9 +61,33 @@ async def _is_duplicate(event_id: str | None) -> bool:
         deduper = EventDeduplicator(get_redis())
         return await deduper.mark_and_check(uuid.UUID(event_id))
     except Exception:
+        DEDUP_CHECKS.labels("error").inc()
         return False
 
 
+def _archived_conflict(card: Card) -> dict:
+    """Ack for an edit of an archived card; it has to be restored over REST first."""
+    return {
+        "conflict": True,
+        "archived": True,
+        "restore": f"/cards/{card.id}/restore",
+        "serverVersion": card.version,
+        "serverState": CardRead.model_validate(card).model_dump(mode="json"),
+    }
+
+
+def _on(event: str):
+    """Registers a handler for ``event`` on the namespace, timed and query-counted per event
+    name."""
+
+    def register(handler):
+        return sio.on(event, namespace=NAMESPACE)(
+            instrument_event(event, measure_event(event, handler))
+        )
+
+    return register
+
+
 @sio.event(namespace=NAMESPACE)
 async def connect(sid, environ, auth):  # pragma: no cover - socket lifecycle
     token = (auth or {}).get("token")
@@ -65,7 +107,7 @@ async def disconnect(sid):  # pragma: no cover - socket lifecycle
     SESSION_STORE.pop(sid, None)
 
 
-@sio.on("join_room", namespace=NAMESPACE)
+@_on("join_room")
 async def join_room(sid, data):
     user_id = await _ensure_authenticated(sid)
     project_id = uuid.UUID(data["projectId"])
@@ -82,7 +124,7 @@ async def join_room(sid, data):
     return {"joined": True}
 
 
-@sio.on("leave_room", namespace=NAMESPACE)
+@_on("leave_room")
 async def leave_room(sid, data):
     project_id = uuid.UUID(data["projectId"])
     room = f"project:{project_id}"
@@ -90,21 +132,23 @@ async def leave_room(sid, data):
     return {"left": True}
 
 
-@sio.on("card.create", namespace=NAMESPACE)
+@_on("card.create")
 async def card_create(sid, data):
+    user_id = await _ensure_authenticated(sid)
+    if limited := _rate_limited("card.create", user_id):
+        return limited
     if await _is_duplicate(data.get("eventId")):
         return {"duplicate": True}
 
-    user_id = await _ensure_authenticated(sid)
     project_id = uuid.UUID(data["projectId"])
     column_id = uuid.UUID(data["columnId"])
     await _ensure_project_access(project_id, user_id)
 
-    async with AsyncSessionLocal() as db:
+    async with AsyncSessionLocal(info={"user_id": user_id}) as db:
         column = await db.scalar(select(Column).where(Column.id == column_id))
         if not column:
             raise RuntimeError("Column not found")
-        max_position = await db.scalar(select(func.max(Card.position)).where(Card.column_id == column_id))
+        max_position = await max_card_position(db, column_id)
         card = Card(
             project_id=project_id,
             column_id=column_id,
@@ -121,19 +165,23 @@ async def card_create(sid, data):
     return {"id": str(card.id), "version": card.version}
 
 
-@sio.on("card.update", namespace=NAMESPACE)
+@_on("card.update")
 async def card_update(sid, data):
+    user_id = await _ensure_authenticated(sid)
+    if limited := _rate_limited("card.update", user_id):
+        return limited
     if await _is_duplicate(data.get("eventId")):
         return {"duplicate": True}
 
-    user_id = await _ensure_authenticated(sid)
     card_id = uuid.UUID(data["id"])
 
-    async with AsyncSessionLocal() as db:
-        card = await db.scalar(select(Card).where(Card.id == card_id))
+    async with AsyncSessionLocal(info={"user_id": user_id}) as db:
+        card = await card_by_id(db, card_id)
         if not card:
             raise RuntimeError("Card not found")
-        await _ensure_project_access(card.project_id, user_id)
+        await _ensure_project_access(card.project_id, user_id, db)
+        if card.archived_at is not None:
+            return _archived_conflict(card)
         if data.get("clientVersion") != card.version:
             return {
                 "conflict": True,
@@ -141,31 +189,40 @@ async def card_update(sid, data):
                 "serverState": CardRead.model_validate(card).model_dump(mode="json"),
             }
         patch = data.get("patch", {})
+        changed = [
+            key
+            for key, value in patch.items()
+            if key in CARD_FIELDS and getattr(card, key) != value
+        ]
         for key, value in patch.items():
             if hasattr(card, key):
                 setattr(card, key, value)
         card.version += 1
         await db.commit()
         await db.refresh(card)
-        payload = CardRead.model_validate(card).model_dump(mode="json")
+        payload = card_patch_payload(card, changed)
 
     await sio.emit("card.updated", payload, room=f"project:{card.project_id}", skip_sid=sid, namespace=NAMESPACE)
     return {"newVersion": card.version}
 
 
-@sio.on("card.move", namespace=NAMESPACE)
+@_on("card.move")
 async def card_move(sid, data):
+    user_id = await _ensure_authenticated(sid)
+    if limited := _rate_limited("card.move", user_id):
+        return limited
     if await _is_duplicate(data.get("eventId")):
         return {"duplicate": True}
 
-    user_id = await _ensure_authenticated(sid)
     card_id = uuid.UUID(data["id"])
 
-    async with AsyncSessionLocal() as db:
-        card = await db.scalar(select(Card).where(Card.id == card_id))
+    async with AsyncSessionLocal(info={"user_id": user_id}) as db:
+        card = await card_by_id(db, card_id)
         if not card:
             raise RuntimeError("Card not found")
-        await _ensure_project_access(card.project_id, user_id)
+        await _ensure_project_access(card.project_id, user_id, db)
+        if card.archived_at is not None:
+            return _archived_conflict(card)
         if data.get("clientVersion") != card.version:
             return {
                 "conflict": True,
@@ -191,16 +248,18 @@ async def card_move(sid, data):
     return {"moved": True}
 
 
-@sio.on("chat.message", namespace=NAMESPACE)
+@_on("chat.message")
 async def chat_message(sid, data):
+    user_id = await _ensure_authenticated(sid)
+    if limited := _rate_limited("chat.message", user_id):
+        return limited
     if await _is_duplicate(data.get("eventId")):
         return {"duplicate": True}
 
-    user_id = await _ensure_authenticated(sid)
     project_id = uuid.UUID(data["projectId"])
     await _ensure_project_access(project_id, user_id)
 
-    async with AsyncSessionLocal() as db:
+    async with AsyncSessionLocal(info={"user_id": user_id}) as db:
         message = Message(project_id=project_id, user_id=user_id, content=data["text"])
         db.add(message)
         await db.commit()
@@ -219,9 +278,11 @@ async def chat_message(sid, data):
     return {"id": payload["id"], "createdAt": payload["createdAt"]}
 
 
-@sio.on("chat.typing", namespace=NAMESPACE)
+@_on("chat.typing")
 async def chat_typing(sid, data):
     user_id = await _ensure_authenticated(sid)
+    if limited := _rate_limited("chat.typing", user_id):
+        return limited
     project_id = uuid.UUID(data["projectId"])
     await _ensure_project_access(project_id, user_id)
 
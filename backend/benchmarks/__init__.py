@@ -0,0 +1 @@
+"""Performance benchmarks for the Kanban backend (run with ``python -m benchmarks.<name>``)."""
@@ -0,0 +1,100 @@
+"""Compare the ORM/pydantic board snapshot path with the streaming Core-row encoder.
+
+Runs without a database: rows are synthesised in the shape asyncpg returns them, then
+each path is timed and its peak allocation measured with tracemalloc.
+
+    python -m benchmarks.board_snapshot --sizes 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+
+from app.models import Card
+from app.schemas.board import BoardSnapshot
+from app.services.snapshot import CARD_SUMMARY_FIELDS, STREAM_BATCH_SIZE, encode_card_rows
+
+COLUMNS_PER_BOARD = 5
+
+
+def make_rows(count: int) -> tuple[uuid.UUID, list[dict], list[tuple]]:
+    board_id = uuid.uuid4()
+    columns = [
+        {"id": uuid.uuid4(), "board_id": board_id, "name": f"Column {i}", "order": i}
+        for i in range(COLUMNS_PER_BOARD)
+    ]
+    now = datetime.now(UTC)
+    rows = [
+        (
+            uuid.uuid4(),
+            columns[i % COLUMNS_PER_BOARD]["id"],
+            f"Card {i}",
+            "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+            ["bug", "ui"],
+            ["alice", "bob"],
+            "medium",
+            date(2025, 1, 1 + i % 28),
+            i,
+            1,
+            now,
+            now,
+        )
+        for i in range(count)
+    ]
+    return board_id, columns, rows
+
+
+def orm_path(board_id: uuid.UUID, columns: list[dict], rows: list[tuple]) -> int:
+    cards = [Card(**dict(zip(CARD_SUMMARY_FIELDS, row))) for row in rows]
+    snapshot = BoardSnapshot(board_id=board_id, columns=columns, cards=cards)
+    body = json.dumps(
+        snapshot.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+    return len(body)
+
+
+def streaming_path(board_id: uuid.UUID, columns: list[dict], rows: list[tuple]) -> int:
+    total = 0
+    for start in range(0, len(rows), STREAM_BATCH_SIZE):
+        total += len(encode_card_rows(rows[start : start + STREAM_BATCH_SIZE], "json"))
+    return total
+
+
+def measure(fn: Callable[..., int], *args) -> dict[str, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = fn(*args)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": round(elapsed, 4), "peak_mib": round(peak / 2**20, 2), "bytes": size}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    report = []
+    for size in args.sizes:
+        board_id, columns, rows = make_rows(size)
+        report.append(
+            {
+                "cards": size,
+                "orm": measure(orm_path, board_id, columns, rows),
+                "streaming": measure(streaming_path, board_id, columns, rows),
+            }
+        )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Per-query Python overhead of the hot lookups: inline ``select()`` vs ``app.repositories``.
+
+Both variants run through a real ``AsyncSession`` against in-memory SQLite (needs the
+``aiosqlite`` dev dependency), so the database work is a few microseconds and what is
+left is statement construction, cache-key generation, compilation and ORM loading.
+
+    python -m benchmarks.hot_queries --iterations 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from app.models import Card, Member, Message, Project
+from app.repositories import card_by_id, get_member_project, latest_messages, max_card_position
+
+SCHEMA = (
+    (
+        "CREATE TABLE users (id CHAR(32) PRIMARY KEY, email TEXT, password_hash TEXT, "
+        "display_name TEXT, created_at TIMESTAMP)"
+    ),
+    (
+        "CREATE TABLE projects (id CHAR(32) PRIMARY KEY, name TEXT, owner_id CHAR(32), "
+        "created_at TIMESTAMP)"
+    ),
+    (
+        "CREATE TABLE members (project_id CHAR(32), user_id CHAR(32), role TEXT, "
+        "PRIMARY KEY (project_id, user_id))"
+    ),
+    (
+        "CREATE TABLE cards (id CHAR(32) PRIMARY KEY, project_id CHAR(32), column_id CHAR(32), "
+        "title TEXT, description TEXT, labels JSON, assignees JSON, priority TEXT, due_date DATE, "
+        "position INTEGER, version INTEGER, created_at TIMESTAMP, updated_at TIMESTAMP, "
+        "archived_at TIMESTAMP)"
+    ),
+    (
+        "CREATE TABLE messages (id CHAR(32) PRIMARY KEY, project_id CHAR(32), user_id CHAR(32), "
+        "content TEXT, created_at TIMESTAMP)"
+    ),
+)
+CARDS = 200
+MESSAGES = 200
+
+
+async def seed(db: AsyncSession) -> dict[str, uuid.UUID]:
+    for statement in SCHEMA:
+        await db.execute(text(statement))
+    ids = {"user": uuid.uuid4(), "project": uuid.uuid4(), "column": uuid.uuid4()}
+    hex_ids = {key: value.hex for key, value in ids.items()}
+    now = datetime.now(UTC)
+    await db.execute(
+        text("INSERT INTO users VALUES (:user, 'a@example.com', 'x', 'Alice', :now)"),
+        {**hex_ids, "now": now},
+    )
+    await db.execute(
+        text("INSERT INTO projects VALUES (:project, 'P', :user, :now)"), {**hex_ids, "now": now}
+    )
+    await db.execute(text("INSERT INTO members VALUES (:project, :user, 'owner')"), hex_ids)
+    card_ids = [uuid.uuid4() for _ in range(CARDS)]
+    await db.execute(
+        text(
+            "INSERT INTO cards VALUES (:id, :project, :column, 'Card', NULL, '[]', '[]', NULL, "
+            "NULL, :pos, 1, :now, :now, NULL)"
+        ),
+        [
+            {**hex_ids, "id": card_id.hex, "pos": pos, "now": now}
+            for pos, card_id in enumerate(card_ids)
+        ],
+    )
+    await db.execute(
+        text("INSERT INTO messages VALUES (:id, :project, :user, 'hello', :at)"),
+        [
+            {**hex_ids, "id": uuid.uuid4().hex, "at": now - timedelta(seconds=i)}
+            for i in range(MESSAGES)
+        ],
+    )
+    await db.commit()
+    ids["card"] = card_ids[CARDS // 2]
+    return ids
+
+
+def inline_queries(
+    db: AsyncSession, ids: dict[str, uuid.UUID]
+) -> dict[str, Callable[[], Awaitable]]:
+    """The statements as the routes built them before the repository layer."""
+    return {
+        "card_by_id": lambda: db.scalar(select(Card).where(Card.id == ids["card"])),
+        "membership": lambda: db.scalar(
+            select(Project).where(
+                Project.id == ids["project"],
+                or_(
+                    Project.owner_id == ids["user"],
+                    Project.id.in_(select(Member.project_id).where(Member.user_id == ids["user"])),
+                ),
+            )
+        ),
+        "max_position": lambda: db.scalar(
+            select(func.max(Card.position)).where(Card.column_id == ids["column"])
+        ),
+        "latest_messages": lambda: db.execute(
+            select(Message)
+            .where(Message.project_id == ids["project"])
+            .options(selectinload(Message.author))
+            .order_by(Message.created_at.desc())
+            .limit(50)
+        ),
+    }
+
+
+def repository_queries(
+    db: AsyncSession, ids: dict[str, uuid.UUID]
+) -> dict[str, Callable[[], Awaitable]]:
+    return {
+        "card_by_id": lambda: card_by_id(db, ids["card"]),
+        "membership": lambda: get_member_project(db, ids["project"], ids["user"]),
+        "max_position": lambda: max_card_position(db, ids["column"]),
+        "latest_messages": lambda: latest_messages(db, ids["project"], 50),
+    }
+
+
+async def measure(query: Callable[[], Awaitable], db: AsyncSession, iterations: int) -> float:
+    for _ in range(50):
+        await query()
+    db.expunge_all()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await query()
+        db.expunge_all()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def run(iterations: int) -> dict:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        ids = await seed(db)
+        inline = inline_queries(db, ids)
+        repository = repository_queries(db, ids)
+        report = {}
+        for name in inline:
+            before = await measure(inline[name], db, iterations)
+            after = await measure(repository[name], db, iterations)
+            report[name] = {
+                "inline_us": round(before, 1),
+                "repository_us": round(after, 1),
+                "saved_pct": round((before - after) / before * 100, 1),
+            }
+    await engine.dispose()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--iterations", type=int, default=3000)
+    args = parser.parse_args()
+    report = asyncio.run(run(args.iterations))
+    print(json.dumps({"iterations": args.iterations, "queries": report}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""Response serialization cost per endpoint, before and after ``app.api.responses``.
+
+No database: each endpoint's data is synthesised in the shape the route gets it (ORM
+objects before, Core rows for the board, card lists and chat after). Three paths are timed:
+
+* ``legacy``  — ``jsonable_encoder`` + stdlib ``json.dumps`` of the returned value;
+* ``before``  — what the routes returned until now, run through FastAPI's own
+  ``response_model`` validation and serialization;
+* ``after``   — the body the route builds now.
+
+    python -m benchmarks.responses --cards 1000 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy.engine.result import result_tuple
+
+from app.api.responses import FastJSONResponse, ResponseAdapter, row_dicts
+from app.api.routes import board, cards, chat, files, projects
+from app.models import Card, Column, FileAsset, Message, Project, User
+from app.schemas.board import BoardSnapshot
+from app.schemas.card import CardPage, CardRead
+from app.schemas.chat import MessageRead
+from app.schemas.file import FilePage
+from app.schemas.project import ProjectPage
+from app.services.snapshot import CARD_SUMMARY_FIELDS, COLUMN_FIELDS
+from app.utils.fieldsets import CARD_FIELDS
+
+MESSAGE_FIELDS = ("id", "project_id", "user_id", "content", "created_at", "user_display_name")
+
+
+ROUTERS = (board.router, cards.router, chat.router, files.router, projects.router)
+
+
+def _route(name: str) -> APIRoute:
+    routes = (route for router in ROUTERS for route in router.routes)
+    return next(route for route in routes if isinstance(route, APIRoute) and route.name == name)
+
+
+def make_data(cards: int) -> dict[str, Any]:
+    now = datetime.now(UTC)
+    user = User(
+        id=uuid.uuid4(),
+        email="alice@example.com",
+        password_hash="x",
+        display_name="Alice",
+        created_at=now,
+    )
+    project = Project(id=uuid.uuid4(), name="Project", owner_id=user.id, created_at=now)
+    board_id = uuid.uuid4()
+    columns = [
+        Column(id=uuid.uuid4(), board_id=board_id, name=f"Column {i}", order=i) for i in range(5)
+    ]
+    card_objects = [
+        Card(
+            id=uuid.uuid4(),
+            project_id=project.id,
+            column_id=columns[i % len(columns)].id,
+            title=f"Card {i}",
+            description="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 2,
+            labels=["bug", "ui"],
+            assignees=["alice"],
+            priority="medium",
+            due_date=date(2025, 1, 1 + i % 28),
+            position=i,
+            version=1,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(cards)
+    ]
+    messages = [
+        Message(
+            id=uuid.uuid4(),
+            project_id=project.id,
+            user_id=user.id,
+            content=f"Message {i}",
+            created_at=now,
+            author=user,
+        )
+        for i in range(50)
+    ]
+    files = [
+        FileAsset(
+            id=uuid.uuid4(),
+            project_id=project.id,
+            user_id=user.id,
+            name=f"image-{i}.png",
+            blob_digest=f"{i:064x}",
+            path=f"/storage/{i:064x}",
+            mime="image/png",
+            size=1024 * i,
+            thumbnail_sizes=[128, 512],
+            created_at=now,
+        )
+        for i in range(50)
+    ]
+    projects = [
+        Project(id=uuid.uuid4(), name=f"Project {i}", owner_id=user.id, created_at=now)
+        for i in range(20)
+    ]
+
+    card_row = result_tuple(CARD_SUMMARY_FIELDS)
+    column_row = result_tuple(COLUMN_FIELDS)
+    message_row = result_tuple(MESSAGE_FIELDS)
+    return {
+        "board_id": board_id,
+        "columns": columns,
+        "cards": card_objects,
+        "messages": messages,
+        "files": files,
+        "projects": projects,
+        "column_rows": [
+            column_row([getattr(column, name) for name in COLUMN_FIELDS]) for column in columns
+        ],
+        "card_rows": [
+            card_row([getattr(card, name) for name in CARD_SUMMARY_FIELDS]) for card in card_objects
+        ],
+        "message_rows": [
+            message_row([m.id, m.project_id, m.user_id, m.content, m.created_at, user.display_name])
+            for m in messages
+        ],
+    }
+
+
+def scenarios(
+    data: dict[str, Any],
+) -> dict[str, tuple[str, Callable[[], Any], Callable[[], bytes]]]:
+    """endpoint -> (route name, value the route used to return, body the route builds now)."""
+    card_response = ResponseAdapter(CardRead)
+    file_page_response = ResponseAdapter(FilePage)
+    projects_response = ResponseAdapter(ProjectPage)
+    project_page = {"items": data["projects"], "next_cursor": None}
+    page = data["cards"][:100]
+    card_row = result_tuple(CARD_FIELDS)
+    card_rows = [card_row([getattr(card, name) for name in CARD_FIELDS]) for card in page]
+    return {
+        "get_board_snapshot": (
+            "get_board_snapshot",
+            lambda: BoardSnapshot(
+                board_id=data["board_id"], columns=data["columns"], cards=data["cards"]
+            ),
+            lambda: FastJSONResponse(
+                {
+                    "board_id": data["board_id"],
+                    "columns": row_dicts(data["column_rows"]),
+                    "cards": row_dicts(data["card_rows"]),
+                    "windows": None,
+                }
+            ).body,
+        ),
+        "get_messages": (
+            "get_messages",
+            lambda: [
+                MessageRead(
+                    id=m.id,
+                    project_id=m.project_id,
+                    user_id=m.user_id,
+                    content=m.content,
+                    created_at=m.created_at,
+                    user_display_name=m.author.display_name if m.author else None,
+                )
+                for m in data["messages"]
+            ],
+            lambda: FastJSONResponse(row_dicts(data["message_rows"])).body,
+        ),
+        "list_cards": (
+            "list_cards",
+            lambda: CardPage(items=page, next_cursor="cursor"),
+            lambda: FastJSONResponse({"items": row_dicts(card_rows), "next_cursor": "cursor"}).body,
+        ),
+        "get_card": ("get_card", lambda: page[0], lambda: card_response(page[0]).body),
+        "list_files": (
+            "list_files",
+            lambda: FilePage(items=data["files"], next_cursor=None, total_count=50, total_bytes=1),
+            lambda: file_page_response(
+                {"items": data["files"], "next_cursor": None, "total_count": 50, "total_bytes": 1}
+            ).body,
+        ),
+        "list_projects": (
+            "list_projects",
+            lambda: project_page,
+            lambda: projects_response(project_page).body,
+        ),
+    }
+
+
+def _complete(coroutine: Any) -> Any:
+    # serialize_response never awaits for async routes; finish it without an event loop.
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("serialize_response suspended")
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1_000_000
+
+
+def run(cards: int, repeat: int) -> dict[str, dict[str, float]]:
+    report = {}
+    for endpoint, (route_name, returned, after) in scenarios(make_data(cards)).items():
+        field = _route(route_name).response_field
+
+        # Bound as defaults: each closure must keep this endpoint's scenario.
+        def legacy(returned: Callable[[], Any] = returned) -> bytes:
+            return json.dumps(
+                jsonable_encoder(returned()), ensure_ascii=False, separators=(",", ":")
+            ).encode()
+
+        def before(returned: Callable[[], Any] = returned, field: Any = field) -> bytes:
+            content = _complete(
+                serialize_response(field=field, response_content=returned(), dump_json=True)
+            )
+            return Response(content=content, media_type="application/json").body
+
+        assert json.loads(before()) == json.loads(after()), endpoint
+        legacy_us, before_us, after_us = (timed(fn, repeat) for fn in (legacy, before, after))
+        report[endpoint] = {
+            "legacy_us": round(legacy_us, 1),
+            "before_us": round(before_us, 1),
+            "after_us": round(after_us, 1),
+            "speedup": round(before_us / after_us, 2),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--cards", type=int, default=1_000, help="Cards on the board snapshot")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    report = run(args.cards, args.repeat)
+    print(json.dumps({"cards": args.cards, "repeat": args.repeat, "endpoints": report}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
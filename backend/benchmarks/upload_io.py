@@ -0,0 +1,122 @@
+"""Measure event-loop lag while concurrent 10 MB uploads are written to disk.
+
+Every Socket.IO event on a worker is dispatched by the same event loop, so the loop lag
+observed here is the delay added to ``/ws`` events. ``inline`` replays the previous
+synchronous ``open``/``write`` handler body; ``threaded`` uses ``FileWriter``.
+
+    python -m benchmarks.upload_io --uploads 16 --fsync file --slow-disk-ms 5
+
+``--slow-disk-ms`` adds a blocking delay per MiB written (a saturated or network-backed
+volume); on a fast local page cache the difference between the modes is small.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from app.services import storage
+from app.services.storage import FileWriter
+
+CHUNK = b"x" * (1024 * 1024)
+TICK_SECONDS = 0.001
+# Chunks arrive at network pace rather than in a tight loop, as they do from the parser.
+CHUNK_INTERVAL_SECONDS = 0.002
+MIB = 1024 * 1024
+
+disk_delay_per_mib = 0.0
+
+
+def stall_disk(length: int) -> None:
+    if disk_delay_per_mib:
+        time.sleep(disk_delay_per_mib * length / MIB)
+
+
+def _slow_write_all(fd: int, data: bytearray, length: int, hasher=None) -> None:
+    stall_disk(length)
+    _write_all(fd, data, length, hasher)
+
+
+_write_all = storage._write_all
+storage._write_all = _slow_write_all
+
+
+async def monitor_lag(samples: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        samples.append((time.perf_counter() - started - TICK_SECONDS) * 1000)
+
+
+async def inline_upload(path: Path, chunks: int, fsync: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as buffer:
+        for _ in range(chunks):
+            await asyncio.sleep(CHUNK_INTERVAL_SECONDS)
+            buffer.write(CHUNK)
+            stall_disk(len(CHUNK))
+        if fsync != "none":
+            buffer.flush()
+            os.fsync(buffer.fileno())
+
+
+async def threaded_upload(path: Path, chunks: int, fsync: str) -> None:
+    async with FileWriter(path, fsync=fsync) as writer:
+        for _ in range(chunks):
+            await asyncio.sleep(CHUNK_INTERVAL_SECONDS)
+            await writer.write(CHUNK)
+
+
+async def run(mode: str, uploads: int, size_mib: int, fsync: str, root: Path) -> dict[str, float]:
+    upload = inline_upload if mode == "inline" else threaded_upload
+    samples: list[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_lag(samples, stop))
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(upload(root / mode / f"{i}.bin", size_mib, fsync) for i in range(uploads))
+    )
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+    samples.sort()
+    return {
+        "seconds": round(elapsed, 3),
+        "lag_p50_ms": round(statistics.median(samples), 3),
+        "lag_p99_ms": round(samples[int(len(samples) * 0.99) - 1], 3),
+        "lag_max_ms": round(samples[-1], 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--uploads", type=int, default=16)
+    parser.add_argument("--size-mib", type=int, default=10)
+    parser.add_argument("--fsync", choices=["none", "file", "directory"], default="file")
+    parser.add_argument(
+        "--slow-disk-ms", type=float, default=0.0, help="Blocking delay per MiB written"
+    )
+    parser.add_argument("--dir", type=Path, default=None, help="Directory on the disk under test")
+    args = parser.parse_args()
+
+    global disk_delay_per_mib
+    disk_delay_per_mib = args.slow_disk_ms / 1000
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        report = {
+            mode: asyncio.run(run(mode, args.uploads, args.size_mib, args.fsync, Path(tmp)))
+            for mode in ("inline", "threaded")
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
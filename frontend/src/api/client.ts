@@ -5,8 +5,10 @@ import type {
   Card,
   Column,
   FileAsset,
+  FilePage,
   Message,
   Project,
+  ProjectPage,
 } from "../types";
 
 const API_URL = import.meta.env.VITE_API_URL ?? "http://localhost:8000/api/v1";
@@ -90,7 +92,19 @@ export const api = {
     request<AuthResponse>("/auth/login", { method: "POST", body: payload, skipAuth: true }),
   getProject: (projectId: string) => request<Project>(`/projects/${projectId}`),
   getMe: () => request("/me"),
-  getProjects: () => request<Project[]>("/projects"),
+  getProjects: async () => {
+    // The sidebar lists every project, so follow the keyset pages to the end.
+    const projects: Project[] = [];
+    let cursor: string | null = null;
+    do {
+      const page: ProjectPage = await request<ProjectPage>(
+        `/projects?limit=200${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ""}`,
+      );
+      projects.push(...page.items);
+      cursor = page.next_cursor;
+    } while (cursor);
+    return projects;
+  },
   createProject: (payload: { name: string }) =>
     request<Project>("/projects", { method: "POST", body: payload }),
   getBoard: (projectId: string) => request<BoardSnapshot>(`/projects/${projectId}/board`),
@@ -120,14 +134,18 @@ export const api = {
     }),
   getMessages: (projectId: string) =>
     request<Message[]>(`/projects/${projectId}/messages?limit=50`),
+  markMessagesRead: (projectId: string) =>
+    request(`/projects/${projectId}/messages/read`, { method: "POST" }),
   sendMessage: (projectId: string, content: string) =>
     request<Message>(`/projects/${projectId}/messages`, {
       method: "POST",
       body: { project_id: projectId, content },
     }),
 
-  getFiles: (projectId: string) =>
-    request<FileAsset[]>(`/files?project_id=${projectId}`),
+  getFiles: (projectId: string, cursor?: string) =>
+    request<FilePage>(
+      `/files?project_id=${projectId}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ""}`,
+    ),
     
   downloadFile: (fileId: string) => downloadRequest(`/files/${fileId}`),
 
@@ -20,9 +20,9 @@ export const FilePanel = ({ projectId }: Props) => {
     const loadFiles = async () => {
       setListError(null);
       try {
-        const list = await api.getFiles(projectId);
+        const page = await api.getFiles(projectId);
         if (mounted) {
-          setFiles(list);
+          setFiles(page.items);
         }
       } catch (err) {
         setListError((err as Error).message);
@@ -50,7 +50,7 @@ export const FilePanel = ({ projectId }: Props) => {
     setError(null);
     try {
       const uploaded = await api.uploadFile(projectId, file);
-      setFiles((prev) => [...prev, uploaded]);
+      setFiles((prev) => [uploaded, ...prev]);
       form.reset(); // Используем сохраненную ссылку
     } catch (err) {
       setError((err as Error).message);
@@ -71,7 +71,7 @@ export const FilePanel = ({ projectId }: Props) => {
       
       // Извлекаем имя файла из пути (e.g., /app/storage/.../uuid_filename.txt -> uuid_filename.txt)
       const parts = file.path.split(/[\/\\]/);
-      a.download = parts[parts.length - 1];
+      a.download = file.name ?? parts[parts.length - 1];
       
       document.body.appendChild(a);
       a.click();
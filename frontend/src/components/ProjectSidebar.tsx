@@ -36,6 +36,9 @@ export const ProjectSidebar = ({ projects, selected, onSelect, onCreate }: Props
               onClick={() => onSelect(project.id)}
             >
               {project.name}
+              {project.unread_count > 0 && (
+                <span className="sidebar__badge">{project.unread_count}</span>
+              )}
             </button>
           </li>
         ))}
@@ -12,18 +12,20 @@ interface Options {
   projectId?: string;
   onMessage?: (message: Message) => void;
   onTyping?: (payload: TypingPayload) => void;
+  onBoardReset?: () => void;
 }
 
-export const useRealtime = ({ projectId, onMessage, onTyping }: Options): void => {
+export const useRealtime = ({ projectId, onMessage, onTyping, onBoardReset }: Options): void => {
   useEffect(() => {
     if (!projectId) return;
     const socket = getSocket();
     socket.emit("join_room", { projectId });
 
-    const { upsertCard, moveCard, deleteCard, removeColumn } = useBoardStore.getState();
+    const { upsertCard, patchCard, moveCard, deleteCard, removeColumn } = useBoardStore.getState();
 
     const handleCardCreated = (payload: Card) => upsertCard(payload);
-    const handleCardUpdated = (payload: Card) => upsertCard(payload);
+    // card.updated carries only the changed fields plus id/version/updated_at.
+    const handleCardUpdated = (payload: Partial<Card> & { id: UUID }) => patchCard(payload);
     const handleCardMoved = (payload: {
       id: string;
       toColumnId: string;
@@ -48,6 +50,8 @@ export const useRealtime = ({ projectId, onMessage, onTyping }: Options): void =
       onMessage?.(message);
     };
     const handleTyping = (payload: TypingPayload) => onTyping?.(payload);
+    // Sent once after a bulk import instead of one event per card.
+    const handleBoardReset = () => onBoardReset?.();
 
     const handleCardDeleted = (payload: { id: string }) => deleteCard(payload.id as UUID);
     const handleColumnDeleted = (payload: { id: string }) => removeColumn(payload.id as UUID);
@@ -59,6 +63,7 @@ export const useRealtime = ({ projectId, onMessage, onTyping }: Options): void =
     socket.on("column.deleted", handleColumnDeleted);
     socket.on("chat.message.created", handleMessageCreated);
     socket.on("chat.typing", handleTyping);
+    socket.on("board.reset", handleBoardReset);
 
     return () => {
       socket.emit("leave_room", { projectId });
@@ -69,6 +74,7 @@ export const useRealtime = ({ projectId, onMessage, onTyping }: Options): void =
       socket.off("column.deleted", handleColumnDeleted);
       socket.off("chat.message.created", handleMessageCreated);
       socket.off("chat.typing", handleTyping);
+      socket.off("board.reset", handleBoardReset);
     };
-  }, [projectId, onMessage, onTyping]);
+  }, [projectId, onMessage, onTyping, onBoardReset]);
 };
@@ -6,6 +6,7 @@ interface BoardState {
   cards: Card[];
   hydrate: (snapshot: BoardSnapshot) => void;
   upsertCard: (card: Card) => void;
+  patchCard: (patch: Partial<Card> & { id: UUID }) => void;
   moveCard: (payload: { id: UUID; toColumnId: UUID; position: number; version?: number }) => void;
   addColumn: (column: Column) => void;
   updateColumn: (column: Column) => void;
@@ -29,6 +30,10 @@ export const useBoardStore = create<BoardState>((set, get) => ({
       set({ cards: [...cards, card] });
     }
   },
+  patchCard: (patch) =>
+    set(({ cards }) => ({
+      cards: cards.map((card) => (card.id === patch.id ? { ...card, ...patch } : card)),
+    })),
   moveCard: ({ id, toColumnId, position, version }) => {
     set(({ cards }) => ({
       cards: cards.map((card) =>
@@ -18,6 +18,15 @@ export interface Project {
   name: string;
   owner_id: UUID;
   created_at: string;
+  card_count: number;
+  open_card_count: number;
+  member_count: number;
+  unread_count: number;
+}
+
+export interface ProjectPage {
+  items: Project[];
+  next_cursor: string | null;
 }
 
 export interface Column {
@@ -62,8 +71,19 @@ export interface FileAsset {
   id: UUID;
   project_id: UUID;
   user_id?: UUID | null;
+  name?: string | null;
+  blob_digest?: string | null;
   path: string;
   mime: string;
   size: number;
+  thumbnail_sizes?: number[];
+  thumbnails?: Record<string, string>;
   created_at: string;
 }
+
+export interface FilePage {
+  items: FileAsset[];
+  next_cursor: string | null;
+  total_count: number;
+  total_bytes: number;
+}
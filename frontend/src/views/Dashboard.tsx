@@ -1,5 +1,5 @@
 import { useCallback, useEffect, useMemo, useRef, useState } from "react";
-import { useQuery } from "@tanstack/react-query";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
 import { api } from "../api/client";
 import { BoardView } from "../components/BoardView";
 import { CardDetailsDrawer } from "../components/CardDetailsDrawer";
@@ -13,6 +13,8 @@ import { useBoardStore } from "../store/board";
 import { useAuthStore } from "../store/auth";
 import type { Card, Message, Project, UUID } from "../types";
 
+const MARK_READ_DELAY_MS = 1000;
+
 export const Dashboard = () => {
   const user = useAuthStore((state) => state.user);
   const clear = useAuthStore((state) => state.clear);
@@ -30,6 +32,7 @@ export const Dashboard = () => {
   const [cardLoading, setCardLoading] = useState(false);
   const [isChatOpen, setIsChatOpen] = useState(false);
   const deleteCardFromStore = useBoardStore((state) => state.deleteCard);
+  const queryClient = useQueryClient();
 
   const { data: projects = [], refetch: refetchProjects } = useQuery<Project[]>({
     queryKey: ["projects"],
@@ -58,6 +61,33 @@ export const Dashboard = () => {
     api.getMessages(selectedProject).then(setMessages);
   }, [selectedProject, hydrateBoard, clearBoard]);
 
+  // A burst of messages is marked read once, and only while the chat is open and the tab
+  // is visible; the unread badge is cleared in the cache instead of re-fetching projects.
+  useEffect(() => {
+    if (!selectedProject || !isChatOpen) return;
+    let timer: number | undefined;
+    const markRead = () =>
+      api.markMessagesRead(selectedProject).then(() =>
+        queryClient.setQueryData<Project[]>(["projects"], (current) =>
+          current?.map((project) =>
+            project.id === selectedProject ? { ...project, unread_count: 0 } : project,
+          ),
+        ),
+      );
+    const schedule = () => {
+      window.clearTimeout(timer);
+      if (document.visibilityState === "visible") {
+        timer = window.setTimeout(markRead, MARK_READ_DELAY_MS);
+      }
+    };
+    schedule();
+    document.addEventListener("visibilitychange", schedule);
+    return () => {
+      window.clearTimeout(timer);
+      document.removeEventListener("visibilitychange", schedule);
+    };
+  }, [selectedProject, isChatOpen, messages.length, queryClient]);
+
   const handleRealtimeMessage = useCallback((message: Message) => {
     setMessages((prev) => {
       if (prev.some((item) => item.id === message.id)) {
@@ -77,10 +107,20 @@ export const Dashboard = () => {
     [user?.id],
   );
 
+  const handleBoardReset = useCallback(() => {
+    if (!selectedProject) return;
+    api.getBoard(selectedProject).then((snapshot) => {
+      hydrateBoard(snapshot);
+      setBoardId(snapshot.board_id);
+    });
+    api.getMessages(selectedProject).then(setMessages);
+  }, [selectedProject, hydrateBoard]);
+
   useRealtime({
     projectId: selectedProject,
     onMessage: handleRealtimeMessage,
     onTyping: handleRealtimeTyping,
+    onBoardReset: handleBoardReset,
   });
 
   const handleSendMessage = async (text: string) => {